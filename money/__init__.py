@@ -2,8 +2,11 @@
 Python money class with optional CLDR-backed locale-aware formatting
 and an extensible currency exchange solution.
 """
-from .money import Money, XMoney
+from .money import Money, XMoney, IntMoney
 from .exchange import xrates
+from .array import MoneyArray
+from .accumulator import MoneyAccumulator
+from .multimoney import MultiMoney
 
 
 # RADAR: version
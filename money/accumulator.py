@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Running totals of money objects per currency
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+import operator
+
+from .array import MoneyArray
+from .currency import get_currency
+from .money import Money
+from .exceptions import InvalidOperandType
+
+
+__all__ = ['MoneyAccumulator']
+
+_ZERO = decimal.Decimal(0)
+
+
+class MoneyAccumulator(object):
+    """
+    Mutable running totals of money objects, one per currency.
+
+    Adding a money object updates the decimal total of its currency in
+    place, without creating intermediate money objects. Values in
+    different currencies are kept in separate totals instead of raising
+    ``CurrencyMismatch``. If a ``decimal.Context`` is given, additions use
+    it instead of the current context of the thread.
+    """
+    def __init__(self, values=(), context=None):
+        self._context = context
+        self._totals = {}
+        self._classes = {}
+        self.add_many(values)
+
+    def __repr__(self):
+        return "MoneyAccumulator({})".format(
+            ', '.join("{} {}".format(currency, total) for currency, total
+                      in sorted(self._totals.items())))
+
+    def __len__(self):
+        return len(self._totals)
+
+    @property
+    def context(self):
+        return self._context
+
+    @property
+    def currencies(self):
+        """Return the currencies with a total, sorted"""
+        return sorted(self._totals)
+
+    def _add(self):
+        if self._context is None:
+            return operator.add
+        return self._context.add
+
+    def add(self, value):
+        """Add a money object to the total of its currency"""
+        self.add_many((value,))
+
+    def add_many(self, values):
+        """Add many money objects (or a ``MoneyArray``) to the totals"""
+        if isinstance(values, MoneyArray):
+            if len(values):
+                self.add(values.sum())
+            return
+        totals = self._totals
+        add = self._add()
+        for value in values:
+            try:
+                currency = value._currency
+                amount = value._amount
+            except AttributeError:
+                raise InvalidOperandType(value, 'add')
+            try:
+                totals[currency] = add(totals[currency], amount)
+            except KeyError:
+                if not isinstance(value, Money):
+                    raise InvalidOperandType(value, 'add')
+                totals[currency] = add(amount, _ZERO)
+                self._classes[currency] = type(value)
+
+    def merge(self, other):
+        """Add the totals of another accumulator"""
+        if not isinstance(other, MoneyAccumulator):
+            raise InvalidOperandType(other, 'merge')
+        totals = self._totals
+        add = self._add()
+        for currency, total in other._totals.items():
+            try:
+                totals[currency] = add(totals[currency], total)
+            except KeyError:
+                totals[currency] = add(total, _ZERO)
+                self._classes[currency] = other._classes[currency]
+
+    def result(self, currency=None):
+        """
+        Return the totals as a dict of money objects by currency, or the
+        total of a currency if given (zero if nothing was added in it).
+
+        Totals are of the class of the first object added in their
+        currency.
+        """
+        if currency is not None:
+            currency = get_currency(currency)
+            cls = self._classes.get(currency, Money)
+            total = self._totals.get(currency)
+            if total is None:
+                return cls(0, currency)
+            return cls._from_trusted(total, currency)
+        classes = self._classes
+        return dict((currency, classes[currency]._from_trusted(total,
+                                                               currency))
+                    for currency, total in self._totals.items())
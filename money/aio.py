@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Asynchronous currency exchange (requires Python 3.5+)
+"""
+import asyncio
+import decimal
+
+from .currency import get_currency
+from .exchange import AsyncBackendBase, AtomicBackend, SimpleBackend, xrates
+from .exchange import _MISSING, _scale_array
+from .exceptions import ExchangeBackendNotInstalled, ExchangeRateNotFound
+
+
+__all__ = ['AsyncSimpleBackend']
+
+# Quotations being fetched, keyed by (loop, origin, target, backend, version)
+_inflight = {}
+
+
+def _landed(key, future):
+    """Forget a finished fetch, so that failures are retried next time"""
+    _inflight.pop(key, None)
+    if not future.cancelled():
+        # Mark the exception as retrieved if no request is left waiting
+        future.exception()
+
+
+async def quotation(xrates, origin, target):
+    """Coroutine returning quotation between two currencies (origin, target)"""
+    backend = xrates._current
+    if not backend:
+        raise ExchangeBackendNotInstalled()
+    reader = backend
+    if isinstance(backend, AtomicBackend):
+        # Read the version and the quotation from the same snapshot
+        reader = backend.snapshot()
+    key = (origin, target, backend, reader._version)
+    cache = xrates._cache
+    if cache is not None:
+        rate = cache.get(key, _MISSING)
+        if rate is not _MISSING:
+            return rate
+    if not backend._async:
+        rate = reader.quotation(origin, target)
+    else:
+        loop = asyncio.get_event_loop()
+        flight = (loop,) + key
+        future = _inflight.get(flight)
+        if future is None:
+            future = asyncio.ensure_future(backend.quotation(origin, target))
+            _inflight[flight] = future
+            future.add_done_callback(lambda future: _landed(flight, future))
+        # A cancelled request does not cancel the fetch shared with others
+        rate = await asyncio.shield(future)
+    if cache is not None:
+        cache.set(key, rate)
+    return rate
+
+
+async def _quotation(xrates, origin, target):
+    rate = await quotation(xrates, origin, target)
+    if rate is None:
+        raise ExchangeRateNotFound(xrates.backend_name, origin, target)
+    return rate
+
+
+async def to(value, currency):
+    """Coroutine returning a money object converted to another currency"""
+    currency = get_currency(currency)
+    if currency is value._currency:
+        return value
+    rate = await _quotation(xrates, value._currency, currency)
+    return value._from_trusted(value._amount * rate, currency)
+
+
+async def convert_many(xrates, values, target):
+    """
+    Coroutine returning a list of money objects converted to another
+    currency. The quotations of all source currencies are fetched
+    concurrently, once per currency.
+    """
+    from .array import MoneyArray
+    target = get_currency(target)
+    if isinstance(values, MoneyArray):
+        rate = decimal.Decimal(1)
+        if values.currency is not target:
+            rate = await _quotation(xrates, values.currency, target)
+        return _scale_array(values, rate, target)
+    values = list(values)
+    currencies = list({value._currency for value in values} - {target})
+    quotations = await asyncio.gather(
+        *[_quotation(xrates, currency, target) for currency in currencies])
+    rates = dict(zip(currencies, quotations))
+    rates[target] = None
+    result = []
+    append = result.append
+    for value in values:
+        rate = rates[value._currency]
+        if rate is None:
+            append(value)
+        else:
+            append(value._from_trusted(value._amount * rate, target))
+    return result
+
+
+class AsyncSimpleBackend(AsyncBackendBase):
+    """
+    Asynchronous backend with rates set by hand, as ``SimpleBackend``.
+
+    Each fetch waits ``delay`` seconds before answering and is counted in
+    ``fetches``, so that it can stand in for a remote rates service in
+    tests and benchmarks.
+    """
+    def __init__(self, delay=0):
+        self._rates = SimpleBackend()
+        self.delay = delay
+        self.fetches = 0
+
+    @property
+    def base(self):
+        return self._rates.base
+
+    @base.setter
+    def base(self, currency):
+        self._rates.base = currency
+        self.changed()
+
+    def setrate(self, currency, rate):
+        self._rates.setrate(currency, rate)
+        self.changed()
+
+    async def rate(self, currency):
+        self.fetches += 1
+        await asyncio.sleep(self.delay)
+        return self._rates.rate(currency)
+
+    async def quotation(self, origin, target):
+        self.fetches += 1
+        await asyncio.sleep(self.delay)
+        return self._rates.quotation(origin, target)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Exact allocation of amounts in integer minor units
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+import heapq
+
+# RADAR: Python2
+import money.six
+
+
+__all__ = ['allocate', 'split', 'allocate_many']
+
+
+def _weights(ratios):
+    """Return ratios as integer weights and their sum"""
+    ratios = list(ratios)
+    places = 0
+    for ratio in ratios:
+        if isinstance(ratio, decimal.Decimal):
+            if not ratio.is_finite():
+                raise ValueError("invalid ratio: '{}'".format(ratio))
+            places = max(places, -ratio.as_tuple().exponent)
+        elif (not isinstance(ratio, money.six.integer_types) or
+                isinstance(ratio, bool)):
+            raise TypeError("ratios must be integers or decimals, not "
+                            "'{}'".format(type(ratio)))
+    weights = [int(decimal.Decimal(ratio).scaleb(places)) for ratio in ratios]
+    if any(weight < 0 for weight in weights):
+        raise ValueError("ratios must not be negative")
+    total = sum(weights)
+    if not total:
+        raise ValueError("ratios must not all be zero")
+    return weights, total
+
+
+def _units(value):
+    """Return the amount of a money object as an integer of minor units"""
+    try:
+        units = value._amount.scaleb(value._currency.places)
+    except AttributeError:
+        raise TypeError("can only allocate money objects, not "
+                        "'{}'".format(type(value)))
+    integral = units.to_integral_value()
+    if units != integral:
+        raise ValueError("amount '{}' has more decimal places than the minor "
+                         "unit of '{}'".format(value._amount, value._currency))
+    return int(integral)
+
+
+def _distribute(units, weights, total):
+    """
+    Return integers proportional to weights adding up to units, giving the
+    leftover units to the largest remainders (the first ones on ties)
+    """
+    if units < 0:
+        return [-part for part in _distribute(-units, weights, total)]
+    parts = []
+    remainders = []
+    for weight in weights:
+        part, remainder = divmod(units * weight, total)
+        parts.append(part)
+        remainders.append(remainder)
+    leftover = units - sum(parts)
+    if leftover:
+        for i in heapq.nlargest(leftover, range(len(parts)),
+                                key=remainders.__getitem__):
+            parts[i] += 1
+    return parts
+
+
+def _money(value, parts):
+    """Return minor units as money objects of the class of value"""
+    currency = value._currency
+    exponent = -currency.places
+    new = value._from_trusted
+    return [new(decimal.Decimal(part).scaleb(exponent), currency)
+            for part in parts]
+
+
+def allocate(value, ratios):
+    """
+    Return a list of money objects proportional to ratios (integers or
+    decimals) that add up exactly to value, in minor units of its currency
+    """
+    weights, total = _weights(ratios)
+    return _money(value, _distribute(_units(value), weights, total))
+
+
+def split(value, n):
+    """
+    Return a list of n money objects as equal as possible that add up
+    exactly to value, the first ones larger by one minor unit if needed
+    """
+    if (not isinstance(n, money.six.integer_types) or
+            isinstance(n, bool) or n < 1):
+        raise ValueError("can only split in a positive integer number of "
+                         "parts, not '{}'".format(n))
+    units = _units(value)
+    part, leftover = divmod(abs(units), n)
+    parts = [part + 1] * leftover + [part] * (n - leftover)
+    if units < 0:
+        parts = [-part for part in parts]
+    return _money(value, parts)
+
+
+def allocate_many(values, ratios):
+    """
+    Return a list with the allocation of each money object in values to
+    the same ratios (see ``allocate()``), converting the ratios once
+    """
+    weights, total = _weights(ratios)
+    return [_money(value, _distribute(_units(value), weights, total))
+            for value in values]
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar money array with fixed-point integer storage
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import array
+import decimal
+import operator
+
+# RADAR: Python2
+import money.six
+
+from .currency import get_currency
+from .exchange import xrates
+from .money import Money
+from .exceptions import CurrencyMismatch, InvalidOperandType
+
+
+__all__ = ['MoneyArray']
+
+# Typecode of the underlying buffer (signed 64-bit integers)
+# RADAR: Python2 (the 'q' typecode is available in Python 3.3+; 'l' is
+# 64-bit on most Unix platforms, but only 32-bit on Windows)
+if 'q' in getattr(array, 'typecodes', ''):
+    TYPECODE = 'q'
+else:
+    TYPECODE = 'l'
+
+# Range of the integer units of the underlying buffer
+MAX_UNITS = 2 ** (8 * array.array(TYPECODE).itemsize - 1) - 1
+MIN_UNITS = -MAX_UNITS - 1
+
+
+def _places(value):
+    """Return the number of decimal places needed to hold a Decimal"""
+    exponent = value.as_tuple().exponent
+    if not isinstance(exponent, int):
+        raise ValueError("non-finite amount: '{}'".format(value))
+    return -exponent if exponent < 0 else 0
+
+
+def _array(units):
+    """Return a buffer of integer units, checking their range"""
+    try:
+        return array.array(TYPECODE, units)
+    except OverflowError:
+        # RADAR: Python2
+        money.six.raise_from(OverflowError("amount units out of range "
+            "[{}, {}]".format(MIN_UNITS, MAX_UNITS)), None)
+
+
+def _to_units(value, places):
+    """Return a Decimal as an integer number of 10**-places units"""
+    units = value.scaleb(places)
+    if units != units.to_integral_value():
+        raise ValueError("amount '{}' can not be represented with {} decimal "
+                         "places".format(value, places))
+    return int(units)
+
+
+class MoneyArray(object):
+    """
+    Array of amounts in a single currency.
+
+    Amounts are stored as signed 64-bit integers scaled by 10**places, so
+    bulk arithmetic, comparisons and aggregations run on plain integers
+    without creating intermediate Money or Decimal objects. Units out of
+    the range ``MIN_UNITS`` to ``MAX_UNITS`` raise OverflowError (only
+    32-bit integers are available on Python 2 on Windows).
+    """
+
+    def __init__(self, amounts=(), currency=None, places=None):
+        currency = get_currency(currency)
+        try:
+            amounts = [decimal.Decimal(amount) for amount in amounts]
+        except decimal.InvalidOperation:
+            # RADAR: Python2
+            money.six.raise_from(ValueError("amounts could not be "
+                "converted to Decimal()"), None)
+        if places is None:
+            # At least the minor unit of the currency, widened to the
+            # smallest exponent of the amounts in a single pass
+            places = currency.places
+            for amount in amounts:
+                needed = _places(amount)
+                if needed > places:
+                    places = needed
+        units = [_to_units(amount, places) for amount in amounts]
+        self._currency = currency
+        self._places = places
+        self._units = _array(units)
+
+    @classmethod
+    def _new(cls, units, currency, places):
+        """Return a new array without validation or conversion"""
+        obj = cls.__new__(cls)
+        obj._currency = currency
+        obj._places = places
+        if not isinstance(units, array.array):
+            units = _array(units)
+        obj._units = units
+        return obj
+
+    @classmethod
+    def from_money(cls, values, currency=None, places=None):
+        """Return an array from an iterable of money objects"""
+        amounts = []
+        for value in values:
+            if not isinstance(value, Money):
+                raise InvalidOperandType(value, 'from_money')
+            if currency is None:
+                currency = value.currency
+            elif value.currency != currency:
+                raise CurrencyMismatch(currency, value.currency,
+                                       'from_money')
+            amounts.append(value.amount)
+        return cls(amounts, currency, places)
+
+    @property
+    def currency(self):
+        return self._currency
+
+    @property
+    def places(self):
+        return self._places
+
+    def _amount(self, units):
+        return decimal.Decimal(units).scaleb(-self._places)
+
+    def _money(self, units):
+        return Money._from_trusted(self._amount(units), self._currency)
+
+    def _rescaled(self, places):
+        """Return the units scaled up to a greater number of places"""
+        if places == self._places:
+            return self._units
+        factor = 10 ** (places - self._places)
+        return _array([u * factor for u in self._units])
+
+    def _operand(self, other, operation):
+        """
+        Return (self units, other units, places) for a binary operation.
+
+        ``other`` units is a sequence for another array, or a single
+        integer to be broadcast for money and numbers.
+        """
+        if isinstance(other, MoneyArray):
+            if other.currency is not self._currency:
+                raise CurrencyMismatch(self._currency, other.currency,
+                                       operation)
+            if len(other) != len(self):
+                raise ValueError("operands could not be broadcast together "
+                                 "with lengths {} and {}".format(
+                                     len(self), len(other)))
+            places = max(self._places, other.places)
+            return (self._rescaled(places), other._rescaled(places), places)
+        if isinstance(other, Money):
+            if other.currency is not self._currency:
+                raise CurrencyMismatch(self._currency, other.currency,
+                                       operation)
+            other = other.amount
+        elif isinstance(other, float) or not isinstance(
+                other, money.six.integer_types + (decimal.Decimal,)):
+            raise TypeError("unsupported operand type(s) for {}: "
+                            "'MoneyArray' and '{}'".format(
+                                operation, type(other).__name__))
+        other = decimal.Decimal(other)
+        places = max(self._places, _places(other))
+        return (self._rescaled(places), _to_units(other, places), places)
+
+    def _binary(self, other, func, operation):
+        units, other, places = self._operand(other, operation)
+        if isinstance(other, array.array):
+            result = map(func, units, other)
+        else:
+            result = [func(u, other) for u in units]
+        return self._new(result, self._currency, places)
+
+    def _compare(self, other, func, operation):
+        if not isinstance(other, (Money, MoneyArray)):
+            raise InvalidOperandType(other, operation)
+        units, other, places = self._operand(other, operation)
+        if isinstance(other, array.array):
+            return list(map(func, units, other))
+        return [func(u, other) for u in units]
+
+    def __len__(self):
+        return len(self._units)
+
+    def __iter__(self):
+        for units in self._units:
+            yield self._money(units)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._new(self._units[key], self._currency, self._places)
+        if isinstance(key, money.six.integer_types):
+            return self._money(self._units[key])
+        key = list(key)
+        if key and all(isinstance(k, bool) for k in key):
+            if len(key) != len(self):
+                raise IndexError("boolean mask of length {} does not match "
+                                 "array of length {}".format(len(key),
+                                                             len(self)))
+            units = [u for u, keep in zip(self._units, key) if keep]
+        else:
+            units = [self._units[k] for k in key]
+        return self._new(units, self._currency, self._places)
+
+    def __repr__(self):
+        amounts = ', '.join(str(self._amount(u)) for u in self._units[:6])
+        if len(self) > 6:
+            amounts += ', ...'
+        return "MoneyArray({} [{}], length={})".format(
+            self._currency, amounts, len(self))
+
+    __hash__ = None
+
+    def __eq__(self, other):
+        if not isinstance(other, (Money, MoneyArray)):
+            return [False] * len(self)
+        if other.currency is not self._currency:
+            return [False] * len(self)
+        return self._compare(other, operator.eq, '==')
+
+    def __ne__(self, other):
+        return [not equal for equal in self.__eq__(other)]
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt, '<')
+
+    def __le__(self, other):
+        return self._compare(other, operator.le, '<=')
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt, '>')
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge, '>=')
+
+    def __add__(self, other):
+        return self._binary(other, operator.add, '+')
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        return self._binary(other, operator.sub, '-')
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        if isinstance(other, (Money, MoneyArray)):
+            raise TypeError("multiplication is unsupported between "
+                            "money arrays and money objects")
+        if isinstance(other, float) or not isinstance(
+                other, money.six.integer_types + (decimal.Decimal,)):
+            raise TypeError("unsupported operand type(s) for *: "
+                            "'MoneyArray' and '{}'".format(
+                                type(other).__name__))
+        # Widen the scale so that multiplication stays exact
+        other = decimal.Decimal(other)
+        places = _places(other)
+        factor = _to_units(other, places)
+        return self._new([u * factor for u in self._units], self._currency,
+                         self._places + places)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    # RADAR: Python2
+    def __div__(self, other):
+        return self.__truediv__(other)
+
+    def __truediv__(self, other):
+        """
+        Divide by a number, rounding each amount to the array's places
+        with the rounding mode of the current decimal context.
+        """
+        if isinstance(other, (Money, MoneyArray)):
+            raise TypeError("division is only supported between money "
+                            "arrays and numbers")
+        if isinstance(other, float) or not isinstance(
+                other, money.six.integer_types + (decimal.Decimal,)):
+            raise TypeError("unsupported operand type(s) for /: "
+                            "'MoneyArray' and '{}'".format(
+                                type(other).__name__))
+        if other == 0:
+            raise ZeroDivisionError()
+        other = decimal.Decimal(other)
+        quantum = decimal.Decimal(1)
+        units = [int((decimal.Decimal(u) / other).quantize(quantum))
+                 for u in self._units]
+        return self._new(units, self._currency, self._places)
+
+    def __neg__(self):
+        return self._new([-u for u in self._units], self._currency,
+                         self._places)
+
+    def __pos__(self):
+        return self._new(self._units[:], self._currency, self._places)
+
+    def __abs__(self):
+        return self._new([abs(u) for u in self._units], self._currency,
+                         self._places)
+
+    def sum(self):
+        """Return the total as a money object"""
+        return self._money(sum(self._units))
+
+    def cumsum(self):
+        """Return the cumulative sums as a new array"""
+        total = 0
+        result = []
+        append = result.append
+        for units in self._units:
+            total += units
+            append(total)
+        return self._new(result, self._currency, self._places)
+
+    def min(self):
+        """Return the smallest amount as a money object"""
+        if not self._units:
+            raise ValueError("min() of an empty MoneyArray")
+        return self._money(min(self._units))
+
+    def max(self):
+        """Return the greatest amount as a money object"""
+        if not self._units:
+            raise ValueError("max() of an empty MoneyArray")
+        return self._money(max(self._units))
+
+    def to(self, currency, places=None):
+        """
+        Return an equivalent array in another currency.
+        
+        See ``xrates.convert_array()``.
+        """
+        return xrates.convert_array(self, currency, places)
+
+    def tolist(self):
+        """Return a list of money objects"""
+        return list(self)
@@ -0,0 +1,9 @@
+"""
+Money benchmarks
+
+Run with:
+$ python -m money.bench
+$ python -m money.bench.memory
+$ python -m money.bench.imports
+
+"""
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+Run the timing benchmarks: python -m money.bench --help
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import sys
+
+from money.bench.timing import main
+
+
+sys.exit(main())
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Import time benchmark
+
+Measures, in fresh interpreters, the time to import money and the time of
+the first call to Money.format() (which imports Babel).
+"""
+# RADAR: Python2
+from __future__ import absolute_import, print_function
+
+import os
+import subprocess
+import sys
+
+import money
+
+
+# Run in a new interpreter: time a statement after a setup
+TEMPLATE = """
+import timeit
+{setup}
+start = timeit.default_timer()
+{statement}
+print(repr(timeit.default_timer() - start))
+"""
+
+STATEMENTS = [
+    ('import money', '', 'import money'),
+    ('first format()', 'import money',
+     "money.Money(1, 'EUR').format('en_US')"),
+]
+
+
+def import_time(statement, setup='', repeat=5):
+    """Return the best time in seconds of a statement in new interpreters"""
+    path = os.path.dirname(os.path.dirname(os.path.abspath(money.__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [path] + [p for p in [env.get('PYTHONPATH')] if p])
+    code = TEMPLATE.format(setup=setup, statement=statement)
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         env=env)
+        times.append(float(output.decode('ascii').strip()))
+    return min(times)
+
+
+def run(repeat=5):
+    """Return {statement name: seconds}"""
+    return dict((name, import_time(statement, setup, repeat))
+                for name, setup, statement in STATEMENTS)
+
+
+def main():
+    results = run()
+    for name, setup, statement in STATEMENTS:
+        print("{:<16} {:>8.1f} ms".format(name, results[name] * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Memory footprint benchmark for money objects
+
+Compares the memory allocated per money object against an equivalent
+class keeping a per-instance ``__dict__``.
+"""
+# RADAR: Python2
+from __future__ import absolute_import, print_function
+
+import decimal
+import gc
+import sys
+
+# RADAR: Python2
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from money import Money, XMoney
+
+
+DictMoney = type('DictMoney', (Money,), {})
+
+
+def instance_size(obj):
+    """Return the size in bytes of an object and its ``__dict__``"""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def allocated_per_object(cls, number=100000):
+    """Return the bytes allocated per money object for ``number`` objects"""
+    amounts = [decimal.Decimal(i) for i in range(number)]
+    if tracemalloc is None:
+        return instance_size(cls(amounts[0], 'EUR'))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [cls(amount, 'EUR') for amount in amounts]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # Do not count the list holding the objects
+    return float(after - before - sys.getsizeof(objects)) / number
+
+
+def run(number=100000):
+    """Return {name: (instance bytes, allocated bytes per object)}"""
+    results = {}
+    for cls in (Money, XMoney, DictMoney):
+        results[cls.__name__] = (instance_size(cls(1, 'EUR')),
+                                 allocated_per_object(cls, number))
+    return results
+
+
+def main():
+    results = run()
+    baseline = results['DictMoney'][1]
+    print("{:<10} {:>10} {:>12} {:>8}".format(
+        'class', 'instance', 'per object', 'saving'))
+    for name, (size, allocated) in sorted(results.items()):
+        print("{:<10} {:>9}B {:>11.1f}B {:>7.0%}".format(
+            name, size, allocated, 1 - allocated / baseline))
+
+
+if __name__ == '__main__':
+    main()
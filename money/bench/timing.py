@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Timing benchmarks for money operations
+
+Measures construction, arithmetic, comparisons, sums, rounding, allocation,
+conversions, parsing, encoding, formatting and import time, and compares
+the results with a saved baseline:
+
+$ python -m money.bench --json baseline.json
+$ python -m money.bench --compare baseline.json
+"""
+# RADAR: Python2
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import decimal
+import json
+import platform
+import sys
+import timeit
+
+import money
+from money import Money, XMoney, xrates
+from money.bench.imports import import_time
+from money.exchange import SimpleBackend
+from money.money import BABEL_AVAILABLE
+
+
+BENCHMARKS = []
+
+# Number of objects in the list benchmarks
+SIZE = 10000
+
+
+def benchmark(name, requires=True, timer=None):
+    """
+    Register a function returning the callable to time, or the arguments
+    of ``timer(*arguments, repeat=repeat)`` if given
+    """
+    def register(setup):
+        if requires:
+            BENCHMARKS.append((name, setup, timer))
+        return setup
+    return register
+
+
+def _backend():
+    backend = SimpleBackend()
+    backend.base = 'USD'
+    backend.setrate('EUR', decimal.Decimal('0.9'))
+    backend.setrate('GBP', decimal.Decimal('0.8'))
+    backend.setrate('JPY', decimal.Decimal('150'))
+    return backend
+
+
+@benchmark('init.str')
+def _():
+    return lambda: Money('19.99', 'EUR')
+
+
+@benchmark('init.int')
+def _():
+    return lambda: Money(20, 'EUR')
+
+
+@benchmark('init.float')
+def _():
+    return lambda: Money(19.99, 'EUR')
+
+
+@benchmark('init.decimal')
+def _():
+    amount = decimal.Decimal('19.99')
+    return lambda: Money(amount, 'EUR')
+
+
+@benchmark('arithmetic.add')
+def _():
+    a, b = Money('19.99', 'EUR'), Money('5.01', 'EUR')
+    return lambda: a + b
+
+
+@benchmark('arithmetic.sub')
+def _():
+    a, b = Money('19.99', 'EUR'), Money('5.01', 'EUR')
+    return lambda: a - b
+
+
+@benchmark('arithmetic.mul')
+def _():
+    a, factor = Money('19.99', 'EUR'), decimal.Decimal('1.21')
+    return lambda: a * factor
+
+
+@benchmark('compare.lt')
+def _():
+    a, b = Money('19.99', 'EUR'), Money('5.01', 'EUR')
+    return lambda: a < b
+
+
+@benchmark('compare.eq')
+def _():
+    a, b = Money('19.99', 'EUR'), Money('5.01', 'EUR')
+    return lambda: a == b
+
+
+@benchmark('sum.money')
+def _():
+    values = [Money(i, 'EUR') for i in range(SIZE)]
+    return lambda: sum(values)
+
+
+@benchmark('sum.accumulator')
+def _():
+    from money import MoneyAccumulator
+    currencies = ('USD', 'EUR', 'GBP', 'JPY')
+    values = [Money(i, currencies[i % 4]) for i in range(SIZE)]
+    return lambda: MoneyAccumulator(values).result()
+
+
+@benchmark('sum.xmoney_mixed')
+def _():
+    currencies = ('USD', 'EUR', 'GBP', 'JPY')
+    values = [XMoney(i, currencies[i % 4]) for i in range(SIZE)]
+    return lambda: sum(values, XMoney(0, 'USD'))
+
+
+@benchmark('sum.multimoney_mixed')
+def _():
+    from money import MultiMoney
+    currencies = ('USD', 'EUR', 'GBP', 'JPY')
+    values = [Money(i, currencies[i % 4]) for i in range(SIZE)]
+    return lambda: MultiMoney(values).to('USD')
+
+
+@benchmark('quantize.many')
+def _():
+    from money.rounding import quantize_many
+    currencies = ('USD', 'EUR', 'CHF', 'JPY')
+    values = [Money(decimal.Decimal(i) / 7, currencies[i % 4])
+              for i in range(SIZE)]
+    return lambda: quantize_many(values, cash=True)
+
+
+@benchmark('allocate.many')
+def _():
+    from money.allocation import allocate_many
+    values = [Money(i, 'EUR') for i in range(SIZE)]
+    return lambda: allocate_many(values, (1, 2, 3, 4))
+
+
+@benchmark('convert.to')
+def _():
+    value = Money('19.99', 'EUR')
+    return lambda: value.to('GBP')
+
+
+@benchmark('parse.loads')
+def _():
+    return lambda: Money.loads('EUR 19.99')
+
+
+@benchmark('codec.roundtrip')
+def _():
+    from money.codec import pack_many, unpack_many
+    values = [Money(i, 'EUR') for i in range(SIZE)]
+    return lambda: unpack_many(pack_many(values))
+
+
+@benchmark('format.locale', requires=BABEL_AVAILABLE)
+def _():
+    value = Money('1234.5', 'EUR')
+    return lambda: value.format('en_US')
+
+
+@benchmark('format.many', requires=BABEL_AVAILABLE)
+def _():
+    from money.formatting import format_many
+    currencies = ('USD', 'EUR', 'GBP', 'JPY')
+    values = [Money(i, currencies[i % 4]) for i in range(SIZE)]
+    return lambda: format_many(values, 'en_US')
+
+
+@benchmark('import.money', timer=import_time)
+def _():
+    return ('import money',)
+
+
+def measure(func, repeat=5):
+    """Return the best time in seconds of a call to func"""
+    timer = timeit.Timer(func)
+    # RADAR: Python2 (Timer.autorange() is available in Python 3.6+)
+    number = 1
+    while timer.timeit(number) < 0.2 and number < 10 ** 7:
+        number *= 10
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(pattern=None, repeat=5):
+    """Return {benchmark name: seconds per call}"""
+    results = {}
+    # Conversions use their own rates, whatever backend is installed
+    with xrates.using(_backend()):
+        for name, setup, timer in BENCHMARKS:
+            if pattern and pattern not in name:
+                continue
+            if timer is None:
+                results[name] = measure(setup(), repeat)
+            else:
+                results[name] = timer(*setup(), repeat=repeat)
+    return results
+
+
+def report(results):
+    """Return a JSON-serializable report of results"""
+    return {
+        'money': money.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'results': results,
+    }
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Return rows (name, baseline, current, ratio, regressed) for the
+    benchmarks in both results; regressed if slower by more than threshold
+    """
+    rows = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        ratio = results[name] / baseline[name]
+        rows.append((name, baseline[name], results[name], ratio,
+                     ratio > 1 + threshold))
+    return rows
+
+
+def _format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if seconds * scale >= 1:
+            return "{:.3g} {}".format(seconds * scale, unit)
+    return "{:.3g} ns".format(seconds * 1e9)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m money.bench',
+        description="Time money operations.")
+    parser.add_argument('-k', dest='pattern',
+                        help="only run benchmarks with this in their name")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="timing repetitions (default 5)")
+    parser.add_argument('--json', metavar='FILE',
+                        help="write the results as JSON ('-' for stdout)")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="compare with results saved with --json")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="relative slowdown reported as a regression "
+                             "(default 0.1)")
+    options = parser.parse_args(args)
+
+    results = run(options.pattern, options.repeat)
+    if options.json == '-':
+        json.dump(report(results), sys.stdout, indent=2, sort_keys=True)
+        print()
+    elif options.json:
+        with open(options.json, 'w') as fileobj:
+            json.dump(report(results), fileobj, indent=2, sort_keys=True)
+
+    if options.compare:
+        with open(options.compare) as fileobj:
+            baseline = json.load(fileobj)['results']
+        rows = compare(results, baseline, options.threshold)
+        print("{:<20} {:>10} {:>10} {:>8}".format(
+            'benchmark', 'baseline', 'current', 'ratio'))
+        for name, before, after, ratio, regressed in rows:
+            print("{:<20} {:>10} {:>10} {:>7.2f}x{}".format(
+                name, _format_time(before), _format_time(after), ratio,
+                ' (slower)' if regressed else ''))
+        return 1 if any(row[-1] for row in rows) else 0
+
+    if options.json != '-':
+        print("{:<20} {:>10}".format('benchmark', 'time'))
+        for name in sorted(results):
+            print("{:<20} {:>10}".format(name, _format_time(results[name])))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Least recently used cache with optional expiration
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import collections
+import threading
+import time
+
+
+__all__ = ['LRUCache', 'CacheInfo']
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# RADAR: Python2
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+class LRUCache(object):
+    """
+    Thread-safe mapping of a bounded size with least recently used eviction.
+
+    If ``ttl`` is given, entries expire ``ttl`` seconds after being set.
+    ``maxsize=None`` makes the cache unbounded.
+    """
+    def __init__(self, maxsize=128, ttl=None, timer=_monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if missing or expired"""
+        with self._lock:
+            try:
+                value, expires = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires is not None and self._timer() >= expires:
+                self.misses += 1
+                return default
+            # RADAR: Python2 (OrderedDict.move_to_end)
+            self._data[key] = value, expires
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Set the value for key, evicting the least recently used entry"""
+        expires = None
+        if self.ttl is not None:
+            expires = self._timer() + self.ttl
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value, expires
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def info(self):
+        """Return hits, misses, maxsize and current size"""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Compact binary encoding of money objects
+
+Each money object is packed as a fixed-width record of 12 bytes: the
+currency code (3 ASCII bytes), the exponent of the amount (signed byte)
+and its coefficient (signed 64-bit integer), little-endian. Many objects
+are packed into a contiguous buffer of records, which is read back
+through a ``memoryview`` without copying each record.
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+import struct
+
+from .currency import get_currency
+from .money import Money, _EXACT, _decimal_parts
+
+
+__all__ = ['RECORD', 'pack', 'unpack', 'pack_many', 'unpack_many']
+
+# currency, exponent, coefficient
+RECORD = struct.Struct('<3sbq')
+
+
+def _encode(value):
+    """Return the fields of the record of a money object"""
+    try:
+        amount = value._amount
+        code = value._currency.code
+    except AttributeError:
+        raise TypeError("can only pack money objects, not "
+                        "'{}'".format(type(value)))
+    if not amount.is_finite():
+        raise ValueError("can not pack non-finite amount: "
+                         "'{}'".format(amount))
+    coefficient, exponent = _decimal_parts(amount)
+    if not -2 ** 63 <= coefficient < 2 ** 63:
+        coefficient, exponent = _decimal_parts(amount.normalize(_EXACT))
+    if (not -2 ** 63 <= coefficient < 2 ** 63 or
+            not -128 <= exponent <= 127):
+        raise ValueError("amount out of range: '{}'".format(amount))
+    return code.encode('ascii'), exponent, coefficient
+
+
+def pack(value):
+    """Return a money object as a record of bytes"""
+    return RECORD.pack(*_encode(value))
+
+
+def unpack(buffer, offset=0, cls=Money):
+    """Return a money object of class cls from the record at offset"""
+    code, exponent, coefficient = RECORD.unpack_from(buffer, offset)
+    amount = decimal.Decimal(coefficient).scaleb(exponent, _EXACT)
+    return cls._from_trusted(amount, get_currency(code.decode('ascii')))
+
+
+def pack_many(values):
+    """Return many money objects as a contiguous buffer of records"""
+    pack = RECORD.pack
+    return b''.join([pack(*_encode(value)) for value in values])
+
+
+def unpack_many(buffer, cls=Money):
+    """
+    Return a list of money objects of class cls from a buffer of records
+    (bytes, bytearray, mmap or any object supporting the buffer protocol)
+    """
+    view = memoryview(buffer)
+    size = RECORD.size
+    if view.nbytes % size:
+        raise ValueError("buffer size {} is not a multiple of the record "
+                         "size {}".format(view.nbytes, size))
+    # RADAR: Python2 (Struct.iter_unpack is available in Python 3.4+)
+    if hasattr(RECORD, 'iter_unpack'):
+        records = RECORD.iter_unpack(view)
+    else:
+        unpack_from = RECORD.unpack_from
+        records = (unpack_from(view, offset)
+                   for offset in range(0, view.nbytes, size))
+    currencies = {}
+    new = cls._from_trusted
+    Decimal = decimal.Decimal
+    scaleb = _EXACT.scaleb
+    result = []
+    append = result.append
+    for code, exponent, coefficient in records:
+        try:
+            currency = currencies[code]
+        except KeyError:
+            currency = currencies[code] = get_currency(code.decode('ascii'))
+        append(new(scaleb(Decimal(coefficient), exponent), currency))
+    return result
@@ -28,6 +28,15 @@ class InvalidOperandType(MoneyException, TypeError):
         super(InvalidOperandType, self).__init__(msg)
 
 
+class ParseError(MoneyException, ValueError):
+    """A line of a money values stream could not be parsed"""
+    def __init__(self, lineno, line, reason):
+        self.lineno = lineno
+        self.line = line
+        msg = "line {}: failed to parse '{}': {}".format(lineno, line, reason)
+        super(ParseError, self).__init__(msg)
+
+
 class ExchangeError(MoneyException):
     """Generic exception related to exchange rates"""
     pass
@@ -6,19 +6,42 @@ Money exchange related classes and ``xrates`` API entry point.
 from __future__ import absolute_import
 
 import abc
+import bisect
+import contextlib
+import csv
+import datetime
 import decimal
+import heapq
 import importlib
+import operator
+import sys
+import threading
 
 # RADAR: Python2
 import money.six
 
-from .exceptions import ExchangeBackendNotInstalled
+from .cache import LRUCache
+from .currency import get_currency
+from .exceptions import ExchangeBackendNotInstalled, ExchangeRateNotFound
+
+# RADAR: Python2 (contextvars is available in Python 3.7+)
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
 
 
 # RADAR: Python2
 @money.six.add_metaclass(abc.ABCMeta)
 class BackendBase(object):
     """Abstract base class API for exchange backends"""
+    # Incremented by changed(), invalidates cached quotations
+    _version = 0
+    # True for backends whose rate() and quotation() are coroutines
+    _async = False
+    # True for backends accepting timestamps, see HistoricalBackend
+    _historical = False
+    
     @property
     @abc.abstractmethod
     def base(self):
@@ -39,11 +62,108 @@ class BackendBase(object):
             return b / a
         return None
 
+    def changed(self):
+        """Notify that rates have changed, invalidating cached quotations"""
+        self._version += 1
+
+
+# RADAR: Python2
+@money.six.add_metaclass(abc.ABCMeta)
+class AsyncBackendBase(object):
+    """
+    Abstract base class API for asynchronous exchange backends.
+    
+    ``rate()`` and ``quotation()`` are coroutines, for backends that fetch
+    rates from a remote service. Conversions with an asynchronous backend
+    are awaited with ``Money.ato()`` and ``xrates.aconvert_many()``.
+    """
+    _version = 0
+    _async = True
+    _historical = False
+    
+    @property
+    @abc.abstractmethod
+    def base(self):
+        """Return the base currency"""
+        return
+
+    @abc.abstractmethod
+    def rate(self, currency):
+        """Coroutine returning quotation between the base and a currency"""
+        return None
+
+    @abc.abstractmethod
+    def quotation(self, origin, target):
+        """Coroutine returning quotation between two currencies"""
+        return None
+
+    def changed(self):
+        """Notify that rates have changed, invalidating cached quotations"""
+        self._version += 1
+
+
+def _cross_rates(rates, matrix, stale):
+    """
+    Update in place the rows and columns of ``stale`` currency ids of a
+    dense matrix of quotations between currencies with base ``rates``.
+    """
+    for i in stale:
+        a = rates[i]
+        row = matrix[i]
+        for j, b in enumerate(rates):
+            if a and b:
+                row[j] = b / a
+                matrix[j][i] = a / b
+            else:
+                row[j] = matrix[j][i] = None
+
 
 class SimpleBackend(BackendBase):
+    """
+    Backend with rates set by hand against a single base currency.
+    
+    Quotations are read from a dense cross-rate matrix indexed by
+    currency. After rates change, the first reader rebuilds the rows and
+    columns of the changed currencies on a copy of the matrix, under a
+    lock, and publishes it with a single assignment, so that concurrent
+    readers always see a complete matrix.
+    
+    Quotations between currencies not set with ``setrate()`` (nor the
+    base) fall back to ``rate()``, for subclasses overriding it.
+    """
     def __init__(self):
         self._base = None
         self._rates = {}
+        self._lock = threading.RLock()
+        self._reset_matrix()
+
+    def _reset_matrix(self):
+        # (ids by currency, matrix of quotations), replaced as a whole
+        self._table = ({}, [])
+        self._stale = set(self._rates)
+        if self._base:
+            self._stale.add(self._base)
+
+    def _update_matrix(self):
+        """Return the table, rebuilding it if rates have changed"""
+        with self._lock:
+            stale, self._stale = self._stale, set()
+            if not stale:
+                return self._table
+            ids, matrix = self._table
+            ids = dict(ids)
+            matrix = [list(row) for row in matrix]
+            for currency in stale:
+                if currency not in ids:
+                    ids[currency] = len(ids)
+                    for row in matrix:
+                        row.append(None)
+                    matrix.append([None] * len(ids))
+            currencies = sorted(ids, key=ids.get)
+            rates = [self.rate(currency) for currency in currencies]
+            _cross_rates(rates, matrix, [ids[currency] for currency in stale])
+            self._table = (ids, matrix)
+            return self._table
 
     @property
     def base(self):
@@ -51,12 +171,18 @@ class SimpleBackend(BackendBase):
 
     @base.setter
     def base(self, currency):
-        self._base = currency
+        with self._lock:
+            self._base = currency
+            self._reset_matrix()
+            self.changed()
 
     def setrate(self, currency, rate):
         if not self.base:
             raise Warning("set the base first: xrates.base = currency")
-        self._rates[currency] = rate
+        with self._lock:
+            self._rates[currency] = rate
+            self._stale.add(currency)
+            self.changed()
 
     def rate(self, currency):
         if currency == self.base:
@@ -64,76 +190,789 @@ class SimpleBackend(BackendBase):
         return self._rates.get(currency, None)
 
     def quotation(self, origin, target):
-        return super(SimpleBackend, self).quotation(origin, target)
+        ids, matrix = self._update_matrix() if self._stale else self._table
+        try:
+            return matrix[ids[origin]][ids[target]]
+        except KeyError:
+            return super(SimpleBackend, self).quotation(origin, target)
+
+    def snapshot(self):
+        """Return a read-only copy of the current rates (RatesSnapshot)"""
+        with self._lock:
+            ids, matrix = self._update_matrix()
+            return RatesSnapshot(self._base, self._rates, ids, matrix,
+                                 self._version)
+
+
+class RatesSnapshot(BackendBase):
+    """
+    Immutable exchange rates, safe to share between threads.
+    
+    Returned by ``SimpleBackend.snapshot()``, it can also be installed as
+    a backend on its own. ``version`` identifies the rates it was taken
+    from.
+    """
+    def __init__(self, base, rates, ids=None, matrix=None, version=0):
+        rates = dict(rates)
+        if ids is None:
+            currencies = list(rates)
+            if base and base not in rates:
+                currencies.append(base)
+            ids = dict((c, i) for i, c in enumerate(currencies))
+            matrix = [[None] * len(ids) for i in ids]
+            rates_list = [None] * len(ids)
+            for currency, i in ids.items():
+                rates_list[i] = (decimal.Decimal(1) if currency == base
+                                 else rates[currency])
+            _cross_rates(rates_list, matrix, range(len(ids)))
+        self._base = base
+        self._rates = rates
+        self._ids = dict(ids)
+        self._matrix = tuple(tuple(row) for row in matrix)
+        self._version = version
+
+    @property
+    def base(self):
+        return self._base
+
+    @property
+    def version(self):
+        return self._version
+
+    def rate(self, currency):
+        if currency == self._base:
+            return decimal.Decimal(1)
+        return self._rates.get(currency, None)
+
+    def quotation(self, origin, target):
+        ids = self._ids
+        try:
+            return self._matrix[ids[origin]][ids[target]]
+        except KeyError:
+            return None
+
+    def changed(self):
+        raise TypeError("rates snapshots are read-only")
+
+
+class AtomicBackend(BackendBase):
+    """
+    Backend publishing immutable rate snapshots, for concurrent use.
+    
+    Readers never block: ``rate()`` and ``quotation()`` read the current
+    ``RatesSnapshot`` with a single attribute access. Writers build a new
+    snapshot under a lock and publish it by swapping the reference, so that
+    readers never see a mix of old and new rates. Use ``pinned()`` to read
+    from the same snapshot during a whole computation.
+    """
+    def __init__(self):
+        self._snapshot = RatesSnapshot(None, {})
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _current(self):
+        return getattr(self._local, 'snapshot', None) or self._snapshot
+
+    @property
+    def _version(self):
+        return self._current().version
+
+    @property
+    def base(self):
+        return self._current().base
+
+    @base.setter
+    def base(self, currency):
+        self.update(base=currency)
+
+    @property
+    def version(self):
+        """Return the version of the current snapshot"""
+        return self._current().version
+
+    def setrate(self, currency, rate):
+        if not self.base:
+            raise Warning("set the base first: xrates.base = currency")
+        self.update({currency: rate})
+
+    def update(self, rates=None, base=None, replace=False):
+        """
+        Publish a new snapshot with updated rates and/or base.
+        
+        ``rates`` (a dict) are added to the current ones, or replace them
+        if ``replace`` is True. Prefer a single update() over many calls to
+        setrate(), since each call builds a whole new snapshot.
+        """
+        with self._lock:
+            current = self._snapshot
+            new_rates = {} if replace else dict(current._rates)
+            new_rates.update(rates or {})
+            if base is None:
+                base = current.base
+            self._snapshot = RatesSnapshot(base, new_rates,
+                                           version=current.version + 1)
+
+    def changed(self):
+        # Versions come from the published snapshots
+        pass
+
+    def snapshot(self):
+        """Return the current snapshot (RatesSnapshot)"""
+        return self._current()
+
+    @contextlib.contextmanager
+    def pinned(self):
+        """
+        Pin the current snapshot for the calling thread.
+        
+        Within the context, all rates and quotations read through this
+        backend in the same thread come from the snapshot it yields, even
+        if new rates are published meanwhile.
+        """
+        previous = getattr(self._local, 'snapshot', None)
+        snapshot = previous or self._snapshot
+        self._local.snapshot = snapshot
+        try:
+            yield snapshot
+        finally:
+            self._local.snapshot = previous
+
+    def rate(self, currency):
+        return self._current().rate(currency)
+
+    def quotation(self, origin, target):
+        return self._current().quotation(origin, target)
+
+
+def _parse_timestamp(text):
+    """Return a datetime from an ISO 8601 'YYYY-MM-DD[ HH:MM:SS]' string"""
+    if len(text) == 10:
+        return datetime.datetime(int(text[:4]), int(text[5:7]),
+                                 int(text[8:10]))
+    return datetime.datetime.strptime(text.replace('T', ' '),
+                                      '%Y-%m-%d %H:%M:%S')
+
+
+def _is_sorted(values):
+    return all(a <= b for a, b in zip(values, values[1:]))
+
+
+class HistoricalBackend(BackendBase):
+    """
+    Backend with time series of rates against a single base currency.
+    
+    Each currency holds parallel lists of timestamps, in ascending order,
+    and rates. Rates are looked up as of a timestamp (the latest rate set
+    at or before it) by bisection. Timestamps can be any comparable values,
+    such as datetime objects or POSIX times, as long as they are consistent.
+    """
+    _historical = True
+
+    def __init__(self):
+        self._base = None
+        self._times = {}
+        self._rates = {}
+
+    @property
+    def base(self):
+        return self._base
+
+    @base.setter
+    def base(self, currency):
+        self._base = currency
+        self.changed()
+
+    def setrate(self, currency, rate, at):
+        """Set the rate of a currency from a timestamp on"""
+        if not self.base:
+            raise Warning("set the base first: xrates.base = currency")
+        times = self._times.setdefault(currency, [])
+        rates = self._rates.setdefault(currency, [])
+        i = bisect.bisect_left(times, at)
+        if i < len(times) and times[i] == at:
+            rates[i] = rate
+        else:
+            times.insert(i, at)
+            rates.insert(i, rate)
+        self.changed()
+
+    def load(self, points):
+        """
+        Add many rates from an iterable of (currency, timestamp, rate).
+        
+        Each series is sorted once after loading. Of several rates of a
+        currency at the same timestamp, the last one is kept.
+        """
+        if not self.base:
+            raise Warning("set the base first: xrates.base = currency")
+        series = {}
+        for currency, at, rate in points:
+            try:
+                series[currency].append((at, rate))
+            except KeyError:
+                series[currency] = [(at, rate)]
+        for currency, new in series.items():
+            old = zip(self._times.get(currency, ()),
+                      self._rates.get(currency, ()))
+            # Stable sort: later points follow earlier ones at equal times
+            points = sorted(list(old) + new, key=operator.itemgetter(0))
+            times = []
+            rates = []
+            for at, rate in points:
+                if times and times[-1] == at:
+                    rates[-1] = rate
+                else:
+                    times.append(at)
+                    rates.append(rate)
+            self._times[currency] = times
+            self._rates[currency] = rates
+        self.changed()
+
+    def load_csv(self, fileobj, parse=_parse_timestamp, header=True):
+        """
+        Add many rates from a CSV file with rows: currency, timestamp, rate.
+        
+        Timestamps are parsed with ``parse``, by default into datetime
+        objects from ISO 8601 dates ('2024-01-31') or dates and times
+        ('2024-01-31 17:30:00'). The first row is skipped if ``header``.
+        """
+        rows = csv.reader(fileobj)
+        if header:
+            next(rows, None)
+        timestamps = {}
+        Decimal = decimal.Decimal
+
+        def points():
+            for currency, at, rate in rows:
+                try:
+                    timestamp = timestamps[at]
+                except KeyError:
+                    timestamp = timestamps[at] = parse(at)
+                yield get_currency(currency), timestamp, Decimal(rate)
+
+        self.load(points())
+
+    def rate(self, currency, at=None):
+        """Return the rate of a currency as of a timestamp (or the latest)"""
+        if currency == self._base:
+            return decimal.Decimal(1)
+        rates = self._rates.get(currency)
+        if not rates:
+            return None
+        if at is None:
+            return rates[-1]
+        i = bisect.bisect_right(self._times[currency], at)
+        return rates[i - 1] if i else None
+
+    def rates(self, currency, timestamps):
+        """
+        Return the rates of a currency as of each of many timestamps.
+        
+        Sorted timestamps are looked up in a single forward pass over the
+        series of rates.
+        """
+        if currency == self._base:
+            return [decimal.Decimal(1)] * len(timestamps)
+        times = self._times.get(currency, ())
+        rates = self._rates.get(currency, ())
+        if not _is_sorted(timestamps):
+            return [self.rate(currency, at) for at in timestamps]
+        result = []
+        append = result.append
+        bisect_right = bisect.bisect_right
+        i = 0
+        for at in timestamps:
+            i = bisect_right(times, at, i)
+            append(rates[i - 1] if i else None)
+        return result
+
+    def quotation(self, origin, target, at=None):
+        a = self.rate(origin, at)
+        b = self.rate(target, at)
+        if a and b:
+            return b / a
+        return None
+
+    def quotations(self, origin, target, timestamps):
+        """Return quotations between two currencies as of many timestamps"""
+        timestamps = list(timestamps)
+        return [b / a if a and b else None for a, b in zip(
+            self.rates(origin, timestamps), self.rates(target, timestamps))]
+
+
+class GraphBackend(BackendBase):
+    """
+    Backend with rates quoted between pairs of currencies.
+    
+    Quotations between currencies without a direct rate are triangulated
+    along a path of quoted pairs: the one with the fewest hops, or the one
+    with the smallest total spread if ``strategy='spread'``. Paths and
+    quotations are cached: a rate change discards the quotations using it,
+    and a new pair (or spread, for the spread strategy) discards all.
+    """
+    STRATEGIES = ('hops', 'spread')
+
+    def __init__(self, strategy='hops'):
+        if strategy not in self.STRATEGIES:
+            raise ValueError("strategy must be one of {}".format(
+                ', '.join(self.STRATEGIES)))
+        self.strategy = strategy
+        self._base = None
+        # origin -> {target: (rate, spread)}
+        self._edges = {}
+        self._quoted = set()
+        self._paths = {}
+        self._quotations = {}
+        # (origin, target) pair -> cached quotations along it
+        self._dependents = {}
+
+    @property
+    def base(self):
+        return self._base
+
+    @base.setter
+    def base(self, currency):
+        self._base = currency
+        self.changed()
+
+    def setrate(self, origin, target, rate, spread=0):
+        """
+        Set the rate of a pair: 1 ``origin`` is worth ``rate`` ``target``.
+        
+        The inverse rate is implied unless quoted too. ``spread`` is the
+        relative bid/ask spread of the pair, for the spread strategy.
+        """
+        self._quoted.add((origin, target))
+        reroute = self._set_edge(origin, target, rate, spread)
+        if (target, origin) not in self._quoted:
+            inverse = decimal.Decimal(1) / rate
+            reroute = self._set_edge(target, origin, inverse,
+                                     spread) or reroute
+        if reroute:
+            self._paths.clear()
+            self._quotations.clear()
+            self._dependents.clear()
+        self.changed()
+
+    def _set_edge(self, origin, target, rate, spread):
+        """Set an edge, returning True if cached paths may have changed"""
+        edges = self._edges.setdefault(origin, {})
+        previous = edges.get(target)
+        edges[target] = (rate, spread)
+        if previous is None or (self.strategy == 'spread' and
+                                previous[1] != spread):
+            return True
+        for key in self._dependents.get((origin, target), ()):
+            self._quotations.pop(key, None)
+        return False
+
+    def _find_path(self, origin, target):
+        """Return the best path from origin to target, or None"""
+        edges = self._edges
+        if origin not in edges:
+            return None
+        if self.strategy == 'hops':
+            # Breadth-first search
+            parents = {origin: None}
+            frontier = [origin]
+            while frontier and target not in parents:
+                following = []
+                for node in frontier:
+                    for neighbour in edges.get(node, ()):
+                        if neighbour not in parents:
+                            parents[neighbour] = node
+                            following.append(neighbour)
+                frontier = following
+        else:
+            # Dijkstra on the sum of spreads, then on the number of hops
+            parents = {}
+            queue = [(0, 0, origin, None)]
+            while queue:
+                spread, hops, node, parent = heapq.heappop(queue)
+                if node in parents:
+                    continue
+                parents[node] = parent
+                if node == target:
+                    break
+                for neighbour, (_, cost) in edges.get(node, {}).items():
+                    if neighbour not in parents:
+                        heapq.heappush(queue, (spread + cost, hops + 1,
+                                               neighbour, node))
+        if target not in parents:
+            return None
+        path = [target]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        return tuple(reversed(path))
+
+    def path(self, origin, target):
+        """Return the currencies along the conversion path, or None"""
+        key = (origin, target)
+        try:
+            return self._paths[key]
+        except KeyError:
+            pass
+        path = self._paths[key] = self._find_path(origin, target)
+        if path:
+            for pair in zip(path, path[1:]):
+                self._dependents.setdefault(pair, set()).add(key)
+        return path
+
+    def rate(self, currency):
+        if not self._base:
+            return None
+        return self.quotation(self._base, currency)
+
+    def quotation(self, origin, target):
+        try:
+            return self._quotations[origin, target]
+        except KeyError:
+            pass
+        path = self.path(origin, target)
+        rate = None
+        if path:
+            edges = self._edges
+            rate = decimal.Decimal(1)
+            for a, b in zip(path, path[1:]):
+                rate *= edges[a][b][0]
+        self._quotations[origin, target] = rate
+        return rate
+
+
+_MISSING = object()
+
+
+class _ThreadLocalVar(object):
+    """Thread-local stand-in for contextvars.ContextVar(default=None)"""
+    def __init__(self):
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, 'value', None)
+
+    def set(self, value):
+        token = self.get()
+        self._local.value = value
+        return token
+
+    def reset(self, token):
+        self._local.value = token
+
+
+def _event_loop_running():
+    """Return whether an asyncio event loop is running in this thread"""
+    # Do not import asyncio just to find out that it is not in use
+    asyncio = sys.modules.get('asyncio')
+    # RADAR: Python2 (asyncio._get_running_loop is available in 3.5.3+)
+    get_running_loop = getattr(asyncio, '_get_running_loop', None)
+    return get_running_loop is not None and get_running_loop() is not None
+
+
+def _load_backend(backend):
+    """Return a backend instance from a python path, class or instance"""
+    # RADAR: Python2
+    if isinstance(backend, money.six.string_types):
+        path, name = backend.rsplit('.', 1)
+        module = importlib.import_module(path)
+        backend = getattr(module, name)()
+    elif isinstance(backend, type):
+        backend = backend()
+    if not isinstance(backend, (BackendBase, AsyncBackendBase)):
+        raise TypeError("backend '{}' is not a subclass of "
+                        "money.xrates.BackendBase".format(backend))
+    return backend
 
 
 class ExchangeRates(object):
     def __init__(self):
+        if contextvars is not None:
+            self._override = contextvars.ContextVar(
+                'xrates_backend_{}'.format(id(self)), default=None)
+        else:
+            self._override = _ThreadLocalVar()
         self._backend = None
+        self._cache = None
+    
+    @property
+    def _current(self):
+        """Return the backend in use in the current context"""
+        return self._override.get() or self._backend
     
     # RADAR: Python2
     def __nonzero__(self):
         return self.__bool__()
     
     def __bool__(self):
-        return bool(self._backend)
+        return bool(self._current)
 
     def install(self, backend='money.exchange.SimpleBackend'):
         """Install an exchange rates backend using a python path string"""
-        # RADAR: Python2
-        if isinstance(backend, money.six.string_types):
-            path, name = backend.rsplit('.', 1)
-            module = importlib.import_module(path)
-            backend = getattr(module, name)()
-        elif isinstance(backend, type):
-            backend = backend()
-        if not isinstance(backend, BackendBase):
-            raise TypeError("backend '{}' is not a subclass of "
-                            "money.xrates.BackendBase".format(backend))
-        self._backend = backend
+        self._backend = _load_backend(backend)
+        self.invalidate()
+
+    @contextlib.contextmanager
+    def using(self, backend):
+        """
+        Use another backend within a context.
+        
+        The backend (a python path, class or instance, as in ``install()``)
+        replaces the installed one for the current thread or asyncio task
+        only, including conversions in ``Money.to()`` and ``XMoney``
+        operators. Yield the backend instance.
+        
+        Before Python 3.7 (without ``contextvars``) the override is only
+        thread-local, and would be shared by all the tasks of an event
+        loop: RuntimeError is raised if an event loop is running.
+        """
+        if contextvars is None and _event_loop_running():
+            raise RuntimeError("xrates.using() is not isolated between "
+                               "asyncio tasks before Python 3.7")
+        backend = _load_backend(backend)
+        token = self._override.set(backend)
+        try:
+            yield backend
+        finally:
+            self._override.reset(token)
 
     def uninstall(self):
         """Uninstall any exchange rates backend"""
         self._backend = None
+        self.invalidate()
+
+    def enable_cache(self, maxsize=1024, ttl=None):
+        """
+        Cache quotations returned by the backend.
+        
+        Keep up to ``maxsize`` quotations (least recently used are evicted
+        first), each for up to ``ttl`` seconds if given. Cached quotations
+        are no longer used once the backend notifies a change (see
+        ``BackendBase.changed()``), and are discarded on ``install()``,
+        ``uninstall()`` and ``invalidate()``.
+        """
+        self._cache = LRUCache(maxsize, ttl)
+
+    def disable_cache(self):
+        """Stop caching quotations"""
+        self._cache = None
+
+    def invalidate(self):
+        """Discard all cached quotations"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def cache_info(self):
+        """Return quotation cache statistics, or None if disabled"""
+        if self._cache is None:
+            return None
+        return self._cache.info()
 
     @property
     def backend_name(self):
         """Return the class name of the currently installed backend or None"""
-        if not self._backend:
+        backend = self._current
+        if not backend:
             return None
-        return self._backend.__class__.__name__
+        return backend.__class__.__name__
 
     @property
     def base(self):
         """Return the base currency"""
-        if not self._backend:
+        backend = self._current
+        if not backend:
             raise ExchangeBackendNotInstalled()
-        return self._backend.base
+        return backend.base
 
-    def rate(self, currency):
-        """Return quotation between the base and another currency"""
-        if not self._backend:
+    def rate(self, currency, at=None):
+        """
+        Return quotation between the base and another currency, as of
+        timestamp ``at`` if given (see ``HistoricalBackend``)
+        """
+        backend = self._current
+        if not backend:
             raise ExchangeBackendNotInstalled()
-        return self._backend.rate(currency)
+        if backend._async:
+            raise _async_error(backend)
+        if at is not None:
+            return _historical(backend).rate(currency, at)
+        return backend.rate(currency)
 
-    def quotation(self, origin, target):
-        """Return quotation between two currencies (origin, target)"""
-        if not self._backend:
+    def quotation(self, origin, target, at=None):
+        """
+        Return quotation between two currencies (origin, target), as of
+        timestamp ``at`` if given (see ``HistoricalBackend``)
+        """
+        backend = self._override.get() or self._backend
+        if not backend:
+            raise ExchangeBackendNotInstalled()
+        if backend._async:
+            raise _async_error(backend)
+        if at is not None:
+            # Not cached: the series are searched in logarithmic time
+            return _historical(backend).quotation(origin, target, at)
+        cache = self._cache
+        if cache is None:
+            return backend.quotation(origin, target)
+        reader = backend
+        if isinstance(backend, AtomicBackend):
+            # Read the version and the quotation from the same snapshot
+            reader = backend.snapshot()
+        # Quotations cached before a change of rates are never hit again
+        key = (origin, target, backend, reader._version)
+        rate = cache.get(key, _MISSING)
+        if rate is _MISSING:
+            rate = reader.quotation(origin, target)
+            cache.set(key, rate)
+        return rate
+
+    def aquotation(self, origin, target):
+        """
+        Coroutine returning quotation between two currencies.
+        
+        Works with synchronous and asynchronous backends. Concurrent
+        requests of a quotation missing from the cache share a single
+        fetch from an asynchronous backend. Requires Python 3.5+.
+        """
+        # RADAR: Python2
+        from .aio import quotation
+        return quotation(self, origin, target)
+
+    def aconvert_many(self, values, target):
+        """
+        Coroutine returning a list of money objects converted to another
+        currency, as ``convert_many()``. Requires Python 3.5+.
+        """
+        # RADAR: Python2
+        from .aio import convert_many
+        return convert_many(self, values, target)
+
+    def convert_many(self, values, target, at=None):
+        """
+        Return a list of money objects converted to another currency.
+        
+        Each quotation is fetched once per source currency. Objects already
+        in the target currency are returned as is, as in ``Money.to()``. If
+        ``values`` is a ``MoneyArray``, return ``convert_array(values,
+        target)`` instead.
+        
+        If ``at`` is given, each value is converted as of the timestamp at
+        the same position in ``at`` (see ``HistoricalBackend``). Sorted
+        timestamps are looked up in a single pass over each series.
+        """
+        if at is not None:
+            return self._convert_many_at(values, target, at)
+        from .array import MoneyArray
+        if isinstance(values, MoneyArray):
+            return self.convert_array(values, target)
+        target = get_currency(target)
+        rates = {target: None}
+        result = []
+        append = result.append
+        for value in values:
+            currency = value._currency
+            try:
+                rate = rates[currency]
+            except KeyError:
+                rate = rates[currency] = self._quotation(currency, target)
+            if rate is None:
+                append(value)
+            else:
+                append(value._from_trusted(value._amount * rate, target))
+        return result
+
+    def _convert_many_at(self, values, target, at):
+        backend = self._current
+        if not backend:
             raise ExchangeBackendNotInstalled()
-        return self._backend.quotation(origin, target)
+        backend = _historical(backend)
+        target = get_currency(target)
+        values = list(values)
+        at = list(at)
+        if len(at) != len(values):
+            raise ValueError("got {} timestamps for {} values".format(
+                len(at), len(values)))
+        positions = {}
+        for i, value in enumerate(values):
+            if value._currency is not target:
+                positions.setdefault(value._currency, []).append(i)
+        result = list(values)
+        for currency, indexes in positions.items():
+            rates = backend.quotations(currency, target,
+                                       [at[i] for i in indexes])
+            for i, rate in zip(indexes, rates):
+                if rate is None:
+                    raise ExchangeRateNotFound(self.backend_name, currency,
+                                               target)
+                value = values[i]
+                result[i] = value._from_trusted(value._amount * rate, target)
+        return result
+
+    def convert_array(self, values, target, places=None):
+        """
+        Return a ``MoneyArray`` converted to another currency.
+        
+        The converted amounts are rounded to ``places`` decimal places (by
+        default, the minor unit of the target currency) using the rounding
+        mode of the current decimal context.
+        """
+        target = get_currency(target)
+        rate = decimal.Decimal(1)
+        if target is not values.currency:
+            rate = self._quotation(values.currency, target)
+        return _scale_array(values, rate, target, places)
+
+    def _quotation(self, origin, target):
+        """Return quotation, raising ExchangeRateNotFound if missing"""
+        rate = self.quotation(origin, target)
+        if rate is None:
+            raise ExchangeRateNotFound(self.backend_name, origin, target)
+        return rate
 
     def __getattr__(self, name):
-        if self._backend is None:
+        backend = self._current
+        if backend is None:
             raise ExchangeBackendNotInstalled()
-        return getattr(self._backend, name)
+        return getattr(backend, name)
 
     def __setattr__(self, name, value):
-        if name == '_backend':
+        if name in ('_backend', '_cache', '_override'):
             self.__dict__[name] = value
-        elif self._backend is None:
+            return
+        backend = self._current
+        if backend is None:
             raise ExchangeBackendNotInstalled()
-        else:
-            setattr(self._backend, name, value)
+        setattr(backend, name, value)
+
+
+def _historical(backend):
+    """Return backend, raising TypeError if it has no historical rates"""
+    if not backend._historical:
+        raise TypeError("backend '{}' has no historical rates".format(
+            backend.__class__.__name__))
+    return backend
+
+
+def _async_error(backend):
+    return TypeError("backend '{}' is asynchronous, use Money.ato() or "
+                     "xrates.aconvert_many()".format(
+                         backend.__class__.__name__))
+
+
+def _scale_array(values, rate, target, places=None):
+    """Return a ``MoneyArray`` multiplied by rate, in target currency"""
+    if places is None:
+        places = target.places
+    if target is values.currency and places == values.places:
+        return values
+    sign, digits, exponent = rate.as_tuple()
+    factor = int(''.join(map(str, digits))) * (-1 if sign else 1)
+    exponent += places - values.places
+    quantum = decimal.Decimal(1)
+    with decimal.localcontext() as context:
+        # Enough precision to round each product only once
+        context.prec = 64
+        units = [int(decimal.Decimal(u * factor).scaleb(exponent)
+                     .quantize(quantum)) for u in values._units]
+    return values._new(units, target, places)
 
 
 xrates = ExchangeRates()
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Cached locale-aware currency formatters (requires Babel)
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+import functools
+
+import babel
+import babel.numbers
+
+from .cache import LRUCache
+from .money import _load_babel
+
+
+__all__ = ['MoneyFormatter', 'get_formatter', 'format_many']
+
+# Formatters by (locale, pattern, currency_digits, format_type)
+_formatters = LRUCache(maxsize=256)
+
+
+class MoneyFormatter(object):
+    """
+    Locale-aware currency formatter, equivalent to
+    ``babel.numbers.format_currency()`` with the same arguments.
+
+    The locale and pattern are parsed once. For each currency, the locale
+    symbols, affixes and precision are resolved on first use, so that
+    formatting an amount only rounds it and joins strings. Patterns that
+    depend on the amount (scientific, significant digits, percentages or
+    currency names) are formatted by Babel.
+    """
+    def __init__(self, locale=None, pattern=None, currency_digits=True,
+                 format_type='standard'):
+        available, version, default_locale = _load_babel()
+        if version < (2, 2):
+            raise Exception('Babel {} is unsupported. '
+                'Please upgrade to 2.2 or higher.'.format(babel.__version__))
+        self.locale = babel.Locale.parse(locale or default_locale)
+        self.pattern = pattern
+        self.currency_digits = currency_digits
+        self.format_type = format_type
+        if format_type == 'name':
+            self._pattern = None
+        elif pattern:
+            self._pattern = babel.numbers.parse_pattern(pattern)
+        else:
+            try:
+                self._pattern = self.locale.currency_formats[format_type]
+            except KeyError:
+                raise babel.numbers.UnknownCurrencyFormatError(
+                    "{!r} is not a known currency format "
+                    "type".format(format_type))
+        self._renderers = {}
+
+    def __repr__(self):
+        return "MoneyFormatter({!r}, {!r}, {!r}, {!r})".format(
+            str(self.locale), self.pattern, self.currency_digits,
+            self.format_type)
+
+    def _compile(self, currency):
+        """Return the fast path parameters for a currency, or None"""
+        pattern = self._pattern
+        if pattern is None or pattern.exp_prec or '@' in pattern.pattern:
+            return None
+        if getattr(pattern, 'number_pattern', None) == '':
+            return None
+        affixes = pattern.prefix + pattern.suffix
+        if any(sign in affix for affix in affixes for sign in u'%‰'):
+            return None
+        if any(u'\xa4\xa4\xa4' in affix for affix in affixes):
+            return None
+        symbol = babel.numbers.get_currency_symbol(currency, self.locale)
+        affixes = [affix.replace(u'\xa4\xa4', currency.upper())
+                        .replace(u'\xa4', symbol) for affix in affixes]
+        group = babel.numbers.get_group_symbol(self.locale)
+        point = babel.numbers.get_decimal_symbol(self.locale)
+        # Babel unquotes the whole string: keep the rare quoted patterns
+        # and symbols on the slow path
+        if any(u"'" in text for text in affixes + [group, point]):
+            return None
+        if self.currency_digits:
+            precision = babel.numbers.get_currency_precision(currency)
+            frac_prec = (precision, precision)
+        else:
+            frac_prec = pattern.frac_prec
+        quantum = decimal.Decimal(10) ** -frac_prec[1]
+        return (affixes[:2], affixes[2:], quantum, frac_prec,
+                pattern.int_prec[0], pattern.grouping, group, point)
+
+    def _renderer(self, currency):
+        """Return a function formatting amounts in a currency"""
+        try:
+            return self._renderers[currency]
+        except KeyError:
+            pass
+        slow = functools.partial(
+            babel.numbers.format_currency, currency=currency,
+            format=self.pattern, locale=self.locale,
+            currency_digits=self.currency_digits,
+            format_type=self.format_type)
+        compiled = self._compile(currency)
+        if compiled is None:
+            renderer = slow
+        else:
+            renderer = functools.partial(_render, compiled, slow)
+        self._renderers[currency] = renderer
+        return renderer
+
+    def format(self, value):
+        """Return a money object as a locale-aware, formatted string"""
+        return self._renderer(value.currency)(value.amount)
+
+    def format_amount(self, amount, currency):
+        """Return an amount in a currency as a formatted string"""
+        return self._renderer(currency)(amount)
+
+    def format_many(self, values, fileobj=None):
+        """
+        Return a list of formatted strings for many money objects.
+
+        Values are grouped by currency, so that each currency is resolved
+        once. If ``fileobj`` is given, write the strings to it instead, one
+        per line, and return the number of values written.
+        """
+        from .array import MoneyArray
+        if isinstance(values, MoneyArray):
+            render = self._renderer(values.currency)
+            result = [render(values._amount(units))
+                      for units in values._units]
+        else:
+            values = list(values)
+            groups = {}
+            for i, value in enumerate(values):
+                try:
+                    groups[value.currency].append(i)
+                except KeyError:
+                    groups[value.currency] = [i]
+            result = [None] * len(values)
+            for currency, indexes in groups.items():
+                render = self._renderer(currency)
+                for i in indexes:
+                    result[i] = render(values[i].amount)
+        if fileobj is None:
+            return result
+        fileobj.writelines(line + u'\n' for line in result)
+        return len(result)
+
+
+def _render(compiled, slow, amount):
+    """Format an amount with the fast path parameters of a currency"""
+    if not amount.is_finite():
+        return slow(amount)
+    (prefix, suffix, quantum, (min_frac, max_frac), min_int,
+     (size, next_size), group, point) = compiled
+    negative = int(amount.is_signed())
+    digits = u'{:f}'.format(abs(amount).normalize().quantize(quantum))
+    integer, _, fraction = digits.partition(u'.')
+    # Integer part, padded and grouped as in NumberPattern._format_int
+    if len(integer) < min_int:
+        integer = u'0' * (min_int - len(integer)) + integer
+    if len(integer) > size:
+        groups = []
+        while len(integer) > size:
+            groups.append(integer[-size:])
+            integer = integer[:-size]
+            size = next_size
+        groups.append(integer)
+        integer = group.join(reversed(groups))
+    # Fractional part, as in NumberPattern._format_frac
+    fraction = fraction or u'0'
+    if len(fraction) < min_frac:
+        fraction += u'0' * (min_frac - len(fraction))
+    if max_frac == 0 or (min_frac == 0 and int(fraction) == 0):
+        fraction = u''
+    else:
+        fraction = point + fraction[:min_frac] + fraction[min_frac:].rstrip(
+            u'0')
+    return prefix[negative] + integer + fraction + suffix[negative]
+
+
+def get_formatter(locale=None, pattern=None, currency_digits=True,
+                  format_type='standard'):
+    """Return a cached formatter for these arguments (see MoneyFormatter)"""
+    key = (locale, pattern, currency_digits, format_type)
+    formatter = _formatters.get(key)
+    if formatter is None:
+        formatter = MoneyFormatter(locale, pattern, currency_digits,
+                                   format_type)
+        _formatters.set(key, formatter)
+    return formatter
+
+
+def format_many(values, locale=None, pattern=None, currency_digits=True,
+                format_type='standard', fileobj=None):
+    """
+    Return a list of formatted strings for many money objects, or write
+    them to ``fileobj``, one per line (see ``MoneyFormatter.format_many()``)
+    """
+    formatter = get_formatter(locale, pattern, currency_digits, format_type)
+    return formatter.format_many(values, fileobj)
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming parser and writer for text files of money values
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+
+# RADAR: Python2
+import money.six
+
+from .array import MAX_UNITS, MoneyArray
+from .currency import get_currency
+from .exceptions import ParseError
+from .money import Money
+
+
+__all__ = ['iter_loads', 'load_arrays', 'dump_many']
+
+# Approximate number of bytes read from the file object at once
+CHUNK_SIZE = 1 << 20
+
+
+def _maker(cls):
+    """
+    Return a function building ``cls`` objects from a Decimal and a
+    currency: ``cls._from_trusted`` unless the class overrides it (e.g.
+    IntMoney rounds there), so that invalid amounts are still rejected
+    """
+    trusted = getattr(cls._from_trusted, '__func__', None)
+    if trusted is Money._from_trusted.__func__:
+        return cls._from_trusted
+    return cls
+
+
+def _rows():
+    """
+    Return a function validating the rows of the columns of
+    ``load_arrays()``: amounts must be finite, and fit in the integer
+    units of their column at the largest number of places seen so far
+    (at least the minor unit of the currency, as in ``MoneyArray``)
+    """
+    scales = {}
+
+    def row(amount, currency):
+        if not amount.is_finite():
+            raise ValueError("non-finite amount: '{}'".format(amount))
+        places, largest = scales.get(currency, (currency.places, 0))
+        places = max(places, -amount.as_tuple().exponent)
+        largest = max(largest, abs(amount))
+        if largest.scaleb(places) > MAX_UNITS:
+            raise ValueError("amount '{}' out of range of the array of "
+                             "'{}'".format(amount, currency))
+        scales[currency] = places, largest
+        return amount, currency
+    return row
+
+
+def _parse_line(line, lineno, currencies, make, onerror):
+    """
+    Parse a line that failed the fast path of ``_iter_chunks()``.
+    
+    Return ``make(amount, currency)``, or None for blank lines and for
+    invalid lines reported to ``onerror``.
+    """
+    fields = line.split()
+    if not fields:
+        return None
+    if len(fields) != 2:
+        reason = "expected '<currency> <amount>'"
+    else:
+        code, amount = fields
+        try:
+            currency = currencies[code] = get_currency(code)
+            return make(decimal.Decimal(amount), currency)
+        except ValueError as err:
+            reason = str(err)
+        except decimal.InvalidOperation:
+            reason = ("amount value could not be converted to "
+                      "Decimal(): '{}'".format(amount))
+    error = ParseError(lineno, line.rstrip('\r\n'), reason)
+    if onerror is None:
+        # RADAR: Python2
+        money.six.raise_from(error, None)
+    onerror(error)
+    return None
+
+
+def _iter_chunks(fileobj, make, onerror, chunksize):
+    """
+    Yield lists of ``make(amount, currency)`` for each chunk of lines of a
+    file of repr-formatted money values.
+    """
+    Decimal = decimal.Decimal
+    currencies = {}
+    lineno = 0
+    while True:
+        lines = fileobj.readlines(chunksize)
+        if not lines:
+            break
+        parsed = []
+        append = parsed.append
+        for line in lines:
+            lineno += 1
+            try:
+                code, amount = line.split()
+                append(make(Decimal(amount), currencies[code]))
+            except (ValueError, KeyError, decimal.InvalidOperation):
+                try:
+                    value = _parse_line(line, lineno, currencies, make,
+                                        onerror)
+                except ParseError:
+                    # Deliver the values preceding the invalid line first
+                    yield parsed
+                    raise
+                if value is not None:
+                    append(value)
+        yield parsed
+
+
+def iter_loads(fileobj, cls=Money, onerror=None, chunksize=CHUNK_SIZE):
+    """
+    Parse a text file of money values, one repr per line (e.g. 'EUR 2.99').
+    
+    Return a generator of ``cls`` objects. The file is read in chunks of
+    about ``chunksize`` bytes and blank lines are skipped. Invalid lines
+    raise ``ParseError``, unless an ``onerror`` callable is given: it is
+    then called with the ``ParseError`` (which has ``lineno`` and ``line``
+    attributes) and parsing continues with the next line.
+    """
+    for values in _iter_chunks(fileobj, _maker(cls), onerror, chunksize):
+        for value in values:
+            yield value
+
+
+def load_arrays(fileobj, onerror=None, chunksize=CHUNK_SIZE):
+    """
+    Parse a text file of money values into columnar arrays.
+    
+    Return a dict of ``MoneyArray`` objects by currency, without creating
+    intermediate money objects. Errors are handled as in ``iter_loads()``,
+    including non-finite amounts and amounts out of the range of their
+    array.
+    """
+    columns = {}
+    for rows in _iter_chunks(fileobj, _rows(), onerror, chunksize):
+        for amount, currency in rows:
+            try:
+                columns[currency].append(amount)
+            except KeyError:
+                columns[currency] = [amount]
+    return dict((currency, MoneyArray(amounts, currency))
+                for currency, amounts in columns.items())
+
+
+def dump_many(values, fileobj, chunksize=CHUNK_SIZE):
+    """
+    Write money values to a text file, one repr per line.
+    
+    Lines are written in batches of about ``chunksize`` bytes. Return the
+    number of values written.
+    """
+    count = 0
+    batch = []
+    size = 0
+    for value in values:
+        line = "{} {}\n".format(value.currency, value.amount)
+        batch.append(line)
+        size += len(line)
+        count += 1
+        if size >= chunksize:
+            fileobj.writelines(batch)
+            batch = []
+            size = 0
+    if batch:
+        fileobj.writelines(batch)
+    return count
@@ -6,37 +6,98 @@ Money classes
 from __future__ import absolute_import
 
 import decimal
-import re
-from distutils.version import StrictVersion
+import sys
 
 # RADAR: Python2
 import money.six
 
+from .currency import get_currency, REGEX_CURRENCY_CODE
 from .exchange import xrates
+from .allocation import allocate, split
+from .rounding import _PREC, _quantizer
 from .exceptions import (CurrencyMismatch, ExchangeRateNotFound,
                          InvalidOperandType)
 
 
-__all__ = ['Money', 'XMoney']
+__all__ = ['Money', 'XMoney', 'IntMoney']
 
-BABEL_AVAILABLE = False
-BABEL_VERSION = None
-REGEX_CURRENCY_CODE = re.compile("^[A-Z]{3}$")
-LC_NUMERIC = None
+# Babel is imported on first use: (BABEL_AVAILABLE, BABEL_VERSION, LC_NUMERIC)
+_babel = None
+_get_formatter = None
 
-try:
-    import babel
-    import babel.numbers
-    BABEL_AVAILABLE = True
-    BABEL_VERSION = StrictVersion(babel.__version__)
-    LC_NUMERIC = babel.default_locale('LC_NUMERIC')
-except ImportError:
-    pass
+
+def _load_babel():
+    """Import Babel if available; return (available, version, locale)"""
+    global _babel
+    if _babel is None:
+        try:
+            import babel
+        except ImportError:
+            _babel = (False, None, None)
+        else:
+            version = tuple(int(part) for part in
+                            babel.__version__.split('.')[:3] if part.isdigit())
+            _babel = (True, version, babel.default_locale('LC_NUMERIC'))
+    return _babel
+
+
+def _load_formatting():
+    """Import the formatting module on first use of Money.format()"""
+    global _get_formatter
+    if not _load_babel()[0]:
+        raise NotImplementedError("formatting requires Babel "
+                                  "(https://pypi.python.org/pypi/Babel)")
+    from .formatting import get_formatter
+    _get_formatter = get_formatter
+    return get_formatter
+
+
+_BABEL_ATTRIBUTES = ('BABEL_AVAILABLE', 'BABEL_VERSION', 'LC_NUMERIC')
+
+
+def __getattr__(name):
+    # Module attributes computed on first access (Python 3.7+)
+    if name in _BABEL_ATTRIBUTES:
+        return _load_babel()[_BABEL_ATTRIBUTES.index(name)]
+    raise AttributeError("module '{}' has no attribute '{}'".format(
+        __name__, name))
+
+
+# RADAR: Python2 (module __getattr__ is available in Python 3.7+)
+if sys.version_info < (3, 7):
+    BABEL_AVAILABLE, BABEL_VERSION, LC_NUMERIC = _load_babel()
+
+
+# Types of the operands of arithmetic operators, besides money objects
+_NUMBERS = (decimal.Decimal,) + money.six.integer_types
+
+# Context rebuilding amounts exactly from their coefficient and exponent
+_EXACT = decimal.Context(prec=_PREC)
+
+
+def _decimal_parts(amount):
+    """Return (coefficient, exponent) of a finite Decimal as integers"""
+    exponent = amount.as_tuple().exponent
+    return int(amount.scaleb(-exponent, _EXACT)), exponent
+
+
+def _from_parts(cls, code, coefficient, exponent):
+    """
+    Return a money object from a currency code and the coefficient and
+    exponent of its amount, or its amount as a string if exponent is None
+    """
+    if exponent is None:
+        amount = decimal.Decimal(coefficient)
+    else:
+        amount = decimal.Decimal(coefficient).scaleb(exponent, _EXACT)
+    return cls._from_trusted(amount, get_currency(code))
 
 
 class Money(object):
     """Money class with a decimal amount and a currency"""
     
+    __slots__ = ('_amount', '_currency')
+    
     def __init__(self, amount="0", currency=None):
         try:
             self._amount = decimal.Decimal(amount)
@@ -44,12 +105,20 @@ class Money(object):
             # RADAR: Python2
             money.six.raise_from(ValueError("amount value could not be "
                 "converted to Decimal(): '{}'".format(amount)), None)
-        if currency in [None, False, '']:
-            raise ValueError("invalid currency value: '{}'".format(currency))
-        if not REGEX_CURRENCY_CODE.match(currency):
-            raise ValueError("currency not in ISO 4217 format: "
-                             "'{}'".format(currency))
-        self._currency = currency
+        self._currency = get_currency(currency)
+    
+    @classmethod
+    def _from_trusted(cls, amount, currency):
+        """
+        Return a new instance skipping conversion and validation.
+        
+        For internal use only: ``amount`` must be a decimal.Decimal and
+        ``currency`` an interned currency (see ``get_currency()``).
+        """
+        obj = object.__new__(cls)
+        obj._amount = amount
+        obj._currency = currency
+        return obj
     
     @property
     def amount(self):
@@ -73,28 +142,29 @@ class Money(object):
     
     # RADAR: Python2
     def __unicode__(self):
-        return u"{} {:,.2f}".format(self._currency, self._amount)
+        return u"{} {:,.{}f}".format(self._currency, self._amount,
+                                    self._currency.places)
     
     def __lt__(self, other):
         if not isinstance(other, Money):
             raise InvalidOperandType(other, '<')
-        elif other.currency != self._currency:
-            raise CurrencyMismatch(self._currency, other.currency, '<')
+        elif other._currency is not self._currency:
+            raise CurrencyMismatch(self._currency, other._currency, '<')
         else:
-            return self._amount < other.amount
+            return self._amount < other._amount
     
     def __le__(self, other):
         if not isinstance(other, Money):
             raise InvalidOperandType(other, '<=')
-        elif other.currency != self._currency:
-            raise CurrencyMismatch(self._currency, other.currency, '<=')
+        elif other._currency is not self._currency:
+            raise CurrencyMismatch(self._currency, other._currency, '<=')
         else:
-            return self._amount <= other.amount
+            return self._amount <= other._amount
     
     def __eq__(self, other):
         if isinstance(other, Money):
-            return ((self._amount == other.amount) and
-                    (self._currency == other.currency))
+            return ((self._amount == other._amount) and
+                    (self._currency is other._currency))
         return False
     
     def __ne__(self, other):
@@ -103,18 +173,18 @@ class Money(object):
     def __gt__(self, other):
         if not isinstance(other, Money):
             raise InvalidOperandType(other, '>')
-        elif other.currency != self._currency:
-            raise CurrencyMismatch(self._currency, other.currency, '>')
+        elif other._currency is not self._currency:
+            raise CurrencyMismatch(self._currency, other._currency, '>')
         else:
-            return self._amount > other.amount
+            return self._amount > other._amount
     
     def __ge__(self, other):
         if not isinstance(other, Money):
             raise InvalidOperandType(other, '>=')
-        elif other.currency != self._currency:
-            raise CurrencyMismatch(self._currency, other.currency, '>=')
+        elif other._currency is not self._currency:
+            raise CurrencyMismatch(self._currency, other._currency, '>=')
         else:
-            return self._amount >= other.amount
+            return self._amount >= other._amount
     
     # RADAR: Python2
     def __nonzero__(self):
@@ -131,22 +201,26 @@ class Money(object):
     
     def __add__(self, other):
         if isinstance(other, Money):
-            if other.currency != self._currency:
-                raise CurrencyMismatch(self._currency, other.currency, '+')
-            other = other.amount
+            if other._currency is not self._currency:
+                raise CurrencyMismatch(self._currency, other._currency, '+')
+            other = other._amount
+        elif not isinstance(other, _NUMBERS):
+            return NotImplemented
         amount = self._amount + other
-        return self.__class__(amount, self._currency)
+        return self._from_trusted(amount, self._currency)
     
     def __radd__(self, other):
         return self.__add__(other)
     
     def __sub__(self, other):
         if isinstance(other, Money):
-            if other.currency != self._currency:
-                raise CurrencyMismatch(self._currency, other.currency, '-')
-            other = other.amount
+            if other._currency is not self._currency:
+                raise CurrencyMismatch(self._currency, other._currency, '-')
+            other = other._amount
+        elif not isinstance(other, _NUMBERS):
+            return NotImplemented
         amount = self._amount - other
-        return self.__class__(amount, self._currency)
+        return self._from_trusted(amount, self._currency)
     
     def __rsub__(self, other):
         return (-self).__add__(other)
@@ -155,8 +229,10 @@ class Money(object):
         if isinstance(other, Money):
             raise TypeError("multiplication is unsupported between "
                             "two money objects")
+        elif not isinstance(other, _NUMBERS):
+            return NotImplemented
         amount = self._amount * other
-        return self.__class__(amount, self._currency)
+        return self._from_trusted(amount, self._currency)
     
     def __rmul__(self, other):
         return self.__mul__(other)
@@ -167,68 +243,78 @@ class Money(object):
     
     def __truediv__(self, other):
         if isinstance(other, Money):
-            if other.currency != self._currency:
-                raise CurrencyMismatch(self._currency, other.currency, '/')
-            elif other.amount == 0:
+            if other._currency is not self._currency:
+                raise CurrencyMismatch(self._currency, other._currency, '/')
+            elif other._amount == 0:
                 raise ZeroDivisionError()
-            return self._amount / other.amount
+            return self._amount / other._amount
+        elif not isinstance(other, _NUMBERS):
+            return NotImplemented
         else:
             if other == 0:
                 raise ZeroDivisionError()
             amount = self._amount / other
-            return self.__class__(amount, self._currency)
+            return self._from_trusted(amount, self._currency)
     
     def __floordiv__(self, other):
         if isinstance(other, Money):
-            if other.currency != self._currency:
-                raise CurrencyMismatch(self._currency, other.currency, '//')
-            elif other.amount == 0:
+            if other._currency is not self._currency:
+                raise CurrencyMismatch(self._currency, other._currency, '//')
+            elif other._amount == 0:
                 raise ZeroDivisionError()
-            return self._amount // other.amount
+            return self._amount // other._amount
+        elif not isinstance(other, _NUMBERS):
+            return NotImplemented
         else:
             if other == 0:
                 raise ZeroDivisionError()
             amount = self._amount // other
-            return self.__class__(amount, self._currency)
+            return self._from_trusted(amount, self._currency)
     
     def __mod__(self, other):
         if isinstance(other, Money):
             raise TypeError("modulo is unsupported between two '{}' "
                             "objects".format(self.__class__.__name__))
+        elif not isinstance(other, _NUMBERS):
+            return NotImplemented
         if other == 0:
             raise ZeroDivisionError()
         amount = self._amount % other
-        return self.__class__(amount, self._currency)
+        return self._from_trusted(amount, self._currency)
     
     def __divmod__(self, other):
         if isinstance(other, Money):
-            if other.currency != self._currency:
-                raise CurrencyMismatch(self._currency, other.currency, 'divmod')
-            elif other.amount == 0:
+            if other._currency is not self._currency:
+                raise CurrencyMismatch(self._currency, other._currency, 'divmod')
+            elif other._amount == 0:
                 raise ZeroDivisionError()
-            return divmod(self._amount, other.amount)
+            return divmod(self._amount, other._amount)
+        elif not isinstance(other, _NUMBERS):
+            return NotImplemented
         else:
             if other == 0:
                 raise ZeroDivisionError()
             whole, remainder = divmod(self._amount, other)
-            return (self.__class__(whole, self._currency),
-                    self.__class__(remainder, self._currency))
+            return (self._from_trusted(whole, self._currency),
+                    self._from_trusted(remainder, self._currency))
     
     def __pow__(self, other):
         if isinstance(other, Money):
             raise TypeError("power operator is unsupported between two '{}' "
                             "objects".format(self.__class__.__name__))
+        elif not isinstance(other, _NUMBERS):
+            return NotImplemented
         amount = self._amount ** other
-        return self.__class__(amount, self._currency)
+        return self._from_trusted(amount, self._currency)
     
     def __neg__(self):
-        return self.__class__(-self._amount, self._currency)
+        return self._from_trusted(-self._amount, self._currency)
     
     def __pos__(self):
-        return self.__class__(+self._amount, self._currency)
+        return self._from_trusted(+self._amount, self._currency)
     
     def __abs__(self):
-        return self.__class__(abs(self._amount), self._currency)
+        return self._from_trusted(abs(self._amount), self._currency)
         
     def __int__(self):
         return int(self._amount)
@@ -237,23 +323,89 @@ class Money(object):
         return float(self._amount)
     
     def __round__(self, ndigits=0):
-        return self.__class__(round(self._amount, ndigits), self._currency)
+        return self._from_trusted(round(self._amount, ndigits), self._currency)
+    
+    def quantize(self, rounding=None, cash=False):
+        """
+        Return money object rounded to the minor unit of the currency, or to
+        its smallest cash denomination if ``cash`` (e.g. CHF 0.05), with the
+        ``decimal`` rounding mode given or that of the current context
+        """
+        quantize = _quantizer(self._currency, rounding, cash)
+        return self._from_trusted(quantize(self._amount), self._currency)
+    
+    def allocate(self, ratios):
+        """
+        Return list of money objects proportional to ratios that add up
+        exactly to this one, distributing the minor units of the currency
+        left over by rounding to the largest remainders
+        """
+        return allocate(self, ratios)
+    
+    def split(self, n):
+        """
+        Return list of n money objects as equal as possible that add up
+        exactly to this one
+        """
+        return split(self, n)
+    
+    def __reduce__(self):
+        # Currency code, integer coefficient and exponent of the amount
+        amount = self._amount
+        if amount.is_finite() and (amount or not amount.is_signed()):
+            args = ((type(self), self._currency.code) +
+                    _decimal_parts(amount))
+        else:
+            args = (type(self), self._currency.code, str(amount), None)
+        state = getattr(self, '__dict__', None)
+        if state:
+            return _from_parts, args, state
+        return _from_parts, args
+    
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # Instance __dict__ of a subclass (see __reduce__)
+            if '_amount' not in state:
+                self.__dict__.update(state)
+                return
+            # Pickles created before __slots__ hold the instance __dict__
+            state = (state.pop('_amount'), state.pop('_currency'), state)
+        # Pickles created before __reduce__ hold (amount, currency[, dict])
+        self._amount = state[0]
+        self._currency = get_currency(state[1])
+        if len(state) > 2 and state[2]:
+            self.__dict__.update(state[2])
     
     def __composite_values__(self):
         return self._amount, self._currency
     
-    def to(self, currency):
-        """Return equivalent money object in another currency"""
-        if currency == self._currency:
+    def to(self, currency, at=None):
+        """
+        Return equivalent money object in another currency, at the rates
+        as of timestamp ``at`` if given (see ``HistoricalBackend``)
+        """
+        currency = get_currency(currency)
+        if currency is self._currency:
             return self
-        rate = xrates.quotation(self._currency, currency)
+        rate = xrates.quotation(self._currency, currency, at)
         if rate is None:
             raise ExchangeRateNotFound(xrates.backend_name,
                                          self._currency, currency)
         amount = self._amount * rate
-        return self.__class__(amount, currency)
+        return self._from_trusted(amount, currency)
     
-    def format(self, locale=LC_NUMERIC, pattern=None, currency_digits=True,
+    def ato(self, currency):
+        """
+        Coroutine returning equivalent money object in another currency.
+    
+        Works with synchronous and asynchronous exchange backends. Requires
+        Python 3.5+.
+        """
+        # RADAR: Python2
+        from .aio import to
+        return to(self, currency)
+    
+    def format(self, locale=None, pattern=None, currency_digits=True,
                format_type='standard'):
         """
         Return a locale-aware, currency-formatted string.
@@ -261,7 +413,7 @@ class Money(object):
         This method emulates babel.numbers.format_currency().
         
         A specific locale identifier (language[_territory]) can be passed,
-        otherwise the system's default locale will be used. A custom
+        otherwise the system's default locale (LC_NUMERIC) will be used. A custom
         formatting pattern of the form "¤#,##0.00;(¤#,##0.00)"
         (positive[;negative]) can also be passed, otherwise it will be
         determined from the locale and the CLDR (Unicode Common Locale Data
@@ -277,19 +429,16 @@ class Money(object):
         >>> m.format(pattern='#,##0.00 ¤¤¤') # Default locale, full name
         1,235.57 euro
         
+        Formatters are cached per combination of arguments, see
+        ``money.formatting.MoneyFormatter``.
+        
         Learn more about this formatting syntaxis at:
         http://www.unicode.org/reports/tr35/tr35-numbers.html
         """
-        if BABEL_AVAILABLE:
-            if BABEL_VERSION < StrictVersion('2.2'):
-                raise Exception('Babel {} is unsupported. '
-                    'Please upgrade to 2.2 or higher.'.format(BABEL_VERSION))
-            return babel.numbers.format_currency(
-                self._amount, self._currency, format=pattern, locale=locale,
-                currency_digits=currency_digits, format_type=format_type)
-        else:
-            raise NotImplementedError("formatting requires Babel "
-                                      "(https://pypi.python.org/pypi/Babel)")
+        get_formatter = _get_formatter or _load_formatting()
+        formatter = get_formatter(locale, pattern, currency_digits,
+                                  format_type)
+        return formatter.format_amount(self._amount, self._currency)
     
     @classmethod
     def loads(cls, s):
@@ -305,6 +454,9 @@ class Money(object):
 
 class XMoney(Money):
     """Money subclass with implicit currency conversion"""
+    
+    __slots__ = ()
+    
     def __add__(self, other):
         if isinstance(other, Money):
             other = other.to(self._currency)
@@ -337,6 +489,145 @@ class XMoney(Money):
         return super(XMoney, self).__divmod__(other)
 
 
+class IntMoney(Money):
+    """
+    Money subclass storing the amount as an integer of minor units
+    
+    The amount is kept as an integer number of minor units of the currency
+    (e.g. cents), so addition, subtraction, negation, absolute value and
+    comparisons between IntMoney objects run on plain integers. Any other
+    operation is computed with decimal.Decimal, and its result is rounded
+    to the minor unit using the rounding mode of the current decimal
+    context.
+    """
+    
+    __slots__ = ('_units',)
+    
+    def __init__(self, amount="0", currency=None):
+        try:
+            amount = decimal.Decimal(amount)
+        except decimal.InvalidOperation:
+            # RADAR: Python2
+            money.six.raise_from(ValueError("amount value could not be "
+                "converted to Decimal(): '{}'".format(amount)), None)
+        self._currency = get_currency(currency)
+        if not amount.is_finite():
+            raise ValueError("non-finite amount: '{}'".format(amount))
+        units = _EXACT.scaleb(amount, self._currency.places)
+        if units != units.to_integral_value():
+            raise ValueError("amount '{}' has more decimal places than the "
+                             "minor unit of '{}'".format(amount, currency))
+        self._units = int(units)
+    
+    @classmethod
+    def _from_trusted(cls, amount, currency):
+        if not amount.is_finite():
+            raise ValueError("non-finite amount: '{}'".format(amount))
+        units = _EXACT.scaleb(amount, currency.places).to_integral_value()
+        return cls._from_units(int(units), currency)
+    
+    @classmethod
+    def _from_units(cls, units, currency):
+        """Return a new instance from an integer of minor units (internal)"""
+        obj = object.__new__(cls)
+        obj._units = units
+        obj._currency = currency
+        return obj
+    
+    @property
+    def _amount(self):
+        return _EXACT.scaleb(decimal.Decimal(self._units),
+                             -self._currency.places)
+    
+    @property
+    def units(self):
+        """Return the amount as an integer of minor units"""
+        return self._units
+    
+    def __reduce__(self):
+        args = (type(self), self._currency.code, self._units,
+                -self._currency.places)
+        state = getattr(self, '__dict__', None)
+        if state:
+            return _from_parts, args, state
+        return _from_parts, args
+    
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            self.__dict__.update(state)
+            return
+        # Pickles created before __reduce__ hold (units, currency)
+        self._units = state[0]
+        self._currency = get_currency(state[1])
+    
+    def __eq__(self, other):
+        if isinstance(other, IntMoney):
+            return ((self._units == other._units) and
+                    (self._currency is other._currency))
+        return super(IntMoney, self).__eq__(other)
+    
+    def __hash__(self):
+        return super(IntMoney, self).__hash__()
+    
+    def __lt__(self, other):
+        if (isinstance(other, IntMoney) and
+                other._currency is self._currency):
+            return self._units < other._units
+        return super(IntMoney, self).__lt__(other)
+    
+    def __le__(self, other):
+        if (isinstance(other, IntMoney) and
+                other._currency is self._currency):
+            return self._units <= other._units
+        return super(IntMoney, self).__le__(other)
+    
+    def __gt__(self, other):
+        if (isinstance(other, IntMoney) and
+                other._currency is self._currency):
+            return self._units > other._units
+        return super(IntMoney, self).__gt__(other)
+    
+    def __ge__(self, other):
+        if (isinstance(other, IntMoney) and
+                other._currency is self._currency):
+            return self._units >= other._units
+        return super(IntMoney, self).__ge__(other)
+    
+    def __bool__(self):
+        return bool(self._units)
+    
+    def __add__(self, other):
+        if (isinstance(other, IntMoney) and
+                other._currency is self._currency):
+            return self._from_units(self._units + other._units,
+                                    self._currency)
+        if isinstance(other, money.six.integer_types):
+            return self._from_units(
+                self._units + other * 10 ** self._currency.places,
+                self._currency)
+        return super(IntMoney, self).__add__(other)
+    
+    def __sub__(self, other):
+        if (isinstance(other, IntMoney) and
+                other._currency is self._currency):
+            return self._from_units(self._units - other._units,
+                                    self._currency)
+        if isinstance(other, money.six.integer_types):
+            return self._from_units(
+                self._units - other * 10 ** self._currency.places,
+                self._currency)
+        return super(IntMoney, self).__sub__(other)
+    
+    def __neg__(self):
+        return self._from_units(-self._units, self._currency)
+    
+    def __pos__(self):
+        return self._from_units(self._units, self._currency)
+    
+    def __abs__(self):
+        return self._from_units(abs(self._units), self._currency)
+    
+
 
 
 
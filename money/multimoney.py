@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Money in several currencies, converted on demand
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+
+# RADAR: Python2
+import money.six
+
+from .accumulator import MoneyAccumulator
+from .currency import get_currency
+from .money import Money
+from .exceptions import CurrencyMismatch
+
+
+__all__ = ['MultiMoney']
+
+
+class MultiMoney(object):
+    """
+    Bag of amounts by currency.
+
+    Adding or subtracting money objects (or other bags) updates the amount
+    of their currency, without any conversion; multiplying by a number
+    scales every amount. Amounts are only converted by ``to()`` and
+    ``total()``, with one quotation per currency.
+    """
+
+    __slots__ = ('_amounts',)
+
+    def __init__(self, values=()):
+        self._amounts = MoneyAccumulator(values)._totals
+
+    @classmethod
+    def _from_amounts(cls, amounts):
+        obj = object.__new__(cls)
+        obj._amounts = amounts
+        return obj
+
+    def __repr__(self):
+        return "MultiMoney({})".format(', '.join(repr(value)
+                                                 for value in self))
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __len__(self):
+        return len(self._amounts)
+
+    def __iter__(self):
+        """Iterate over the amount of each currency, as money objects"""
+        amounts = self._amounts
+        for currency in sorted(amounts):
+            yield Money._from_trusted(amounts[currency], currency)
+
+    def __getitem__(self, currency):
+        """Return the amount in a currency (zero if there is none)"""
+        currency = get_currency(currency)
+        amount = self._amounts.get(currency)
+        if amount is None:
+            return Money(0, currency)
+        return Money._from_trusted(amount, currency)
+
+    @property
+    def currencies(self):
+        """Return the currencies with an amount, sorted"""
+        return sorted(self._amounts)
+
+    def _nonzero(self):
+        return dict((currency, amount) for currency, amount
+                    in self._amounts.items() if amount)
+
+    def __eq__(self, other):
+        if not isinstance(other, MultiMoney):
+            return False
+        return self._nonzero() == other._nonzero()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(frozenset(self._nonzero().items()))
+
+    # RADAR: Python2
+    def __nonzero__(self):
+        return self.__bool__()
+
+    def __bool__(self):
+        return any(self._amounts.values())
+
+    def _combine(self, other, sign):
+        amounts = dict(self._amounts)
+        if isinstance(other, Money):
+            other = ((other._currency, other._amount),)
+        elif isinstance(other, MultiMoney):
+            other = other._amounts.items()
+        else:
+            return NotImplemented
+        for currency, amount in other:
+            if sign < 0:
+                amount = -amount
+            try:
+                amounts[currency] += amount
+            except KeyError:
+                amounts[currency] = +amount
+        return self._from_amounts(amounts)
+
+    def __add__(self, other):
+        # Support sum(), which starts with 0
+        if (isinstance(other, money.six.integer_types) and
+                not isinstance(other, bool) and other == 0):
+            return self
+        return self._combine(other, 1)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        return self._combine(other, -1)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        if isinstance(other, (Money, MultiMoney)):
+            raise TypeError("multiplication is unsupported between "
+                            "two money objects")
+        return self._from_amounts(dict(
+            (currency, amount * other)
+            for currency, amount in self._amounts.items()))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __neg__(self):
+        return self._from_amounts(dict(
+            (currency, -amount) for currency, amount in self._amounts.items()))
+
+    def __pos__(self):
+        return self._from_amounts(dict(
+            (currency, +amount) for currency, amount in self._amounts.items()))
+
+    def to(self, currency, at=None):
+        """
+        Return the sum of the amounts converted to a currency, at the rates
+        as of timestamp ``at`` if given (see ``Money.to()``)
+        """
+        currency = get_currency(currency)
+        total = decimal.Decimal(0)
+        amounts = self._amounts
+        for origin in sorted(amounts):
+            total += Money._from_trusted(amounts[origin], origin).to(
+                currency, at)._amount
+        return Money._from_trusted(total, currency)
+
+    def total(self, currency=None, at=None):
+        """
+        Return the sum of the amounts in a currency, converting them if
+        needed (see ``to()``). If no currency is given, all the amounts
+        must be in a single one.
+        """
+        if currency is not None:
+            return self.to(currency, at)
+        currencies = self.currencies
+        if not currencies:
+            raise ValueError("total() of no amounts requires a currency")
+        if len(currencies) > 1:
+            raise CurrencyMismatch(currencies[0], currencies[1], '+')
+        return self[currencies[0]]
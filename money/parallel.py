@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel aggregation and conversion of money objects in process pools
+(requires Python 3.4+)
+
+Values are split in chunks, which are shipped to the workers packed with
+``money.codec`` (values that can not be packed are pickled instead).
+Values can also be given already packed, as a buffer from
+``money.codec.pack_many()``, so that the calling process only slices it.
+
+Totals are added with an exact decimal context, so that they do not
+depend on how values are split among workers. Conversions use the
+quotations of the exchange backend of the calling process, fetched once
+per currency and shipped along with each chunk.
+"""
+import concurrent.futures
+import contextlib
+import decimal
+import itertools
+import struct
+
+from .accumulator import MoneyAccumulator
+from .codec import RECORD, pack_many, unpack_many
+from .currency import get_currency
+from .exceptions import CurrencyMismatch
+from .exchange import xrates
+from .money import Money, _EXACT
+
+
+__all__ = ['psum', 'pgroupby_currency_sum', 'pconvert']
+
+# Number of values per chunk
+CHUNKSIZE = 65536
+
+# Currency code of a codec record
+_CODE = struct.Struct('<3s{}x'.format(RECORD.size - 3))
+
+
+def _buffer(values):
+    """Return a memoryview of values if they are a codec buffer, or None"""
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    if view.nbytes % RECORD.size:
+        raise ValueError("buffer size {} is not a multiple of the record "
+                         "size {}".format(view.nbytes, RECORD.size))
+    return view.cast('B') if view.format != 'B' else view
+
+
+def _chunks(values, chunksize):
+    """Yield chunks of values: packed bytes, or lists if they can not be"""
+    view = _buffer(values)
+    if view is not None:
+        step = chunksize * RECORD.size
+        for start in range(0, view.nbytes, step):
+            yield view[start:start + step].tobytes()
+        return
+    iterator = iter(values)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        try:
+            yield pack_many(chunk)
+        except ValueError:
+            yield chunk
+
+
+def _codes(chunk):
+    """Return the currencies of the values in a chunk"""
+    if isinstance(chunk, bytes):
+        return {get_currency(code.decode('ascii'))
+                for code, in _CODE.iter_unpack(chunk)}
+    return {value._currency for value in chunk}
+
+
+def _load(chunk, cls):
+    if isinstance(chunk, bytes):
+        return unpack_many(chunk, cls)
+    return chunk
+
+
+@contextlib.contextmanager
+def _executor(executor, max_workers):
+    if executor is not None:
+        yield executor
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            yield executor
+
+
+def _sum_chunk(chunk):
+    """Return the exact totals of a chunk by currency code"""
+    if not isinstance(chunk, bytes):
+        accumulator = MoneyAccumulator(chunk, context=_EXACT)
+        return {currency.code: total
+                for currency, total in accumulator.result().items()}
+    # Add the integer coefficients of the records by currency and exponent
+    sums = {}
+    for code, exponent, coefficient in RECORD.iter_unpack(chunk):
+        key = code, exponent
+        try:
+            sums[key] += coefficient
+        except KeyError:
+            sums[key] = coefficient
+    accumulator = MoneyAccumulator(context=_EXACT)
+    accumulator.add_many(
+        Money._from_trusted(decimal.Decimal(coefficient).scaleb(exponent,
+                                                                _EXACT),
+                            get_currency(code.decode('ascii')))
+        for (code, exponent), coefficient in sorted(sums.items()))
+    return {currency.code: total
+            for currency, total in accumulator.result().items()}
+
+
+def _convert_chunk(args):
+    chunk, cls, target, rates, context = args
+    target = get_currency(target)
+    multiply = context.multiply
+    result = []
+    append = result.append
+    for value in _load(chunk, cls):
+        rate = rates[value._currency.code]
+        if rate is None:
+            append(value)
+        else:
+            append(value._from_trusted(multiply(value._amount, rate), target))
+    return result
+
+
+def _totals(values, max_workers, chunksize, executor):
+    """Return an accumulator with the exact totals of values"""
+    accumulator = MoneyAccumulator(context=_EXACT)
+    with _executor(executor, max_workers) as executor:
+        for totals in executor.map(_sum_chunk, _chunks(values, chunksize)):
+            accumulator.add_many(totals[code] for code in sorted(totals))
+    return accumulator
+
+
+def pgroupby_currency_sum(values, max_workers=None, chunksize=CHUNKSIZE,
+                          executor=None, cls=Money):
+    """
+    Return a dict of the exact totals of values by currency, as objects
+    of class cls, in the order of the currency codes.
+
+    ``values`` is an iterable of money objects or a buffer of records from
+    ``money.codec.pack_many()``. Chunks of ``chunksize`` values are added in
+    a new ``ProcessPoolExecutor(max_workers)``, or in ``executor`` if given.
+    """
+    accumulator = _totals(values, max_workers, chunksize, executor)
+    totals = accumulator.result()
+    return {currency: cls._from_trusted(totals[currency]._amount, currency)
+            for currency in accumulator.currencies}
+
+
+def psum(values, currency=None, max_workers=None, chunksize=CHUNKSIZE,
+         executor=None, cls=Money):
+    """
+    Return the exact total of values as an object of class cls (see
+    ``pgroupby_currency_sum()``).
+
+    Values must be in a single currency, unless ``currency`` is given: the
+    total of each currency is then converted to it, with one quotation
+    per currency. ``currency`` is required if there may be no values.
+    """
+    totals = pgroupby_currency_sum(values, max_workers, chunksize, executor,
+                                   cls)
+    if currency is None:
+        if not totals:
+            raise ValueError("psum() of no values requires a currency")
+        currencies = sorted(totals)
+        if len(currencies) > 1:
+            raise CurrencyMismatch(currencies[0], currencies[1], '+')
+        return totals[currencies[0]]
+    currency = get_currency(currency)
+    amount = decimal.Decimal(0)
+    for code in sorted(totals):
+        amount += totals[code].to(currency)._amount
+    return cls._from_trusted(amount, currency)
+
+
+def pconvert(values, currency, max_workers=None, chunksize=CHUNKSIZE,
+             executor=None, cls=Money):
+    """
+    Return a list of values converted to another currency, as
+    ``xrates.convert_many()`` (see ``pgroupby_currency_sum()``).
+
+    Quotations are fetched in the calling process, and products are
+    rounded with its current decimal context. Values packed in a buffer
+    are unpacked as objects of class cls.
+    """
+    target = get_currency(currency)
+    context = decimal.getcontext().copy()
+    rates = {target: None}
+
+    def tasks():
+        for chunk in _chunks(values, chunksize):
+            needed = {}
+            for origin in _codes(chunk):
+                if origin not in rates:
+                    rates[origin] = xrates._quotation(origin, target)
+                needed[origin.code] = rates[origin]
+            yield chunk, cls, target.code, needed, context
+
+    result = []
+    with _executor(executor, max_workers) as executor:
+        for converted in executor.map(_convert_chunk, tasks()):
+            result.extend(converted)
+    return result
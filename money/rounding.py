@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Rounding of amounts to the minor unit or cash increment of their currency
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+
+from .currency import get_currency
+from .exceptions import InvalidOperandType
+
+
+__all__ = ['CASH_INCREMENTS', 'get_quantizer', 'quantize_many']
+
+# Smallest cash denominations that differ from the minor unit (from CLDR)
+CASH_INCREMENTS = {
+    'AMD': decimal.Decimal('1'),
+    'CAD': decimal.Decimal('0.05'),
+    'CHF': decimal.Decimal('0.05'),
+    'COP': decimal.Decimal('1'),
+    'CRC': decimal.Decimal('1'),
+    'CZK': decimal.Decimal('1'),
+    'DKK': decimal.Decimal('0.50'),
+    'GYD': decimal.Decimal('1'),
+    'HUF': decimal.Decimal('1'),
+    'IDR': decimal.Decimal('1'),
+    'MNT': decimal.Decimal('1'),
+    'MUR': decimal.Decimal('1'),
+    'NOK': decimal.Decimal('1'),
+    'PKR': decimal.Decimal('1'),
+    'SEK': decimal.Decimal('1'),
+    'TWD': decimal.Decimal('1'),
+    'TZS': decimal.Decimal('1'),
+    'UZS': decimal.Decimal('1'),
+}
+
+_ONE = decimal.Decimal(1)
+
+# RADAR: Python2 (decimal.MAX_PREC is available in Python 3.3+)
+_PREC = getattr(decimal, 'MAX_PREC', 999999999)
+
+# Contexts by rounding mode, and quantizers by (currency, rounding, cash)
+_contexts = {}
+_quantizers = {}
+
+
+def _context(rounding):
+    """Return a cached context rounding exactly to the quantum"""
+    try:
+        return _contexts[rounding]
+    except KeyError:
+        # Precision never limits the result, only the quantum does
+        context = decimal.Context(prec=_PREC, rounding=rounding)
+        return _contexts.setdefault(rounding, context)
+
+
+def _compile(currency, rounding, cash):
+    """Return a function rounding a decimal amount in a currency"""
+    context = _context(rounding)
+    quantize = context.quantize
+    increment = CASH_INCREMENTS.get(currency.code) if cash else None
+    if increment is None:
+        quantum = _ONE.scaleb(-currency.places)
+    elif increment.as_tuple().digits == (1,):
+        quantum = increment
+    else:
+        # Round the number of increments, e.g. 0.05: amount * 20 to 1 / 20
+        multiply = context.multiply
+        inverse = _ONE / increment
+        return lambda amount: multiply(quantize(multiply(amount, inverse),
+                                                _ONE), increment)
+    return lambda amount: quantize(amount, quantum)
+
+
+def _quantizer(currency, rounding, cash):
+    """Return the cached quantizer of an interned currency (internal)"""
+    if rounding is None:
+        rounding = decimal.getcontext().rounding
+    key = (currency, rounding, cash)
+    try:
+        return _quantizers[key]
+    except KeyError:
+        return _quantizers.setdefault(key, _compile(currency, rounding, cash))
+
+
+def get_quantizer(currency, rounding=None, cash=False):
+    """
+    Return a function rounding decimal amounts to the minor unit of a
+    currency, or to its smallest cash denomination if ``cash`` (see
+    ``CASH_INCREMENTS``).
+
+    ``rounding`` is a ``decimal`` rounding mode, by default the one of the
+    current decimal context.
+    """
+    return _quantizer(get_currency(currency), rounding, cash)
+
+
+def quantize_many(values, rounding=None, cash=False):
+    """
+    Return a list of money objects rounded to the minor unit of their
+    currency, or to its cash increment if ``cash`` (see ``Money.quantize()``)
+    """
+    if rounding is None:
+        rounding = decimal.getcontext().rounding
+    quantizers = {}
+    result = []
+    append = result.append
+    for value in values:
+        try:
+            currency = value._currency
+            amount = value._amount
+        except AttributeError:
+            raise InvalidOperandType(value, 'quantize')
+        try:
+            quantize = quantizers[currency]
+        except KeyError:
+            quantize = quantizers[currency] = _quantizer(currency, rounding,
+                                                         cash)
+        append(value._from_trusted(quantize(amount), currency))
+    return result
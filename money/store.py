@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+Memory-mapped binary store of historical exchange rates
+
+A store file holds rate series against a single base currency:
+
+- header: magic ``MNYRATES``, format version, number of currencies, base
+  currency and total number of records;
+- directory: one entry per currency with its code, index of its first
+  record and number of records;
+- records: fixed-width (timestamp, coefficient, exponent), sorted by
+  timestamp within each currency. Timestamps are POSIX seconds (UTC) and
+  rates are ``coefficient * 10 ** exponent``. Rates with more significant
+  digits than a 64-bit coefficient holds are rounded to ``RATE_DIGITS``.
+
+``MappedBackend`` maps a store read-only, so that processes share a single
+copy of it in the page cache and open it in constant time regardless of
+the length of the series. Compile a store from a CSV file with:
+
+    python -m money.store rates.csv rates.bin --base USD
+"""
+# RADAR: Python2
+from __future__ import absolute_import, print_function
+
+import argparse
+import bisect
+import calendar
+import csv
+import datetime
+import decimal
+import io
+import mmap
+import struct
+
+from .currency import get_currency
+from .exchange import BackendBase, _is_sorted, _parse_timestamp
+
+
+__all__ = ['MappedBackend', 'write_store', 'compile_csv']
+
+MAGIC = b'MNYRATES'
+FORMAT_VERSION = 1
+
+# magic, version, number of currencies, base, total number of records
+HEADER = struct.Struct('<8sHH3sxQ')
+# currency, index of the first record, number of records
+ENTRY = struct.Struct('<3s5xQQ')
+# timestamp, coefficient, exponent
+RECORD = struct.Struct('<qqb')
+
+# Significant digits kept of rates that do not fit in a record (e.g. 1/3)
+RATE_DIGITS = 18
+_ROUNDING = decimal.Context(prec=RATE_DIGITS,
+                            rounding=decimal.ROUND_HALF_EVEN)
+
+
+def _seconds(at):
+    """Return a timestamp as POSIX seconds (naive datetimes are UTC)"""
+    if isinstance(at, datetime.datetime):
+        return calendar.timegm(at.utctimetuple())
+    if isinstance(at, datetime.date):
+        return calendar.timegm(at.timetuple())
+    return int(at)
+
+
+def _parts(rate):
+    sign, digits, exponent = rate.as_tuple()
+    coefficient = int(''.join(map(str, digits))) * (-1 if sign else 1)
+    return coefficient, exponent
+
+
+def _encode_rate(rate):
+    """
+    Return (coefficient, exponent) of a rate as a Decimal, rounded to
+    RATE_DIGITS significant digits if its coefficient does not fit in 64 bits
+    """
+    rate = decimal.Decimal(rate)
+    if not rate.is_finite():
+        raise ValueError("rate out of range: '{}'".format(rate))
+    coefficient, exponent = _parts(rate)
+    if not -2 ** 63 <= coefficient < 2 ** 63:
+        coefficient, exponent = _parts(_ROUNDING.plus(rate).normalize(
+            _ROUNDING))
+    if not -128 <= exponent <= 127:
+        raise ValueError("rate out of range: '{}'".format(rate))
+    return coefficient, exponent
+
+
+def write_store(fileobj, base, points):
+    """
+    Write a store to a binary file from an iterable of points
+    (currency, timestamp, rate). Return the number of records.
+
+    Timestamps are datetimes, dates or POSIX seconds. Of several rates of
+    a currency at the same timestamp, the last one is kept.
+    """
+    series = {}
+    for currency, at, rate in points:
+        coefficient, exponent = _encode_rate(rate)
+        series.setdefault(get_currency(currency), {})[_seconds(at)] = (
+            coefficient, exponent)
+    currencies = sorted(series)
+    directory = []
+    start = 0
+    for currency in currencies:
+        count = len(series[currency])
+        directory.append(ENTRY.pack(currency.encode('ascii'), start, count))
+        start += count
+    fileobj.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(currencies),
+                              get_currency(base).encode('ascii'), start))
+    fileobj.write(b''.join(directory))
+    pack = RECORD.pack
+    for currency in currencies:
+        rates = series[currency]
+        fileobj.write(b''.join(pack(at, *rates[at]) for at in sorted(rates)))
+    return start
+
+
+def compile_csv(source, target, base, parse=_parse_timestamp, header=True):
+    """
+    Compile a CSV file with rows of currency, timestamp, rate into a store.
+
+    ``source`` and ``target`` are file paths. Timestamps are parsed with
+    ``parse`` (ISO 8601 dates or dates and times by default); integers are
+    taken as POSIX seconds. The first row is skipped if ``header``. Return
+    the number of records.
+    """
+    parsed = {}
+
+    def points(rows):
+        if header:
+            next(rows, None)
+        for currency, at, rate in rows:
+            try:
+                timestamp = parsed[at]
+            except KeyError:
+                timestamp = parsed[at] = (
+                    int(at) if at.isdigit() else parse(at))
+            yield currency, timestamp, rate
+
+    # RADAR: Python2
+    with io.open(source, newline='') as csvfile:
+        rows = csv.reader(csvfile)
+        with open(target, 'wb') as storefile:
+            return write_store(storefile, base, points(rows))
+
+
+class _Timestamps(object):
+    """Read-only sequence of the timestamps of a series, for bisect"""
+    def __init__(self, buffer, offset, count):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return RECORD.unpack_from(
+            self._buffer, self._offset + i * RECORD.size)[0]
+
+
+class MappedBackend(BackendBase):
+    """
+    Read-only historical backend on a memory-mapped store file.
+
+    Supports the same lookups as ``HistoricalBackend``: rates are looked up
+    by bisection on the mapped records as of a timestamp (a datetime, date
+    or POSIX seconds), or the latest ones if no timestamp is given.
+    """
+    _historical = True
+
+    def __init__(self, path):
+        with open(path, 'rb') as fileobj:
+            self._map = mmap.mmap(fileobj.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        magic, version, size, base, count = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError("'{}' is not a rates store of version "
+                             "{}".format(path, FORMAT_VERSION))
+        self._base = get_currency(base.decode('ascii'))
+        offset = HEADER.size + size * ENTRY.size
+        self._series = {}
+        for i in range(size):
+            code, start, length = ENTRY.unpack_from(
+                self._map, HEADER.size + i * ENTRY.size)
+            self._series[get_currency(code.decode('ascii'))] = _Timestamps(
+                self._map, offset + start * RECORD.size, length)
+
+    @property
+    def base(self):
+        return self._base
+
+    def close(self):
+        """Unmap the store file"""
+        self._map.close()
+
+    def changed(self):
+        raise TypeError("rates stores are read-only")
+
+    def _rate(self, series, i):
+        _, coefficient, exponent = RECORD.unpack_from(
+            self._map, series._offset + i * RECORD.size)
+        return decimal.Decimal(coefficient).scaleb(exponent)
+
+    def rate(self, currency, at=None):
+        """Return the rate of a currency as of a timestamp (or the latest)"""
+        if currency == self._base:
+            return decimal.Decimal(1)
+        series = self._series.get(currency)
+        if not series:
+            return None
+        if at is None:
+            return self._rate(series, len(series) - 1)
+        i = bisect.bisect_right(series, _seconds(at))
+        return self._rate(series, i - 1) if i else None
+
+    def rates(self, currency, timestamps):
+        """
+        Return the rates of a currency as of each of many timestamps,
+        in a single forward pass if the timestamps are sorted
+        """
+        timestamps = [_seconds(at) for at in timestamps]
+        if currency == self._base:
+            return [decimal.Decimal(1)] * len(timestamps)
+        if not _is_sorted(timestamps):
+            return [self.rate(currency, at) for at in timestamps]
+        series = self._series.get(currency, ())
+        result = []
+        append = result.append
+        i = 0
+        for at in timestamps:
+            i = bisect.bisect_right(series, at, i)
+            append(self._rate(series, i - 1) if i else None)
+        return result
+
+    def quotation(self, origin, target, at=None):
+        a = self.rate(origin, at)
+        b = self.rate(target, at)
+        if a and b:
+            return b / a
+        return None
+
+    def quotations(self, origin, target, timestamps):
+        """Return quotations between two currencies as of many timestamps"""
+        timestamps = list(timestamps)
+        return [b / a if a and b else None for a, b in zip(
+            self.rates(origin, timestamps), self.rates(target, timestamps))]
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m money.store',
+        description="Compile a CSV file of rates (rows of currency, "
+                    "timestamp, rate) into a memory-mappable rates store.")
+    parser.add_argument('source', help="CSV file")
+    parser.add_argument('target', help="store file to write")
+    parser.add_argument('--base', required=True, help="base currency")
+    parser.add_argument('--no-header', dest='header', action='store_false',
+                        help="do not skip the first row")
+    options = parser.parse_args(args)
+    count = compile_csv(options.source, options.target, options.base,
+                        header=options.header)
+    print("{} rates written to {}".format(count, options.target))
+
+
+if __name__ == '__main__':
+    main()
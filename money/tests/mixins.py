@@ -11,6 +11,7 @@ import collections
 import unittest
 import pickle
 import babel
+import babel.numbers
 
 # RADAR: Python2
 import money.six
@@ -93,6 +94,13 @@ class ClassMixin(object):
     def test_pickable(self):
         self.assertEqual(pickle.loads(pickle.dumps(self.money)), self.money)
     
+    def test_pickable_all_protocols(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(self.money, protocol)), self.money)
+    
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.money, '__dict__'))
+    
     def test_sqlalchemy_composite_values(self):
         self.assertEqual((self.money.amount, self.money.currency), self.money.__composite_values__())
 
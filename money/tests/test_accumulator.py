@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Money accumulator unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+from decimal import Decimal
+import unittest
+
+from money import IntMoney, Money, MoneyAccumulator, MoneyArray, XMoney
+from money.exceptions import InvalidOperandType
+
+
+class TestMoneyAccumulator(unittest.TestCase):
+    def test_empty(self):
+        accumulator = MoneyAccumulator()
+        self.assertEqual(len(accumulator), 0)
+        self.assertEqual(accumulator.result(), {})
+        self.assertEqual(accumulator.result('EUR'), Money(0, 'EUR'))
+
+    def test_add(self):
+        accumulator = MoneyAccumulator()
+        accumulator.add(Money('1.50', 'EUR'))
+        accumulator.add(Money('2.25', 'EUR'))
+        self.assertEqual(accumulator.result('EUR'), Money('3.75', 'EUR'))
+
+    def test_same_as_sum(self):
+        values = [Money(Decimal(i) / 7, 'EUR') for i in range(100)]
+        self.assertEqual(MoneyAccumulator(values).result('EUR'), sum(values))
+
+    def test_mixed_currencies_bucketed(self):
+        accumulator = MoneyAccumulator()
+        accumulator.add_many([Money('1', 'EUR'), Money('2', 'USD'),
+                              Money('3', 'EUR')])
+        self.assertEqual(accumulator.currencies, ['EUR', 'USD'])
+        self.assertEqual(accumulator.result(), {'EUR': Money('4', 'EUR'),
+                                                'USD': Money('2', 'USD')})
+
+    def test_result_class(self):
+        accumulator = MoneyAccumulator([XMoney('1', 'EUR'),
+                                        IntMoney('2', 'JPY'),
+                                        Money('3', 'EUR')])
+        self.assertIsInstance(accumulator.result('EUR'), XMoney)
+        self.assertIsInstance(accumulator.result()['JPY'], IntMoney)
+        self.assertEqual(accumulator.result('JPY'), IntMoney('2', 'JPY'))
+
+    def test_add_array(self):
+        accumulator = MoneyAccumulator([Money('1', 'EUR')])
+        accumulator.add_many(MoneyArray(['2.5', '3'], 'EUR'))
+        accumulator.add_many(MoneyArray([], 'USD'))
+        self.assertEqual(accumulator.result(), {'EUR': Money('6.5', 'EUR')})
+
+    def test_merge(self):
+        first = MoneyAccumulator([Money('1', 'EUR'), Money('2', 'USD')])
+        second = MoneyAccumulator([Money('3', 'EUR'), XMoney('4', 'GBP')])
+        first.merge(second)
+        self.assertEqual(first.result(), {'EUR': Money('4', 'EUR'),
+                                          'USD': Money('2', 'USD'),
+                                          'GBP': XMoney('4', 'GBP')})
+        self.assertEqual(second.result('EUR'), Money('3', 'EUR'))
+
+    def test_context(self):
+        context = decimal.Context(prec=3)
+        accumulator = MoneyAccumulator(context=context)
+        accumulator.add_many([Money('1.234', 'EUR'), Money('1.111', 'EUR')])
+        self.assertIs(accumulator.context, context)
+        self.assertEqual(accumulator.result('EUR'), Money('2.34', 'EUR'))
+
+    def test_invalid_values(self):
+        accumulator = MoneyAccumulator()
+        with self.assertRaises(InvalidOperandType):
+            accumulator.add(Decimal('1'))
+        with self.assertRaises(InvalidOperandType):
+            accumulator.merge([Money('1', 'EUR')])
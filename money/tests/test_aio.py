@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Asynchronous exchange unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+from decimal import Decimal
+import sys
+import unittest
+
+import money.exchange
+from money import Money, MoneyArray, XMoney, xrates
+from money.exchange import AsyncBackendBase, SimpleBackend
+from money.exceptions import ExchangeBackendNotInstalled
+from money.exceptions import ExchangeRateNotFound
+
+# RADAR: Python2 (money.aio has coroutines with async def)
+if sys.version_info >= (3, 5):
+    import asyncio
+    from money.aio import AsyncSimpleBackend
+
+
+class FailingBackend(SimpleBackend):
+    def quotation(self, origin, target):
+        raise KeyError(origin)
+
+
+@unittest.skipIf(sys.version_info < (3, 5),
+                 "asyncio coroutines require Python 3.5+")
+class AsyncTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.backend = AsyncSimpleBackend()
+        xrates.install(self.backend)
+        xrates.base = 'XXX'
+        xrates.setrate('AAA', Decimal('2'))
+        xrates.setrate('BBB', Decimal('8'))
+
+    def tearDown(self):
+        xrates.disable_cache()
+        xrates.uninstall()
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def run_until_complete(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+
+class TestAsyncBackend(AsyncTestCase):
+    def test_is_async_backend(self):
+        self.assertIsInstance(self.backend, AsyncBackendBase)
+
+    def test_rate(self):
+        rate = self.run_until_complete(self.backend.rate('AAA'))
+        self.assertEqual(rate, Decimal('2'))
+
+    def test_sync_api_refused(self):
+        with self.assertRaises(TypeError):
+            xrates.quotation('AAA', 'BBB')
+        with self.assertRaises(TypeError):
+            xrates.rate('AAA')
+        with self.assertRaises(TypeError):
+            Money('1', 'AAA').to('BBB')
+
+
+class TestAsyncConversion(AsyncTestCase):
+    def test_aquotation(self):
+        rate = self.run_until_complete(xrates.aquotation('AAA', 'BBB'))
+        self.assertEqual(rate, Decimal('4'))
+
+    def test_ato(self):
+        result = self.run_until_complete(Money('1', 'AAA').ato('BBB'))
+        self.assertEqual(result, Money('4', 'BBB'))
+        result = self.run_until_complete(XMoney('1', 'AAA').ato('BBB'))
+        self.assertIsInstance(result, XMoney)
+
+    def test_ato_same_currency(self):
+        value = Money('1', 'AAA')
+        self.assertIs(self.run_until_complete(value.ato('AAA')), value)
+        self.assertEqual(self.backend.fetches, 0)
+
+    def test_ato_rate_not_found(self):
+        with self.assertRaises(ExchangeRateNotFound):
+            self.run_until_complete(Money('1', 'AAA').ato('ZZZ'))
+
+    def test_ato_without_backend(self):
+        xrates.uninstall()
+        with self.assertRaises(ExchangeBackendNotInstalled):
+            self.run_until_complete(Money('1', 'AAA').ato('BBB'))
+
+    def test_ato_sync_backend(self):
+        xrates.install('money.exchange.SimpleBackend')
+        xrates.base = 'XXX'
+        xrates.setrate('AAA', Decimal('2'))
+        result = self.run_until_complete(Money('2', 'AAA').ato('XXX'))
+        self.assertEqual(result, Money('1', 'XXX'))
+
+    def test_aconvert_many(self):
+        values = [Money('1', 'AAA'), Money('8', 'BBB'), Money('2', 'AAA')]
+        result = self.run_until_complete(xrates.aconvert_many(values, 'XXX'))
+        self.assertEqual(result, [Money('0.5', 'XXX'), Money('1', 'XXX'),
+                                  Money('1', 'XXX')])
+        self.assertEqual(self.backend.fetches, 2)
+
+    def test_aconvert_many_keeps_target_currency(self):
+        values = [Money('1', 'XXX')]
+        result = self.run_until_complete(xrates.aconvert_many(values, 'XXX'))
+        self.assertIs(result[0], values[0])
+        self.assertEqual(self.backend.fetches, 0)
+
+    def test_aconvert_many_array(self):
+        values = MoneyArray(['1', '3'], 'AAA')
+        result = self.run_until_complete(xrates.aconvert_many(values, 'BBB'))
+        self.assertEqual(result.tolist(), [Money('4', 'BBB'),
+                                           Money('12', 'BBB')])
+
+
+class TestCoalescing(AsyncTestCase):
+    def test_concurrent_requests_share_fetch(self):
+        self.backend.delay = 0.01
+        requests = [Money(i, 'AAA').ato('BBB') for i in range(1000)]
+        results = self.run_until_complete(asyncio.gather(*requests))
+        self.assertEqual(self.backend.fetches, 1)
+        self.assertEqual(results[3], Money('12', 'BBB'))
+
+    def test_sequential_requests_fetch_again(self):
+        self.run_until_complete(Money('1', 'AAA').ato('BBB'))
+        self.run_until_complete(Money('1', 'AAA').ato('BBB'))
+        self.assertEqual(self.backend.fetches, 2)
+
+    def test_cached_after_fetch(self):
+        xrates.enable_cache()
+        self.run_until_complete(Money('1', 'AAA').ato('BBB'))
+        self.run_until_complete(Money('1', 'AAA').ato('BBB'))
+        self.assertEqual(self.backend.fetches, 1)
+        xrates.setrate('BBB', Decimal('4'))
+        result = self.run_until_complete(Money('1', 'AAA').ato('BBB'))
+        self.assertEqual(result, Money('2', 'BBB'))
+        self.assertEqual(self.backend.fetches, 2)
+
+    def test_cancelled_request_does_not_cancel_fetch(self):
+        self.backend.delay = 0.01
+        first = asyncio.ensure_future(Money('1', 'AAA').ato('BBB'))
+        second = asyncio.ensure_future(Money('2', 'AAA').ato('BBB'))
+        self.loop.call_soon(first.cancel)
+        result = self.run_until_complete(second)
+        self.assertEqual(result, Money('8', 'BBB'))
+        self.assertTrue(first.cancelled())
+        self.assertEqual(self.backend.fetches, 1)
+
+    def test_failed_fetch_is_shared_and_retried(self):
+        backend = self.backend
+        backend._rates = FailingBackend()
+        requests = [Money('1', 'AAA').ato('BBB') for i in range(3)]
+        results = self.run_until_complete(
+            asyncio.gather(*requests, return_exceptions=True))
+        self.assertTrue(all(isinstance(r, KeyError) for r in results))
+        self.assertEqual(backend.fetches, 1)
+        with self.assertRaises(KeyError):
+            self.run_until_complete(Money('1', 'AAA').ato('BBB'))
+        self.assertEqual(backend.fetches, 2)
+
+
+class TestUsingBackend(AsyncTestCase):
+    def test_refused_in_event_loop_without_contextvars(self):
+        contextvars = money.exchange.contextvars
+        money.exchange.contextvars = None
+        try:
+            errors = []
+            def enter():
+                try:
+                    with xrates.using(SimpleBackend()):
+                        pass
+                except RuntimeError as err:
+                    errors.append(err)
+            self.loop.call_soon(enter)
+            self.run_until_complete(asyncio.sleep(0))
+            self.assertEqual(len(errors), 1)
+            with xrates.using(SimpleBackend()):
+                self.assertIsNone(xrates.base)
+        finally:
+            money.exchange.contextvars = contextvars
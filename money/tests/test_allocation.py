@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Money allocation unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+from decimal import Decimal
+import unittest
+
+from money import IntMoney, Money, XMoney
+from money.allocation import allocate_many
+
+
+class TestAllocate(unittest.TestCase):
+    def test_exact(self):
+        self.assertEqual(Money('100', 'EUR').allocate([1, 3]),
+                         [Money('25', 'EUR'), Money('75', 'EUR')])
+
+    def test_largest_remainder(self):
+        self.assertEqual(Money('100', 'EUR').allocate([1, 1, 1]),
+                         [Money('33.34', 'EUR'), Money('33.33', 'EUR'),
+                          Money('33.33', 'EUR')])
+        self.assertEqual(Money('1', 'EUR').allocate([1, 2, 4]),
+                         [Money('0.14', 'EUR'), Money('0.29', 'EUR'),
+                          Money('0.57', 'EUR')])
+
+    def test_ties_to_first(self):
+        self.assertEqual(Money('0.05', 'EUR').allocate([3, 7]),
+                         [Money('0.02', 'EUR'), Money('0.03', 'EUR')])
+
+    def test_decimal_ratios(self):
+        self.assertEqual(
+            Money('100', 'EUR').allocate([Decimal('0.5'), 1,
+                                          Decimal('0.25')]),
+            [Money('28.57', 'EUR'), Money('57.14', 'EUR'),
+             Money('14.29', 'EUR')])
+
+    def test_zero_ratio(self):
+        self.assertEqual(Money('1', 'EUR').allocate([0, 1, 0]),
+                         [Money('0', 'EUR'), Money('1', 'EUR'),
+                          Money('0', 'EUR')])
+
+    def test_negative_amount(self):
+        self.assertEqual(Money('-100', 'EUR').allocate([1, 1, 1]),
+                         [Money('-33.34', 'EUR'), Money('-33.33', 'EUR'),
+                          Money('-33.33', 'EUR')])
+
+    def test_adds_up(self):
+        ratios = [Decimal(i) / 8 for i in range(1, 20)]
+        for amount in ('0.01', '999.99', '-12345.67', '0'):
+            value = Money(amount, 'EUR')
+            self.assertEqual(sum(value.allocate(ratios)), value)
+
+    def test_minor_unit(self):
+        self.assertEqual(Money('10', 'JPY').allocate([1, 2]),
+                         [Money('3', 'JPY'), Money('7', 'JPY')])
+        self.assertEqual(Money('1', 'BHD').allocate([1, 2]),
+                         [Money('0.333', 'BHD'), Money('0.667', 'BHD')])
+
+    def test_keeps_class(self):
+        parts = XMoney('1', 'EUR').allocate([1, 1])
+        self.assertTrue(all(isinstance(part, XMoney) for part in parts))
+        parts = IntMoney('1', 'EUR').allocate([1, 2])
+        self.assertEqual([part.units for part in parts], [33, 67])
+
+    def test_invalid_ratios(self):
+        value = Money('1', 'EUR')
+        with self.assertRaises(ValueError):
+            value.allocate([])
+        with self.assertRaises(ValueError):
+            value.allocate([0, 0])
+        with self.assertRaises(ValueError):
+            value.allocate([1, -1])
+        with self.assertRaises(TypeError):
+            value.allocate([0.5, 0.5])
+
+    def test_too_many_places(self):
+        with self.assertRaises(ValueError):
+            Money('1.005', 'EUR').allocate([1, 1])
+
+
+class TestSplit(unittest.TestCase):
+    def test_split(self):
+        self.assertEqual(Money('100', 'EUR').split(3),
+                         [Money('33.34', 'EUR'), Money('33.33', 'EUR'),
+                          Money('33.33', 'EUR')])
+        self.assertEqual(Money('-0.05', 'EUR').split(3),
+                         [Money('-0.02', 'EUR'), Money('-0.02', 'EUR'),
+                          Money('-0.01', 'EUR')])
+
+    def test_same_as_allocate(self):
+        value = Money('123.45', 'EUR')
+        for n in range(1, 20):
+            self.assertEqual(value.split(n), value.allocate([1] * n))
+
+    def test_invalid(self):
+        for n in (0, -1, 1.5, True):
+            with self.assertRaises(ValueError):
+                Money('1', 'EUR').split(n)
+
+
+class TestAllocateMany(unittest.TestCase):
+    def test_allocate_many(self):
+        values = [Money('1', 'USD'), Money('10', 'EUR'), Money('0', 'EUR')]
+        self.assertEqual(allocate_many(values, [1, 1, 1]),
+                         [value.allocate([1, 1, 1]) for value in values])
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            allocate_many([Money('1', 'EUR'), Decimal('1')], [1, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
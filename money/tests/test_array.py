@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+MoneyArray unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+from decimal import Decimal
+import pickle
+import unittest
+
+import money.array
+from money import Money, MoneyArray
+from money.exceptions import CurrencyMismatch, InvalidOperandType
+
+
+class TestMoneyArrayInstantiation(unittest.TestCase):
+    def test_new_instance(self):
+        a = MoneyArray(['1.5', 2, Decimal('0.25')], 'XXX')
+        self.assertEqual(len(a), 3)
+        self.assertEqual(a.currency, 'XXX')
+        self.assertEqual(a.places, 2)
+
+    def test_currency_places(self):
+        a = MoneyArray(['1.00', '2'], 'EUR')
+        self.assertEqual(a.places, 2)
+        self.assertEqual((a / 3).tolist(), [Money('0.33', 'EUR'),
+                                            Money('0.67', 'EUR')])
+        self.assertEqual(str(a[0].amount), '1.00')
+        self.assertEqual(MoneyArray(['1.5'], 'JPY').places, 1)
+        self.assertEqual(MoneyArray(['1'], 'JPY').places, 0)
+
+    def test_explicit_places(self):
+        a = MoneyArray(['1.5'], 'XXX', places=4)
+        self.assertEqual(a.places, 4)
+        self.assertEqual(a[0], Money('1.5', 'XXX'))
+
+    def test_not_representable(self):
+        with self.assertRaises(ValueError):
+            MoneyArray(['1.234'], 'XXX', places=2)
+
+    def test_invalid_currency(self):
+        with self.assertRaises(ValueError):
+            MoneyArray([1], None)
+        with self.assertRaises(ValueError):
+            MoneyArray([1], 'xxx')
+
+    def test_invalid_amount(self):
+        with self.assertRaises(ValueError):
+            MoneyArray(['twenty'], 'XXX')
+
+    def test_overflow(self):
+        with self.assertRaises(OverflowError):
+            MoneyArray([10 ** 20], 'XXX')
+        a = MoneyArray([money.array.MAX_UNITS, money.array.MIN_UNITS], 'XXX',
+                       places=0)
+        with self.assertRaises(OverflowError):
+            a * 2
+        with self.assertRaises(OverflowError):
+            MoneyArray([money.array.MAX_UNITS], 'XXX')
+        with self.assertRaises(OverflowError):
+            MoneyArray([money.array.MAX_UNITS, 1], 'XXX', places=0).cumsum()
+
+    def test_from_money_roundtrip(self):
+        values = [Money('1.5', 'XXX'), Money('-2.999', 'XXX'), Money(0, 'XXX')]
+        a = MoneyArray.from_money(values)
+        self.assertEqual(a.places, 3)
+        self.assertEqual(a.tolist(), values)
+        self.assertEqual([m.amount for m in a], [m.amount for m in values])
+
+    def test_from_money_currency_mismatch(self):
+        with self.assertRaises(CurrencyMismatch):
+            MoneyArray.from_money([Money(1, 'AAA'), Money(1, 'BBB')])
+
+    def test_from_money_empty(self):
+        with self.assertRaises(ValueError):
+            MoneyArray.from_money([])
+        self.assertEqual(len(MoneyArray.from_money([], 'XXX')), 0)
+
+    def test_pickable(self):
+        a = MoneyArray(['1.5', '2'], 'XXX')
+        self.assertEqual(pickle.loads(pickle.dumps(a)).tolist(), a.tolist())
+
+
+class TestMoneyArrayOperations(unittest.TestCase):
+    def setUp(self):
+        self.a = MoneyArray(['1.00', '2.50', '-3.25'], 'XXX')
+        self.b = MoneyArray(['0.001', '1', '2'], 'XXX')
+
+    def test_add_array(self):
+        result = self.a + self.b
+        self.assertEqual(result.places, 3)
+        self.assertEqual(result.tolist(), [Money('1.001', 'XXX'),
+                                           Money('3.5', 'XXX'),
+                                           Money('-1.25', 'XXX')])
+
+    def test_add_money_and_number(self):
+        self.assertEqual((self.a + Money('1', 'XXX')).tolist(),
+                         (self.a + 1).tolist())
+        self.assertEqual((self.a + Decimal('0.5'))[0], Money('1.5', 'XXX'))
+
+    def test_add_float(self):
+        with self.assertRaises(TypeError):
+            self.a + 1.5
+
+    def test_add_different_currency(self):
+        with self.assertRaises(CurrencyMismatch):
+            self.a + MoneyArray([1, 2, 3], 'YYY')
+        with self.assertRaises(CurrencyMismatch):
+            self.a + Money(1, 'YYY')
+
+    def test_add_different_length(self):
+        with self.assertRaises(ValueError):
+            self.a + MoneyArray([1], 'XXX')
+
+    def test_sum_of_arrays(self):
+        self.assertEqual(sum([self.a, self.a]).tolist(), (self.a * 2).tolist())
+
+    def test_sub(self):
+        self.assertEqual((self.a - self.a).tolist(), [Money(0, 'XXX')] * 3)
+        self.assertEqual((0 - self.a).tolist(), (-self.a).tolist())
+
+    def test_mul(self):
+        self.assertEqual((self.a * 2)[1], Money('5', 'XXX'))
+        result = self.a * Decimal('0.125')
+        self.assertEqual(result.places, 5)
+        self.assertEqual(result[2], Money('-0.40625', 'XXX'))
+        self.assertEqual((2 * self.a)[1], Money('5', 'XXX'))
+
+    def test_mul_money(self):
+        with self.assertRaises(TypeError):
+            self.a * Money(2, 'XXX')
+        with self.assertRaises(TypeError):
+            self.a * self.a
+
+    def test_truediv(self):
+        result = self.a / 3
+        self.assertEqual(result.places, 2)
+        self.assertEqual(result.tolist(), [Money('0.33', 'XXX'),
+                                           Money('0.83', 'XXX'),
+                                           Money('-1.08', 'XXX')])
+
+    def test_truediv_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.a / 0
+
+    def test_unary(self):
+        self.assertEqual(abs(self.a)[2], Money('3.25', 'XXX'))
+        self.assertEqual((-self.a)[0], Money('-1', 'XXX'))
+        self.assertEqual((+self.a).tolist(), self.a.tolist())
+
+    def test_comparisons(self):
+        self.assertEqual(self.a > self.b, [True, True, False])
+        self.assertEqual(self.a <= Money(1, 'XXX'), [True, False, True])
+        self.assertEqual(self.a == Money('2.5', 'XXX'), [False, True, False])
+        self.assertEqual(self.a != Money('2.5', 'XXX'), [True, False, True])
+
+    def test_comparison_works_only_with_money(self):
+        with self.assertRaises(InvalidOperandType):
+            self.a < 0
+
+    def test_comparison_different_currency(self):
+        with self.assertRaises(CurrencyMismatch):
+            self.a < Money(0, 'YYY')
+
+    def test_boolean_mask(self):
+        positive = self.a[self.a > Money(0, 'XXX')]
+        self.assertEqual(positive.tolist(), [Money(1, 'XXX'),
+                                             Money('2.5', 'XXX')])
+
+    def test_indexing(self):
+        self.assertEqual(self.a[-1], Money('-3.25', 'XXX'))
+        self.assertEqual(self.a[1:].tolist(), self.a.tolist()[1:])
+        self.assertEqual(self.a[[2, 0]].tolist(), [self.a[2], self.a[0]])
+
+    def test_aggregations(self):
+        self.assertEqual(self.a.sum(), Money('0.25', 'XXX'))
+        self.assertEqual(self.a.cumsum().tolist(), [Money('1', 'XXX'),
+                                                    Money('3.5', 'XXX'),
+                                                    Money('0.25', 'XXX')])
+        self.assertEqual(self.a.min(), Money('-3.25', 'XXX'))
+        self.assertEqual(self.a.max(), Money('2.5', 'XXX'))
+
+    def test_aggregations_empty(self):
+        empty = MoneyArray([], 'XXX')
+        self.assertEqual(empty.sum(), Money(0, 'XXX'))
+        with self.assertRaises(ValueError):
+            empty.min()
+        with self.assertRaises(ValueError):
+            empty.max()
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Timing benchmarks unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import json
+import unittest
+
+from money.bench.timing import compare, report, run
+
+
+class TestTimingBenchmarks(unittest.TestCase):
+    def test_run_and_report(self):
+        results = run('init.int', repeat=1)
+        self.assertEqual(list(results), ['init.int'])
+        self.assertGreater(results['init.int'], 0)
+        self.assertEqual(json.loads(json.dumps(report(results)))['results'],
+                         results)
+
+    def test_compare(self):
+        baseline = {'a': 1.0, 'b': 1.0, 'gone': 1.0}
+        rows = compare({'a': 1.05, 'b': 1.5, 'new': 1.0}, baseline)
+        self.assertEqual([row[0] for row in rows], ['a', 'b'])
+        self.assertEqual([row[-1] for row in rows], [False, True])
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Money binary codec unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import mmap
+import tempfile
+import unittest
+
+from money import IntMoney, Money, XMoney
+from money.codec import RECORD, pack, pack_many, unpack, unpack_many
+from money.currency import get_currency
+
+
+class TestCodec(unittest.TestCase):
+    values = [Money('1234.56', 'EUR'), Money('-0.001', 'JPY'),
+              Money('1E+5', 'USD'), Money('0', 'GBP'),
+              Money('-9223372036854775808', 'ABC')]
+
+    def test_pack_unpack(self):
+        for value in self.values:
+            record = pack(value)
+            self.assertEqual(len(record), RECORD.size)
+            unpacked = unpack(record)
+            self.assertEqual(unpacked, value)
+            self.assertEqual(str(unpacked.amount), str(value.amount))
+            self.assertIs(unpacked.currency, value.currency)
+
+    def test_record_layout(self):
+        self.assertEqual(pack(Money('-1.05', 'CHF')),
+                         b'CHF\xfe' + b'\x97\xff\xff\xff\xff\xff\xff\xff')
+
+    def test_pack_many(self):
+        buffer = pack_many(self.values)
+        self.assertEqual(len(buffer), RECORD.size * len(self.values))
+        self.assertEqual(unpack_many(buffer), self.values)
+        self.assertEqual(unpack(buffer, RECORD.size * 2), self.values[2])
+        self.assertEqual(unpack_many(pack_many([])), [])
+
+    def test_unpack_many_buffers(self):
+        buffer = pack_many(self.values)
+        self.assertEqual(unpack_many(bytearray(buffer)), self.values)
+        self.assertEqual(unpack_many(memoryview(buffer)[RECORD.size:]),
+                         self.values[1:])
+        with tempfile.TemporaryFile() as fileobj:
+            fileobj.write(buffer)
+            fileobj.flush()
+            mapped = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self.assertEqual(unpack_many(mapped), self.values)
+            finally:
+                mapped.close()
+
+    def test_unpack_class(self):
+        buffer = pack_many([IntMoney('1.05', 'CHF'), XMoney('2', 'EUR')])
+        values = unpack_many(buffer, XMoney)
+        self.assertTrue(all(type(value) is XMoney for value in values))
+        value = unpack(buffer, cls=IntMoney)
+        self.assertIs(type(value), IntMoney)
+        self.assertEqual(value.units, 105)
+
+    def test_interned_currency(self):
+        values = unpack_many(pack_many([Money(1, 'EUR'), Money(2, 'EUR')]))
+        self.assertIs(values[0].currency, get_currency('EUR'))
+        self.assertIs(values[1].currency, get_currency('EUR'))
+
+    def test_normalized(self):
+        value = Money('12' + '0' * 25, 'EUR')
+        self.assertEqual(unpack(pack(value)), value)
+
+    def test_out_of_range(self):
+        for amount in ('1' * 20, '1E+200', 'NaN', 'Infinity'):
+            with self.assertRaises(ValueError):
+                pack(Money(amount, 'EUR'))
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            pack_many([Money(1, 'EUR'), 1])
+        with self.assertRaises(ValueError):
+            unpack_many(pack(Money(1, 'EUR'))[:-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Currency registry unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import copy
+import pickle
+import unittest
+
+from money import Money
+from money.currency import Currency, get_currency
+
+
+class TestCurrencyRegistry(unittest.TestCase):
+    def test_iso_currency(self):
+        eur = get_currency('EUR')
+        self.assertIsInstance(eur, Currency)
+        self.assertEqual(eur, 'EUR')
+        self.assertEqual(eur.numeric, '978')
+        self.assertEqual(eur.exponent, 2)
+        self.assertEqual(eur.name, 'Euro')
+        self.assertTrue(eur.is_iso)
+
+    def test_minor_units(self):
+        self.assertEqual(get_currency('JPY').exponent, 0)
+        self.assertEqual(get_currency('KWD').exponent, 3)
+        self.assertEqual(get_currency('CLF').exponent, 4)
+
+    def test_no_minor_unit(self):
+        xxx = get_currency('XXX')
+        self.assertIsNone(xxx.exponent)
+        self.assertEqual(xxx.places, 2)
+
+    def test_interned(self):
+        self.assertIs(get_currency('EUR'), get_currency('EUR'))
+        self.assertIs(get_currency(get_currency('USD')), get_currency('USD'))
+
+    def test_non_iso_currency(self):
+        aaa = get_currency('AAA')
+        self.assertIs(aaa, get_currency('AAA'))
+        self.assertFalse(aaa.is_iso)
+        self.assertIsNone(aaa.numeric)
+        self.assertEqual(aaa.places, 2)
+
+    def test_invalid_code(self):
+        for code in [None, False, '', 'eur', 'EURO', '$', 123]:
+            with self.assertRaises(ValueError):
+                get_currency(code)
+
+    def test_pickle_and_copy_keep_identity(self):
+        eur = get_currency('EUR')
+        self.assertIs(pickle.loads(pickle.dumps(eur)), eur)
+        self.assertIs(copy.copy(eur), eur)
+        self.assertIs(copy.deepcopy(eur), eur)
+
+    def test_money_currency_interned(self):
+        self.assertIs(Money(1, 'EUR').currency, get_currency('EUR'))
+        self.assertIs((Money(1, 'EUR') + Money(1, 'EUR')).currency,
+                      get_currency('EUR'))
+        money = pickle.loads(pickle.dumps(Money(1, 'EUR')))
+        self.assertIs(money.currency, get_currency('EUR'))
+
+    def test_money_str_minor_units(self):
+        self.assertEqual(str(Money('1234.567', 'JPY')), 'JPY 1,235')
+        self.assertEqual(str(Money('1234.5678', 'KWD')), 'KWD 1,234.568')
+        self.assertEqual(str(Money('1234.567', 'EUR')), 'EUR 1,234.57')
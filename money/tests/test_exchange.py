@@ -5,14 +5,18 @@ Money exchange unittests
 # RADAR: Python2
 from __future__ import absolute_import
 
+import datetime
 from decimal import Decimal
+import io
+import threading
 import unittest
 
 # RADAR: Python2
 import money.six
 
-from money import Money, XMoney, xrates
-from money.exchange import SimpleBackend
+from money import Money, MoneyArray, XMoney, xrates
+from money.exchange import AtomicBackend, GraphBackend, HistoricalBackend
+from money.exchange import RatesSnapshot, SimpleBackend
 from money.exceptions import ExchangeBackendNotInstalled
 from money.exceptions import ExchangeRateNotFound
 
@@ -121,6 +125,608 @@ class TestSimpleBackend(unittest.TestCase):
             xrates.setrate('AAA', Decimal('2'))
 
 
+class CountingBackend(SimpleBackend):
+    def __init__(self):
+        super(CountingBackend, self).__init__()
+        self.calls = 0
+
+    def quotation(self, origin, target):
+        self.calls += 1
+        return super(CountingBackend, self).quotation(origin, target)
+
+
+class TestSimpleBackendMatrix(unittest.TestCase):
+    def setUp(self):
+        self.backend = SimpleBackend()
+        self.backend.base = 'XXX'
+        self.backend.setrate('AAA', Decimal('2'))
+        self.backend.setrate('BBB', Decimal('8'))
+
+    def test_incremental_update(self):
+        self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('4'))
+        self.backend.setrate('BBB', Decimal('4'))
+        self.backend.setrate('CCC', Decimal('1'))
+        self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('2'))
+        self.assertEqual(self.backend.quotation('BBB', 'AAA'), Decimal('0.5'))
+        self.assertEqual(self.backend.quotation('CCC', 'AAA'), Decimal('2'))
+        self.assertEqual(self.backend.quotation('AAA', 'CCC'), Decimal('0.5'))
+        self.assertEqual(self.backend.quotation('CCC', 'XXX'), Decimal('1'))
+
+    def test_base_change_rebuilds(self):
+        self.assertEqual(self.backend.quotation('XXX', 'AAA'), Decimal('2'))
+        self.backend.base = 'AAA'
+        self.assertIsNone(self.backend.quotation('XXX', 'AAA'))
+        self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('8'))
+
+    def test_zero_rate(self):
+        self.backend.setrate('CCC', Decimal('0'))
+        self.assertIsNone(self.backend.quotation('CCC', 'AAA'))
+        self.assertIsNone(self.backend.quotation('AAA', 'CCC'))
+
+    def test_rate_override_fallback(self):
+        class FixedBackend(SimpleBackend):
+            def rate(self, currency):
+                if currency == 'FFF':
+                    return Decimal('4')
+                return super(FixedBackend, self).rate(currency)
+        backend = FixedBackend()
+        backend.base = 'XXX'
+        backend.setrate('AAA', Decimal('2'))
+        self.assertEqual(backend.quotation('AAA', 'FFF'), Decimal('2'))
+        self.assertEqual(backend.quotation('FFF', 'XXX'), Decimal('0.25'))
+        self.assertIsNone(backend.quotation('AAA', 'ZZZ'))
+
+    def test_concurrent_readers(self):
+        currencies = ['C{:02d}'.format(i) for i in range(60)]
+        errors = []
+        for trial in range(20):
+            backend = SimpleBackend()
+            backend.base = 'XXX'
+            for currency in currencies:
+                backend.setrate(currency, Decimal('2'))
+            start = threading.Event()
+
+            def read():
+                start.wait()
+                try:
+                    for currency in currencies:
+                        if backend.quotation('XXX', currency) is None:
+                            errors.append(currency)
+                except Exception as error:
+                    errors.append(error)
+            threads = [threading.Thread(target=read) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            start.set()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(errors, [])
+
+    def test_snapshot(self):
+        snapshot = self.backend.snapshot()
+        self.backend.setrate('BBB', Decimal('16'))
+        self.assertEqual(snapshot.quotation('AAA', 'BBB'), Decimal('4'))
+        self.assertEqual(snapshot.rate('BBB'), Decimal('8'))
+        self.assertEqual(snapshot.base, 'XXX')
+        self.assertIsNone(snapshot.quotation('AAA', 'ZZZ'))
+        self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('8'))
+
+    def test_snapshot_read_only(self):
+        snapshot = self.backend.snapshot()
+        with self.assertRaises(AttributeError):
+            snapshot.base = 'AAA'
+        with self.assertRaises(AttributeError):
+            snapshot.setrate('AAA', Decimal('1'))
+
+    def test_snapshot_from_rates(self):
+        snapshot = RatesSnapshot('XXX', {'AAA': Decimal('2'),
+                                         'BBB': Decimal('8')})
+        self.assertEqual(snapshot.quotation('BBB', 'AAA'), Decimal('0.25'))
+        self.assertEqual(snapshot.quotation('XXX', 'XXX'), Decimal('1'))
+
+    def test_snapshot_installed(self):
+        xrates.install(self.backend.snapshot())
+        try:
+            self.assertEqual(Money(1, 'AAA').to('BBB'), Money(4, 'BBB'))
+        finally:
+            xrates.uninstall()
+
+
+class TestAtomicBackend(unittest.TestCase):
+    def setUp(self):
+        self.backend = AtomicBackend()
+        self.backend.base = 'XXX'
+        self.backend.update({'AAA': Decimal('2'), 'BBB': Decimal('8')})
+
+    def test_rates(self):
+        self.assertEqual(self.backend.base, 'XXX')
+        self.assertEqual(self.backend.rate('XXX'), Decimal('1'))
+        self.assertEqual(self.backend.rate('AAA'), Decimal('2'))
+        self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('4'))
+        self.assertIsNone(self.backend.quotation('AAA', 'ZZZ'))
+
+    def test_base_not_set_warning(self):
+        with self.assertRaises(Warning):
+            AtomicBackend().setrate('AAA', Decimal('2'))
+
+    def test_versions(self):
+        version = self.backend.version
+        self.backend.setrate('BBB', Decimal('16'))
+        self.assertEqual(self.backend.version, version + 1)
+        self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('8'))
+
+    def test_update_replace(self):
+        self.backend.update({'CCC': Decimal('4')}, replace=True)
+        self.assertIsNone(self.backend.rate('AAA'))
+        self.assertEqual(self.backend.quotation('XXX', 'CCC'), Decimal('4'))
+
+    def test_snapshot_is_immutable(self):
+        snapshot = self.backend.snapshot()
+        self.backend.setrate('BBB', Decimal('16'))
+        self.assertEqual(snapshot.quotation('AAA', 'BBB'), Decimal('4'))
+
+    def test_pinned(self):
+        with self.backend.pinned() as snapshot:
+            self.backend.setrate('BBB', Decimal('16'))
+            self.assertIs(self.backend.snapshot(), snapshot)
+            self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('4'))
+            with self.backend.pinned() as nested:
+                self.assertIs(nested, snapshot)
+            self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('4'))
+        self.assertEqual(self.backend.quotation('AAA', 'BBB'), Decimal('8'))
+
+    def test_pinned_is_per_thread(self):
+        result = []
+        with self.backend.pinned():
+            self.backend.setrate('BBB', Decimal('16'))
+            thread = threading.Thread(target=lambda: result.append(
+                self.backend.quotation('AAA', 'BBB')))
+            thread.start()
+            thread.join()
+        self.assertEqual(result, [Decimal('8')])
+
+    def test_concurrent_refresh(self):
+        # Rates always change together, keeping the AAA/BBB quotation at 4
+        def refresh():
+            for i in range(1, 200):
+                self.backend.update({'AAA': Decimal(i),
+                                     'BBB': Decimal(4 * i)})
+        errors = []
+        def read():
+            for i in range(2000):
+                if self.backend.quotation('AAA', 'BBB') != 4:
+                    errors.append(i)
+        threads = [threading.Thread(target=refresh)]
+        threads += [threading.Thread(target=read) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_cached_quotations(self):
+        xrates.install(self.backend)
+        xrates.enable_cache()
+        try:
+            self.assertEqual(xrates.quotation('AAA', 'BBB'), Decimal('4'))
+            with self.backend.pinned():
+                self.backend.setrate('BBB', Decimal('16'))
+                self.assertEqual(xrates.quotation('AAA', 'BBB'), Decimal('4'))
+            self.assertEqual(xrates.quotation('AAA', 'BBB'), Decimal('8'))
+        finally:
+            xrates.disable_cache()
+            xrates.uninstall()
+
+    def test_cached_quotation_single_snapshot(self):
+        class RacyBackend(AtomicBackend):
+            # Publish new rates right after the version is read
+            @property
+            def _version(self):
+                version = self._current().version
+                self.setrate('BBB', Decimal('16'))
+                return version
+        backend = RacyBackend()
+        backend.update({'AAA': Decimal('2'), 'BBB': Decimal('8')}, base='XXX')
+        version = backend.version
+        xrates.install(backend)
+        xrates.enable_cache()
+        try:
+            self.assertEqual(xrates.quotation('AAA', 'BBB'), Decimal('4'))
+            key = ('AAA', 'BBB', backend, version)
+            self.assertEqual(xrates._cache.get(key), Decimal('4'))
+        finally:
+            xrates.disable_cache()
+            xrates.uninstall()
+
+
+class TestQuotationCache(unittest.TestCase):
+    def setUp(self):
+        self.backend = CountingBackend()
+        xrates.install(self.backend)
+        xrates.base = 'XXX'
+        xrates.setrate('AAA', Decimal('2'))
+        xrates.setrate('BBB', Decimal('8'))
+        xrates.enable_cache(maxsize=2)
+
+    def tearDown(self):
+        xrates.disable_cache()
+        xrates.uninstall()
+
+    def test_disabled_by_default(self):
+        xrates.disable_cache()
+        self.assertIsNone(xrates.cache_info())
+        xrates.quotation('AAA', 'BBB')
+        xrates.quotation('AAA', 'BBB')
+        self.assertEqual(self.backend.calls, 2)
+
+    def test_hits_and_misses(self):
+        self.assertEqual(xrates.quotation('AAA', 'BBB'), Decimal('4'))
+        self.assertEqual(xrates.quotation('AAA', 'BBB'), Decimal('4'))
+        self.assertEqual(Money(1, 'AAA').to('BBB'), Money(4, 'BBB'))
+        self.assertEqual(self.backend.calls, 1)
+        info = xrates.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+        self.assertEqual((info.maxsize, info.currsize), (2, 1))
+
+    def test_missing_quotation_cached(self):
+        self.assertIsNone(xrates.quotation('AAA', 'ZZZ'))
+        self.assertIsNone(xrates.quotation('AAA', 'ZZZ'))
+        self.assertEqual(self.backend.calls, 1)
+
+    def test_lru_eviction(self):
+        xrates.quotation('AAA', 'BBB')
+        xrates.quotation('BBB', 'AAA')
+        xrates.quotation('AAA', 'BBB')
+        xrates.quotation('XXX', 'AAA')
+        self.assertEqual(xrates.cache_info().currsize, 2)
+        xrates.quotation('AAA', 'BBB')
+        self.assertEqual(self.backend.calls, 3)
+        xrates.quotation('BBB', 'AAA')
+        self.assertEqual(self.backend.calls, 4)
+
+    def test_ttl(self):
+        now = [0]
+        xrates.enable_cache()
+        xrates._cache._timer = lambda: now[0]
+        xrates._cache.ttl = 10
+        xrates.quotation('AAA', 'BBB')
+        now[0] = 9
+        xrates.quotation('AAA', 'BBB')
+        self.assertEqual(self.backend.calls, 1)
+        now[0] = 10
+        xrates.quotation('AAA', 'BBB')
+        self.assertEqual(self.backend.calls, 2)
+
+    def test_invalidated_by_setrate(self):
+        self.assertEqual(xrates.quotation('AAA', 'BBB'), Decimal('4'))
+        xrates.setrate('BBB', Decimal('16'))
+        self.assertEqual(xrates.quotation('AAA', 'BBB'), Decimal('8'))
+
+    def test_invalidated_by_base(self):
+        self.assertEqual(xrates.quotation('XXX', 'AAA'), Decimal('2'))
+        xrates.base = 'AAA'
+        self.assertIsNone(xrates.quotation('XXX', 'AAA'))
+
+    def test_explicit_invalidation(self):
+        xrates.quotation('AAA', 'BBB')
+        xrates.invalidate()
+        self.assertEqual(xrates.cache_info().currsize, 0)
+        xrates.quotation('AAA', 'BBB')
+        self.assertEqual(self.backend.calls, 2)
+
+    def test_invalidated_by_install(self):
+        xrates.quotation('AAA', 'BBB')
+        xrates.install('money.exchange.SimpleBackend')
+        self.assertEqual(xrates.cache_info().currsize, 0)
+
+
+class TestConvertMany(unittest.TestCase):
+    def setUp(self):
+        self.backend = CountingBackend()
+        xrates.install(self.backend)
+        xrates.base = 'XXX'
+        xrates.setrate('AAA', Decimal('2'))
+        xrates.setrate('BBB', Decimal('8'))
+
+    def tearDown(self):
+        xrates.uninstall()
+
+    def test_convert_many(self):
+        values = [Money(1, 'AAA'), XMoney(2, 'XXX'), Money(3, 'AAA'),
+                  Money(8, 'BBB')]
+        result = xrates.convert_many(values, 'BBB')
+        self.assertEqual(result, [Money(4, 'BBB'), XMoney(16, 'BBB'),
+                                  Money(12, 'BBB'), Money(8, 'BBB')])
+        self.assertEqual([type(m) for m in result], [type(m) for m in values])
+        self.assertIs(result[3], values[3])
+        self.assertEqual(self.backend.calls, 2)
+
+    def test_convert_many_matches_to(self):
+        values = [Money('1.11', 'AAA'), Money('2.22', 'BBB')]
+        self.assertEqual(xrates.convert_many(values, 'XXX'),
+                         [m.to('XXX') for m in values])
+
+    def test_convert_many_rate_not_found(self):
+        with self.assertRaises(ExchangeRateNotFound):
+            xrates.convert_many([Money(1, 'AAA'), Money(1, 'ZZZ')], 'BBB')
+
+    def test_convert_many_no_backend(self):
+        xrates.uninstall()
+        with self.assertRaises(ExchangeBackendNotInstalled):
+            xrates.convert_many([Money(1, 'AAA')], 'BBB')
+
+    def test_convert_array(self):
+        values = MoneyArray(['1.25', '-0.03', '3'], 'BBB')
+        result = xrates.convert_many(values, 'AAA')
+        self.assertIsInstance(result, MoneyArray)
+        self.assertEqual(result.currency, 'AAA')
+        self.assertEqual(result.places, 2)
+        self.assertEqual(result.tolist(), [Money('0.31', 'AAA'),
+                                           Money('-0.01', 'AAA'),
+                                           Money('0.75', 'AAA')])
+
+    def test_convert_array_places(self):
+        values = MoneyArray(['1.25', '-0.03', '3'], 'BBB')
+        result = values.to('AAA', places=4)
+        self.assertEqual(result.tolist(), [Money('0.3125', 'AAA'),
+                                           Money('-0.0075', 'AAA'),
+                                           Money('0.75', 'AAA')])
+        self.assertEqual(values.to('BBB', places=0).tolist(),
+                         [Money(1, 'BBB'), Money(0, 'BBB'), Money(3, 'BBB')])
+
+    def test_convert_array_rate_not_found(self):
+        with self.assertRaises(ExchangeRateNotFound):
+            MoneyArray([1], 'ZZZ').to('AAA')
+
+
+class TestHistoricalBackend(unittest.TestCase):
+    def setUp(self):
+        self.backend = HistoricalBackend()
+        xrates.install(self.backend)
+        xrates.base = 'XXX'
+        xrates.setrate('AAA', Decimal('2'), at=10)
+        xrates.setrate('AAA', Decimal('4'), at=20)
+        xrates.setrate('BBB', Decimal('8'), at=15)
+
+    def tearDown(self):
+        xrates.uninstall()
+
+    def test_rate_as_of(self):
+        self.assertIsNone(xrates.rate('AAA', at=9))
+        self.assertEqual(xrates.rate('AAA', at=10), Decimal('2'))
+        self.assertEqual(xrates.rate('AAA', at=19), Decimal('2'))
+        self.assertEqual(xrates.rate('AAA', at=25), Decimal('4'))
+        self.assertEqual(xrates.rate('XXX', at=0), Decimal('1'))
+
+    def test_latest_rate(self):
+        self.assertEqual(xrates.rate('AAA'), Decimal('4'))
+        self.assertIsNone(xrates.rate('ZZZ'))
+
+    def test_setrate_replaces_same_timestamp(self):
+        xrates.setrate('AAA', Decimal('3'), at=10)
+        self.assertEqual(self.backend._times['AAA'], [10, 20])
+        self.assertEqual(xrates.rate('AAA', at=10), Decimal('3'))
+
+    def test_setrate_without_base(self):
+        with self.assertRaises(Warning):
+            HistoricalBackend().setrate('AAA', Decimal('2'), at=1)
+
+    def test_quotation_as_of(self):
+        self.assertIsNone(xrates.quotation('AAA', 'BBB', at=12))
+        self.assertEqual(xrates.quotation('AAA', 'BBB', at=15), Decimal('4'))
+        self.assertEqual(xrates.quotation('AAA', 'BBB', at=20), Decimal('2'))
+
+    def test_money_to(self):
+        self.assertEqual(Money('1', 'AAA').to('BBB', at=16), Money('4', 'BBB'))
+        self.assertEqual(Money('1', 'AAA').to('BBB'), Money('2', 'BBB'))
+        with self.assertRaises(ExchangeRateNotFound):
+            Money('1', 'AAA').to('BBB', at=12)
+
+    def test_at_requires_historical_backend(self):
+        xrates.install('money.exchange.SimpleBackend')
+        with self.assertRaises(TypeError):
+            Money('1', 'AAA').to('BBB', at=16)
+
+    def test_load(self):
+        self.backend.load([('AAA', 30, Decimal('5')),
+                           ('AAA', 5, Decimal('1')),
+                           ('AAA', 30, Decimal('6'))])
+        self.assertEqual(self.backend._times['AAA'], [5, 10, 20, 30])
+        self.assertEqual(xrates.rate('AAA', at=5), Decimal('1'))
+        self.assertEqual(xrates.rate('AAA', at=30), Decimal('6'))
+
+    def test_load_csv(self):
+        backend = HistoricalBackend()
+        backend.base = 'XXX'
+        backend.load_csv(io.StringIO(u"currency,date,rate\n"
+                                     u"AAA,2024-01-02,1.5\n"
+                                     u"AAA,2024-01-01,1.25\n"
+                                     u"BBB,2024-01-01 12:00:00,3\n"))
+        self.assertEqual(backend.rate('AAA', datetime.datetime(2024, 1, 1)),
+                         Decimal('1.25'))
+        self.assertEqual(backend.rate('AAA', datetime.datetime(2024, 1, 3)),
+                         Decimal('1.5'))
+        self.assertIsNone(backend.rate('BBB', datetime.datetime(2024, 1, 1)))
+        self.assertEqual(backend.rate('BBB', datetime.datetime(2024, 1, 2)),
+                         Decimal('3'))
+
+    def test_rates_sorted_and_unsorted(self):
+        expected = [None, Decimal('2'), Decimal('2'), Decimal('4')]
+        self.assertEqual(self.backend.rates('AAA', [0, 10, 15, 40]), expected)
+        self.assertEqual(self.backend.rates('AAA', [40, 10, 0, 15]),
+                         [expected[3], expected[1], expected[0], expected[2]])
+
+    def test_convert_many_at(self):
+        values = [Money('1', 'AAA'), Money('1', 'BBB'), Money('1', 'AAA'),
+                  Money('1', 'XXX')]
+        result = xrates.convert_many(values, 'XXX', at=[10, 15, 20, 0])
+        self.assertEqual(result, [Money('0.5', 'XXX'), Money('0.125', 'XXX'),
+                                  Money('0.25', 'XXX'), Money('1', 'XXX')])
+        self.assertIs(result[3], values[3])
+
+    def test_convert_many_at_errors(self):
+        with self.assertRaises(ValueError):
+            xrates.convert_many([Money('1', 'AAA')], 'XXX', at=[])
+        with self.assertRaises(ExchangeRateNotFound):
+            xrates.convert_many([Money('1', 'BBB')], 'XXX', at=[10])
+
+
+class TestGraphBackend(unittest.TestCase):
+    def setUp(self):
+        self.backend = GraphBackend()
+        xrates.install(self.backend)
+        xrates.setrate('EUR', 'GBP', Decimal('0.8'))
+        xrates.setrate('GBP', 'JPY', Decimal('200'))
+        xrates.setrate('JPY', 'KRW', Decimal('10'))
+
+    def tearDown(self):
+        xrates.uninstall()
+
+    def test_direct_and_inverse(self):
+        self.assertEqual(xrates.quotation('EUR', 'GBP'), Decimal('0.8'))
+        self.assertEqual(xrates.quotation('GBP', 'EUR'), Decimal('1.25'))
+
+    def test_explicit_inverse(self):
+        xrates.setrate('GBP', 'EUR', Decimal('1.2'))
+        self.assertEqual(xrates.quotation('GBP', 'EUR'), Decimal('1.2'))
+        xrates.setrate('EUR', 'GBP', Decimal('0.7'))
+        self.assertEqual(xrates.quotation('GBP', 'EUR'), Decimal('1.2'))
+
+    def test_triangulation(self):
+        self.assertEqual(self.backend.path('EUR', 'KRW'),
+                         ('EUR', 'GBP', 'JPY', 'KRW'))
+        self.assertEqual(xrates.quotation('EUR', 'KRW'), Decimal('1600'))
+        self.assertEqual(Money('2', 'KRW').to('GBP'), Money('0.001', 'GBP'))
+
+    def test_unconnected(self):
+        xrates.setrate('AAA', 'BBB', Decimal('2'))
+        self.assertIsNone(xrates.quotation('EUR', 'AAA'))
+        self.assertIsNone(xrates.quotation('EUR', 'ZZZ'))
+        self.assertIsNone(self.backend.path('EUR', 'AAA'))
+
+    def test_fewest_hops(self):
+        xrates.setrate('EUR', 'JPY', Decimal('150'))
+        self.assertEqual(self.backend.path('EUR', 'KRW'),
+                         ('EUR', 'JPY', 'KRW'))
+        self.assertEqual(xrates.quotation('EUR', 'KRW'), Decimal('1500'))
+
+    def test_best_spread(self):
+        backend = GraphBackend(strategy='spread')
+        backend.setrate('EUR', 'GBP', Decimal('0.8'), spread=Decimal('0.001'))
+        backend.setrate('GBP', 'JPY', Decimal('200'), spread=Decimal('0.001'))
+        backend.setrate('EUR', 'JPY', Decimal('150'), spread=Decimal('0.01'))
+        self.assertEqual(backend.path('EUR', 'JPY'), ('EUR', 'GBP', 'JPY'))
+        backend.setrate('EUR', 'JPY', Decimal('150'), spread=Decimal('0.001'))
+        self.assertEqual(backend.path('EUR', 'JPY'), ('EUR', 'JPY'))
+
+    def test_invalid_strategy(self):
+        with self.assertRaises(ValueError):
+            GraphBackend(strategy='cheapest')
+
+    def test_rate_change_invalidates_quotations(self):
+        self.assertEqual(xrates.quotation('EUR', 'KRW'), Decimal('1600'))
+        path = self.backend.path('EUR', 'KRW')
+        for i in range(2):
+            xrates.setrate('JPY', 'KRW', Decimal('5'))
+            self.assertEqual(xrates.quotation('EUR', 'KRW'), Decimal('800'))
+            self.assertIs(self.backend.path('EUR', 'KRW'), path)
+            xrates.setrate('JPY', 'KRW', Decimal('10'))
+            self.assertEqual(xrates.quotation('EUR', 'KRW'), Decimal('1600'))
+
+    def test_new_pair_reroutes(self):
+        self.assertIsNone(xrates.quotation('EUR', 'AAA'))
+        xrates.setrate('KRW', 'AAA', Decimal('2'))
+        self.assertEqual(xrates.quotation('EUR', 'AAA'), Decimal('3200'))
+
+    def test_rate_against_base(self):
+        self.assertIsNone(xrates.rate('GBP'))
+        xrates.base = 'EUR'
+        self.assertEqual(xrates.rate('JPY'), Decimal('160'))
+
+
+class TestUsingBackend(unittest.TestCase):
+    def setUp(self):
+        xrates.install('money.exchange.SimpleBackend')
+        xrates.base = 'XXX'
+        xrates.setrate('AAA', Decimal('2'))
+        self.other = SimpleBackend()
+        self.other.base = 'XXX'
+        self.other.setrate('AAA', Decimal('4'))
+
+    def tearDown(self):
+        xrates.disable_cache()
+        xrates.uninstall()
+
+    def test_override_within_context(self):
+        with xrates.using(self.other) as backend:
+            self.assertIs(backend, self.other)
+            self.assertEqual(xrates.rate('AAA'), Decimal('4'))
+        self.assertEqual(xrates.rate('AAA'), Decimal('2'))
+
+    def test_money_conversion(self):
+        with xrates.using(self.other):
+            self.assertEqual(Money('1', 'XXX').to('AAA'), Money('4', 'AAA'))
+            self.assertEqual(XMoney('1', 'XXX') + Money('4', 'AAA'),
+                             XMoney('2', 'XXX'))
+        self.assertEqual(Money('1', 'XXX').to('AAA'), Money('2', 'AAA'))
+
+    def test_nested(self):
+        with xrates.using(self.other):
+            with xrates.using('money.exchange.SimpleBackend'):
+                self.assertIsNone(xrates.base)
+            self.assertEqual(xrates.rate('AAA'), Decimal('4'))
+        self.assertEqual(xrates.rate('AAA'), Decimal('2'))
+
+    def test_restored_on_error(self):
+        with self.assertRaises(KeyError):
+            with xrates.using(self.other):
+                raise KeyError()
+        self.assertEqual(xrates.rate('AAA'), Decimal('2'))
+
+    def test_without_installed_backend(self):
+        xrates.uninstall()
+        with xrates.using(self.other):
+            self.assertTrue(xrates)
+            self.assertEqual(xrates.backend_name, 'SimpleBackend')
+        self.assertFalse(xrates)
+
+    def test_attributes_forwarded_to_override(self):
+        with xrates.using(self.other):
+            xrates.setrate('BBB', Decimal('8'))
+        self.assertEqual(self.other.rate('BBB'), Decimal('8'))
+        self.assertIsNone(xrates.rate('BBB'))
+
+    def test_cache_keeps_backends_apart(self):
+        xrates.enable_cache()
+        self.assertEqual(xrates.quotation('XXX', 'AAA'), Decimal('2'))
+        with xrates.using(self.other):
+            self.assertEqual(xrates.quotation('XXX', 'AAA'), Decimal('4'))
+        self.assertEqual(xrates.quotation('XXX', 'AAA'), Decimal('2'))
+
+    def test_invalid_backend(self):
+        with self.assertRaises(TypeError):
+            with xrates.using(object()):
+                pass
+
+    def test_isolated_between_threads(self):
+        rates = []
+        entered = threading.Event()
+        done = threading.Event()
+
+        def worker():
+            entered.wait()
+            rates.append(xrates.rate('AAA'))
+            done.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        with xrates.using(self.other):
+            entered.set()
+            done.wait()
+        thread.join()
+        self.assertEqual(rates, [Decimal('2')])
+
+
 class ConversionMixin(object):
     def test_unavailable_backend_conversion_error(self):
         xrates.uninstall()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Cached formatters unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import, unicode_literals
+
+from decimal import Decimal
+import io
+import unittest
+
+import babel.numbers
+
+from money import IntMoney, Money, MoneyArray
+from money.formatting import MoneyFormatter, format_many, get_formatter
+
+
+AMOUNTS = ['0', '-0', '1234.567', '-1234.565', '0.005', '1E+20', '123',
+           '-0.00001', '12345678901234.5']
+
+
+class TestMoneyFormatter(unittest.TestCase):
+    def assertBabelEqual(self, currency, locale, pattern=None,
+                         currency_digits=True, format_type='standard'):
+        formatter = MoneyFormatter(locale, pattern, currency_digits,
+                                   format_type)
+        for amount in map(Decimal, AMOUNTS):
+            self.assertEqual(
+                formatter.format_amount(amount, currency),
+                babel.numbers.format_currency(
+                    amount, currency, format=pattern, locale=locale,
+                    currency_digits=currency_digits,
+                    format_type=format_type))
+
+    def test_locales(self):
+        for locale in ('en_US', 'de_DE', 'fr_FR', 'de_CH', 'hi_IN', 'ar_EG'):
+            for currency in ('EUR', 'JPY', 'BHD', 'XXX'):
+                self.assertBabelEqual(currency, locale)
+                self.assertBabelEqual(currency, locale,
+                                      format_type='accounting')
+
+    def test_patterns(self):
+        for pattern in ('¤#,##0.00;(¤#,##0.00)', '#,##0 ¤', '#,##0.00 ¤¤',
+                        '¤000000.00', '#,##,##0.00¤', "'x' ¤#,##0.00"):
+            self.assertBabelEqual('USD', 'en_US', pattern)
+            self.assertBabelEqual('USD', 'de_DE', pattern,
+                                  currency_digits=False)
+
+    def test_babel_patterns(self):
+        for pattern in ('#,##0.00 ¤¤¤', '0.###E0 ¤', '@@@ ¤', '#,##0 %'):
+            self.assertBabelEqual('EUR', 'en_US', pattern,
+                                  currency_digits=False)
+        self.assertBabelEqual('EUR', 'en_US', format_type='name')
+
+    def test_format(self):
+        formatter = MoneyFormatter('de_DE')
+        self.assertEqual(formatter.format(Money('-1234.567', 'EUR')),
+                         '-1.234,57\xa0€')
+
+    def test_unknown_format_type(self):
+        with self.assertRaises(babel.numbers.UnknownCurrencyFormatError):
+            MoneyFormatter('en_US', format_type='unknown')
+
+    def test_get_formatter_cached(self):
+        formatter = get_formatter('en_US', '¤#,##0.00')
+        self.assertIs(get_formatter('en_US', '¤#,##0.00'), formatter)
+        self.assertIsNot(get_formatter('en_US', '¤#,##0.00', False),
+                         formatter)
+
+
+class TestFormatMany(unittest.TestCase):
+    def setUp(self):
+        self.values = [Money('1234.5', 'EUR'), Money('-2', 'USD'),
+                       IntMoney('3', 'JPY'), Money('0.5', 'EUR')]
+
+    def test_format_many(self):
+        self.assertEqual(format_many(self.values, 'de_DE'),
+                         [value.format('de_DE') for value in self.values])
+
+    def test_pattern(self):
+        self.assertEqual(format_many(self.values, 'en_US', '¤#,##0.00'),
+                         ['€1,234.50', '-$2.00', '¥3', '€0.50'])
+
+    def test_empty(self):
+        self.assertEqual(format_many([], 'en_US'), [])
+
+    def test_array(self):
+        values = MoneyArray(['1234.5', '-0.125'], 'EUR')
+        self.assertEqual(format_many(values, 'en_US'),
+                         ['€1,234.50', '-€0.12'])
+
+    def test_stream(self):
+        stream = io.StringIO()
+        self.assertEqual(format_many(self.values, 'en_US', fileobj=stream), 4)
+        self.assertEqual(stream.getvalue(),
+                         '€1,234.50\n-$2.00\n¥3\n€0.50\n')
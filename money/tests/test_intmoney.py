@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+IntMoney class unittests
+"""
+from decimal import Decimal
+import decimal
+import unittest
+
+from money import Money, IntMoney, xrates
+from money.currency import get_currency
+from money.exceptions import CurrencyMismatch, InvalidOperandType
+from . import mixins
+
+
+class TestIntMoneyClass(mixins.ClassMixin, unittest.TestCase):
+    def setUp(self):
+        self.money = IntMoney('2.99', 'XXX')
+
+
+class TestIntMoneyInstantiation(unittest.TestCase):
+    def test_units(self):
+        self.assertEqual(IntMoney('2.99', 'EUR').units, 299)
+        self.assertEqual(IntMoney('2', 'JPY').units, 2)
+        self.assertEqual(IntMoney('2.5', 'KWD').units, 2500)
+    
+    def test_amount(self):
+        self.assertEqual(IntMoney('2.5', 'EUR').amount, Decimal('2.50'))
+        self.assertEqual(repr(IntMoney('2.5', 'EUR')), 'EUR 2.50')
+    
+    def test_too_many_places(self):
+        with self.assertRaises(ValueError):
+            IntMoney('2.999', 'EUR')
+        with self.assertRaises(ValueError):
+            IntMoney('2.5', 'JPY')
+    
+    def test_exact(self):
+        amount = '12345678901234567890123456789.01'
+        money = IntMoney(amount, 'EUR')
+        self.assertEqual(money.units, 1234567890123456789012345678901)
+        self.assertEqual(str(money.amount), amount)
+        money = IntMoney._from_trusted(Decimal(amount), money.currency)
+        self.assertEqual(money.units, 1234567890123456789012345678901)
+    
+    def test_non_finite(self):
+        for amount in ('Infinity', '-Infinity', 'NaN'):
+            with self.assertRaises(ValueError) as context:
+                IntMoney(amount, 'EUR')
+            self.assertIn('non-finite', str(context.exception))
+            with self.assertRaises(ValueError):
+                IntMoney._from_trusted(Decimal(amount), get_currency('EUR'))
+    
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            IntMoney('twenty', 'EUR')
+        with self.assertRaises(ValueError):
+            IntMoney('2', 'eur')
+
+
+class TestIntMoneyOperations(unittest.TestCase):
+    def setUp(self):
+        self.a = IntMoney('2.50', 'EUR')
+        self.b = IntMoney('1.25', 'EUR')
+    
+    def test_add_sub(self):
+        self.assertEqual((self.a + self.b).units, 375)
+        self.assertEqual((self.a - self.b).units, 125)
+        self.assertEqual((self.a + 1).units, 350)
+        self.assertEqual((1 - self.a).units, -150)
+        self.assertEqual(sum([self.a, self.b]), IntMoney('3.75', 'EUR'))
+        self.assertIsInstance(self.a + self.b, IntMoney)
+    
+    def test_add_money(self):
+        self.assertEqual(self.a + Money('0.5', 'EUR'), IntMoney('3', 'EUR'))
+        self.assertIsInstance(self.a + Money('0.5', 'EUR'), IntMoney)
+    
+    def test_add_different_currency(self):
+        with self.assertRaises(CurrencyMismatch):
+            self.a + IntMoney(1, 'USD')
+    
+    def test_unary(self):
+        self.assertEqual((-self.a).units, -250)
+        self.assertEqual(abs(-self.a).units, 250)
+        self.assertEqual((+self.a).units, 250)
+        self.assertIsNot(+self.a, self.a)
+    
+    def test_comparisons(self):
+        self.assertTrue(self.b < self.a)
+        self.assertTrue(self.a <= self.a)
+        self.assertTrue(self.a > self.b)
+        self.assertTrue(self.a >= Money('2.5', 'EUR'))
+        self.assertFalse(IntMoney(0, 'EUR'))
+        with self.assertRaises(InvalidOperandType):
+            self.a < 2
+        with self.assertRaises(CurrencyMismatch):
+            self.a < IntMoney(1, 'USD')
+    
+    def test_eq_money(self):
+        self.assertEqual(self.a, Money('2.5', 'EUR'))
+        self.assertEqual(Money('2.5', 'EUR'), self.a)
+        self.assertEqual(hash(self.a), hash(Money('2.5', 'EUR')))
+        self.assertNotEqual(self.a, IntMoney('2.5', 'USD'))
+    
+    def test_decimal_results_are_rounded(self):
+        self.assertEqual(self.a / 3, IntMoney('0.83', 'EUR'))
+        self.assertEqual(self.a * Decimal('0.5'), IntMoney('1.25', 'EUR'))
+        self.assertEqual(self.a * Decimal('0.3'), IntMoney('0.75', 'EUR'))
+        with decimal.localcontext() as ctx:
+            ctx.rounding = decimal.ROUND_UP
+            self.assertEqual(self.a / 3, IntMoney('0.84', 'EUR'))
+    
+    def test_truediv_money(self):
+        self.assertEqual(self.a / self.b, Decimal('2'))
+    
+    def test_conversion(self):
+        xrates.install('money.exchange.SimpleBackend')
+        try:
+            xrates.base = 'EUR'
+            xrates.setrate('JPY', Decimal('160.123'))
+            converted = self.a.to('JPY')
+            self.assertIsInstance(converted, IntMoney)
+            self.assertEqual(converted.units, 400)
+        finally:
+            xrates.uninstall()
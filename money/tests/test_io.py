@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Money streaming parser and writer unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import io
+import unittest
+
+from money import IntMoney, Money, XMoney
+from money.exceptions import ParseError
+from money.io import dump_many, iter_loads, load_arrays
+
+
+TEXT = u"""EUR 2.99
+USD -10
+
+EUR 0.01
+"""
+
+
+class TestIterLoads(unittest.TestCase):
+    def test_loads(self):
+        values = list(iter_loads(io.StringIO(TEXT)))
+        self.assertEqual(values, [Money('2.99', 'EUR'), Money('-10', 'USD'),
+                                  Money('0.01', 'EUR')])
+
+    def test_loads_class(self):
+        values = list(iter_loads(io.StringIO(TEXT), cls=XMoney))
+        self.assertTrue(all(type(value) is XMoney for value in values))
+
+    def test_small_chunks(self):
+        values = list(iter_loads(io.StringIO(TEXT), chunksize=1))
+        self.assertEqual(len(values), 3)
+
+    def test_invalid_line_raises(self):
+        lines = iter_loads(io.StringIO(u"EUR 1\nEUR\nEUR 2\n"))
+        self.assertEqual(next(lines), Money(1, 'EUR'))
+        with self.assertRaises(ParseError) as context:
+            next(lines)
+        self.assertEqual(context.exception.lineno, 2)
+        self.assertEqual(context.exception.line, 'EUR')
+
+    def test_onerror_continues(self):
+        text = u"EUR 1\n2.99 EUR\neur 1\nEUR twenty\nEUR 1 2\nEUR 2\n"
+        errors = []
+        values = list(iter_loads(io.StringIO(text), onerror=errors.append))
+        self.assertEqual(values, [Money(1, 'EUR'), Money(2, 'EUR')])
+        self.assertEqual([error.lineno for error in errors], [2, 3, 4, 5])
+        self.assertTrue(all(isinstance(error, ValueError) for error in errors))
+
+    def test_intmoney_rejects_extra_places(self):
+        text = u"EUR 1.005\nJPY 1.5\nEUR 1.01\n"
+        errors = []
+        values = list(iter_loads(io.StringIO(text), cls=IntMoney,
+                                 onerror=errors.append))
+        self.assertEqual(values, [IntMoney('1.01', 'EUR')])
+        self.assertEqual([error.lineno for error in errors], [1, 2])
+        with self.assertRaises(ParseError):
+            list(iter_loads(io.StringIO(text), cls=IntMoney))
+
+
+class TestLoadArrays(unittest.TestCase):
+    def test_load_arrays(self):
+        arrays = load_arrays(io.StringIO(TEXT))
+        self.assertEqual(sorted(arrays), ['EUR', 'USD'])
+        self.assertEqual(arrays['EUR'].tolist(), [Money('2.99', 'EUR'),
+                                                  Money('0.01', 'EUR')])
+        self.assertEqual(arrays['USD'].sum(), Money('-10', 'USD'))
+
+    def test_load_arrays_onerror(self):
+        errors = []
+        arrays = load_arrays(io.StringIO(u"EUR 1\nbad\n"),
+                             onerror=errors.append)
+        self.assertEqual(len(arrays['EUR']), 1)
+        self.assertEqual(errors[0].lineno, 2)
+
+    def test_load_arrays_invalid_amounts(self):
+        text = (u"EUR 1\nEUR NaN\nEUR Infinity\nEUR 1E+30\n"
+                u"USD 92233720368547758.07\nUSD 0.001\nEUR 0.001\n")
+        errors = []
+        arrays = load_arrays(io.StringIO(text), onerror=errors.append)
+        self.assertEqual([error.lineno for error in errors], [2, 3, 4, 6])
+        self.assertEqual(arrays['EUR'].tolist(), [Money('1', 'EUR'),
+                                                  Money('0.001', 'EUR')])
+        self.assertEqual(len(arrays['USD']), 1)
+        with self.assertRaises(ParseError) as context:
+            load_arrays(io.StringIO(text))
+        self.assertEqual(context.exception.lineno, 2)
+
+    def test_load_arrays_places(self):
+        arrays = load_arrays(io.StringIO(u"EUR 1.00\nEUR 2.00\nJPY 5.0\n"))
+        self.assertEqual(arrays['EUR'].places, 2)
+        self.assertEqual(arrays['JPY'].places, 1)
+        self.assertEqual(str(arrays['EUR'][0].amount), '1.00')
+
+
+class TestDumpMany(unittest.TestCase):
+    def test_roundtrip(self):
+        values = [Money('2.99', 'EUR'), Money('-10', 'USD')] * 100
+        out = io.StringIO()
+        self.assertEqual(dump_many(values, out, chunksize=64), 200)
+        out.seek(0)
+        self.assertEqual(list(iter_loads(out)), values)
+
+    def test_dump_repr(self):
+        out = io.StringIO()
+        dump_many([Money('2.99', 'EUR')], out)
+        self.assertEqual(out.getvalue(), u'EUR 2.99\n')
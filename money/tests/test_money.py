@@ -2,9 +2,17 @@
 """
 Money class unittests
 """
+from decimal import Decimal
+import operator
+import os
+import pickle
+import subprocess
+import sys
 import unittest
 
-from money import Money
+import money.money
+from money import IntMoney, Money, MoneyArray, XMoney
+from money.currency import get_currency
 from . import mixins
 
 
@@ -51,3 +59,97 @@ class TestMoneyLeftmostTypePrevails(mixins.LeftmostTypePrevailsMixin, unittest.T
         self.other_money = self.MoneySubclass('2.99', 'XXX')
 
 
+class TestMoneyTrustedConstructor(unittest.TestCase):
+    def test_from_trusted(self):
+        money = Money._from_trusted(Decimal('2.99'), get_currency('XXX'))
+        self.assertEqual(money, Money('2.99', 'XXX'))
+    
+    def test_operations_skip_init(self):
+        class EUR(Money):
+            def __init__(self, amount='0'):
+                super(EUR, self).__init__(amount, 'EUR')
+        
+        result = abs(-EUR('2') * 2 + EUR('1'))
+        self.assertEqual(result.__class__, EUR)
+        self.assertEqual(result, Money('3', 'EUR'))
+    
+    def test_other_operand_types(self):
+        money = Money('2', 'EUR')
+        for other in (MoneyArray(['1', '2'], 'EUR'), 1.5, '1', None):
+            result = None
+            for operation in (operator.add, operator.sub, operator.mul,
+                              operator.truediv, operator.floordiv,
+                              operator.mod, divmod, pow):
+                try:
+                    result = operation(money, other)
+                except TypeError:
+                    continue
+                self.assertNotIsInstance(result, Money)
+                self.assertFalse(isinstance(result, tuple) and
+                                 isinstance(result[0], Money))
+        self.assertEqual(money + MoneyArray(['1', '2'], 'EUR'),
+                         MoneyArray(['3', '4'], 'EUR'))
+
+
+class DictMoney(Money):
+    pass
+
+
+class TestMoneySlots(unittest.TestCase):
+    def test_subclass_keeps_dict(self):
+        money = DictMoney('2.99', 'XXX')
+        money.note = 'extra'
+        copied = pickle.loads(pickle.dumps(money))
+        self.assertEqual(copied, money)
+        self.assertEqual(copied.note, 'extra')
+    
+    def test_setstate_legacy_dict(self):
+        money = Money.__new__(Money)
+        money.__setstate__({'_amount': Decimal('2.99'), '_currency': 'XXX'})
+        self.assertEqual(money, Money('2.99', 'XXX'))
+        self.assertIs(money.currency, get_currency('XXX'))
+
+    def test_setstate_legacy_tuple(self):
+        money = Money.__new__(Money)
+        money.__setstate__((Decimal('2.99'), 'XXX'))
+        self.assertEqual(money, Money('2.99', 'XXX'))
+
+
+class TestMoneyPickle(unittest.TestCase):
+    def test_reduce_compact(self):
+        reduced = Money('-1234.50', 'EUR').__reduce__()
+        self.assertEqual(reduced[1], (Money, 'EUR', -123450, -2))
+        reduced = IntMoney('1.05', 'CHF').__reduce__()
+        self.assertEqual(reduced[1], (IntMoney, 'CHF', 105, -2))
+
+    def test_roundtrip_exact(self):
+        for amount in ('1234.50', '-0.00', '1E+5', '1' * 40 + '.5', 'NaN',
+                       '-Infinity'):
+            money = pickle.loads(pickle.dumps(Money(amount, 'EUR')))
+            self.assertEqual(str(money.amount), amount)
+            self.assertIs(money.currency, get_currency('EUR'))
+
+    def test_keeps_class(self):
+        for cls in (Money, XMoney, IntMoney):
+            money = pickle.loads(pickle.dumps(cls('1.05', 'CHF')))
+            self.assertIs(type(money), cls)
+            self.assertEqual(money, cls('1.05', 'CHF'))
+
+
+class TestLazyBabel(unittest.TestCase):
+    # Module __getattr__ is only available in Python 3.7+
+    @unittest.skipIf(sys.version_info < (3, 7),
+                     "babel is imported on import before Python 3.7")
+    def test_import_without_babel(self):
+        path = os.path.dirname(os.path.dirname(money.__file__))
+        code = ("import sys, money; "
+                "print('babel' in sys.modules)")
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         cwd=path)
+        self.assertEqual(output.strip(), b'False')
+    
+    def test_babel_attributes(self):
+        self.assertIs(money.money.BABEL_AVAILABLE, True)
+        self.assertGreaterEqual(money.money.BABEL_VERSION, (2, 2))
+        with self.assertRaises(AttributeError):
+            money.money.UNKNOWN
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+MultiMoney unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+from decimal import Decimal
+import pickle
+import unittest
+
+from money import Money, MultiMoney, XMoney, xrates
+from money.exceptions import (CurrencyMismatch, ExchangeRateNotFound,
+                              InvalidOperandType)
+from money.exchange import SimpleBackend
+
+
+class CountingBackend(SimpleBackend):
+    def __init__(self):
+        super(CountingBackend, self).__init__()
+        self.quotations = 0
+
+    def quotation(self, origin, target):
+        self.quotations += 1
+        return super(CountingBackend, self).quotation(origin, target)
+
+
+class TestMultiMoney(unittest.TestCase):
+    def setUp(self):
+        self.wallet = MultiMoney([Money('1.50', 'EUR'), Money(2, 'USD'),
+                                  Money('0.50', 'EUR')])
+
+    def test_init(self):
+        self.assertEqual(self.wallet.currencies, ['EUR', 'USD'])
+        self.assertEqual(len(self.wallet), 2)
+        self.assertEqual(list(self.wallet), [Money(2, 'EUR'),
+                                             Money(2, 'USD')])
+        self.assertEqual(MultiMoney().currencies, [])
+
+    def test_getitem(self):
+        self.assertEqual(self.wallet['EUR'], Money(2, 'EUR'))
+        self.assertEqual(self.wallet['GBP'], Money(0, 'GBP'))
+
+    def test_repr(self):
+        self.assertEqual(repr(self.wallet), "MultiMoney(EUR 2.00, USD 2)")
+
+    def test_add(self):
+        result = self.wallet + Money(1, 'GBP') + XMoney(1, 'EUR')
+        self.assertEqual(list(result), [Money(3, 'EUR'), Money(1, 'GBP'),
+                                        Money(2, 'USD')])
+        self.assertEqual(self.wallet['EUR'], Money(2, 'EUR'))
+        self.assertEqual(self.wallet + self.wallet, self.wallet * 2)
+
+    def test_sum(self):
+        values = [Money(1, 'EUR'), XMoney(2, 'USD'), Money(3, 'EUR')]
+        self.assertEqual(sum(values, MultiMoney()), MultiMoney(values))
+        self.assertEqual(sum([self.wallet, self.wallet]), self.wallet * 2)
+
+    def test_reflected(self):
+        self.assertEqual(Money(1, 'GBP') + self.wallet,
+                         self.wallet + Money(1, 'GBP'))
+        self.assertEqual(XMoney(1, 'EUR') + self.wallet,
+                         self.wallet + Money(1, 'EUR'))
+        self.assertEqual(list(Money(1, 'EUR') - self.wallet),
+                         [Money(-1, 'EUR'), Money(-2, 'USD')])
+
+    def test_sub(self):
+        result = self.wallet - Money(2, 'EUR') - Money(1, 'GBP')
+        self.assertEqual(result['EUR'], Money(0, 'EUR'))
+        self.assertEqual(result['GBP'], Money(-1, 'GBP'))
+        self.assertFalse(self.wallet - self.wallet)
+        self.assertEqual(self.wallet - self.wallet, MultiMoney())
+
+    def test_mul_neg(self):
+        self.assertEqual(list(self.wallet * Decimal('1.5')),
+                         [Money(3, 'EUR'), Money(3, 'USD')])
+        self.assertEqual(3 * self.wallet, self.wallet * 3)
+        self.assertEqual(list(-self.wallet), [Money(-2, 'EUR'),
+                                              Money(-2, 'USD')])
+        with self.assertRaises(TypeError):
+            self.wallet * Money(1, 'EUR')
+
+    def test_invalid_operands(self):
+        with self.assertRaises(TypeError):
+            self.wallet + 1
+        with self.assertRaises(TypeError):
+            self.wallet + Decimal(0)
+        with self.assertRaises(InvalidOperandType):
+            MultiMoney([Decimal(1)])
+
+    def test_equality(self):
+        self.assertEqual(self.wallet, MultiMoney([Money(2, 'EUR'),
+                                                  Money(2, 'USD'),
+                                                  Money(0, 'GBP')]))
+        self.assertNotEqual(self.wallet, MultiMoney([Money(2, 'EUR')]))
+        self.assertNotEqual(MultiMoney([Money(2, 'EUR')]), Money(2, 'EUR'))
+        self.assertEqual(hash(self.wallet),
+                         hash(self.wallet + Money(0, 'GBP')))
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.wallet)), self.wallet)
+
+
+class TestMultiMoneyConversion(unittest.TestCase):
+    def setUp(self):
+        self.backend = CountingBackend()
+        self.backend.base = 'USD'
+        self.backend.setrate('EUR', Decimal('0.5'))
+        self.backend.setrate('GBP', Decimal('0.25'))
+        self.using = xrates.using(self.backend)
+        self.using.__enter__()
+
+    def tearDown(self):
+        self.using.__exit__(None, None, None)
+
+    def test_to(self):
+        wallet = MultiMoney([Money(1, 'EUR'), Money(1, 'GBP'),
+                             Money(1, 'USD')])
+        self.assertEqual(wallet.to('USD'), Money(7, 'USD'))
+        self.assertEqual(wallet.to('EUR'), Money('3.5', 'EUR'))
+        self.assertIs(type(wallet.to('EUR')), Money)
+
+    def test_one_quotation_per_currency(self):
+        values = [Money(1, ('EUR', 'GBP', 'USD')[i % 3]) for i in range(300)]
+        self.assertEqual(MultiMoney(values).to('USD'), Money(700, 'USD'))
+        self.assertEqual(self.backend.quotations, 2)
+
+    def test_total(self):
+        self.assertEqual(MultiMoney([Money(1, 'EUR')]).total(),
+                         Money(1, 'EUR'))
+        wallet = MultiMoney([Money(1, 'EUR'), Money(1, 'USD')])
+        self.assertEqual(wallet.total('USD'), Money(3, 'USD'))
+        with self.assertRaises(CurrencyMismatch):
+            wallet.total()
+        with self.assertRaises(ValueError):
+            MultiMoney().total()
+        self.assertEqual(MultiMoney().total('EUR'), Money(0, 'EUR'))
+
+    def test_rate_not_found(self):
+        with self.assertRaises(ExchangeRateNotFound):
+            MultiMoney([Money(1, 'JPY')]).to('USD')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel aggregation unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+from decimal import Decimal
+import unittest
+
+# RADAR: Python2
+import money.six
+
+from money import Money, XMoney, xrates
+from money.codec import pack_many
+from money.exceptions import CurrencyMismatch, ExchangeRateNotFound
+from money.exchange import SimpleBackend
+
+# RADAR: Python2
+if not money.six.PY2:
+    import concurrent.futures
+    from money.parallel import pconvert, pgroupby_currency_sum, psum
+
+
+def _values():
+    currencies = ('EUR', 'USD', 'JPY')
+    return [Money(Decimal(i) / 100, currencies[i % 3]) for i in range(1000)]
+
+
+@unittest.skipIf(money.six.PY2, "concurrent.futures requires Python 3.2+")
+class ParallelTestCase(unittest.TestCase):
+    def setUp(self):
+        self.executor = concurrent.futures.ThreadPoolExecutor(4)
+        backend = SimpleBackend()
+        backend.base = 'USD'
+        backend.setrate('EUR', Decimal('0.9'))
+        backend.setrate('JPY', Decimal('150'))
+        self.using = xrates.using(backend)
+        self.using.__enter__()
+
+    def tearDown(self):
+        self.using.__exit__(None, None, None)
+        self.executor.shutdown()
+
+
+class TestGroupbyCurrencySum(ParallelTestCase):
+    def test_same_as_serial(self):
+        values = _values()
+        expected = {}
+        for value in values:
+            expected[value.currency] = (expected.get(value.currency, 0) +
+                                        value.amount)
+        for chunksize in (1, 7, 1000, 5000):
+            totals = pgroupby_currency_sum(values, chunksize=chunksize,
+                                           executor=self.executor)
+            self.assertEqual(list(totals), ['EUR', 'JPY', 'USD'])
+            self.assertEqual(totals, dict((currency, Money(amount, currency))
+                                          for currency, amount
+                                          in expected.items()))
+
+    def test_buffer(self):
+        values = _values()
+        for buffer in (pack_many(values), bytearray(pack_many(values))):
+            self.assertEqual(
+                pgroupby_currency_sum(buffer, chunksize=64,
+                                      executor=self.executor),
+                pgroupby_currency_sum(values, executor=self.executor))
+
+    def test_exact(self):
+        values = [Money('1' * 18, 'EUR')] * 1000 + [Money('0.01', 'EUR')]
+        total = pgroupby_currency_sum(values, chunksize=3,
+                                      executor=self.executor)['EUR']
+        self.assertEqual(total.amount, Decimal('1' * 18) * 1000 +
+                         Decimal('0.01'))
+
+    def test_unpackable_values(self):
+        values = [Money('1' * 30, 'EUR'), Money('1', 'EUR')]
+        total = pgroupby_currency_sum(values, executor=self.executor)['EUR']
+        self.assertEqual(total.amount, Decimal('1' * 29 + '2'))
+
+    def test_class(self):
+        totals = pgroupby_currency_sum(_values(), executor=self.executor,
+                                       cls=XMoney)
+        self.assertTrue(all(type(total) is XMoney
+                            for total in totals.values()))
+
+    def test_empty(self):
+        self.assertEqual(pgroupby_currency_sum([], executor=self.executor),
+                         {})
+
+    def test_invalid_buffer(self):
+        with self.assertRaises(ValueError):
+            pgroupby_currency_sum(b'EUR', executor=self.executor)
+
+
+class TestPsum(ParallelTestCase):
+    def test_psum(self):
+        values = [Money(i, 'EUR') for i in range(100)]
+        self.assertEqual(psum(values, chunksize=8, executor=self.executor),
+                         Money(4950, 'EUR'))
+
+    def test_mixed_currencies(self):
+        with self.assertRaises(CurrencyMismatch):
+            psum(_values(), executor=self.executor)
+
+    def test_currency(self):
+        values = [Money(90, 'EUR'), Money(150, 'JPY'), Money(1, 'USD')]
+        self.assertEqual(psum(values, 'USD', executor=self.executor),
+                         Money(102, 'USD'))
+
+    def test_empty(self):
+        self.assertEqual(psum([], 'EUR', executor=self.executor),
+                         Money(0, 'EUR'))
+        with self.assertRaises(ValueError):
+            psum([], executor=self.executor)
+
+
+class TestPconvert(ParallelTestCase):
+    def test_same_as_convert_many(self):
+        values = _values()
+        expected = xrates.convert_many(values, 'EUR')
+        self.assertEqual(pconvert(values, 'EUR', chunksize=64,
+                                  executor=self.executor), expected)
+        self.assertEqual(pconvert(pack_many(values), 'EUR', chunksize=64,
+                                  executor=self.executor), expected)
+
+    def test_rate_not_found(self):
+        with self.assertRaises(ExchangeRateNotFound):
+            pconvert([Money(1, 'GBP')], 'EUR', executor=self.executor)
+
+
+class TestProcessPool(ParallelTestCase):
+    def test_process_pool(self):
+        values = _values()
+        buffer = pack_many(values)
+        self.assertEqual(
+            pgroupby_currency_sum(buffer, max_workers=2, chunksize=100),
+            pgroupby_currency_sum(values, executor=self.executor))
+        self.assertEqual(pconvert(buffer, 'EUR', max_workers=2,
+                                  chunksize=100),
+                         xrates.convert_many(values, 'EUR'))
+
+
+if __name__ == '__main__':
+    unittest.main()
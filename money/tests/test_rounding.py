@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Money rounding unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import decimal
+from decimal import Decimal
+import unittest
+
+from money import IntMoney, Money, XMoney
+from money.exceptions import InvalidOperandType
+from money.rounding import get_quantizer, quantize_many
+
+
+class TestQuantize(unittest.TestCase):
+    def test_minor_unit(self):
+        self.assertEqual(Money('1.234', 'EUR').quantize(),
+                         Money('1.23', 'EUR'))
+        self.assertEqual(Money('1.5', 'JPY').quantize(), Money('2', 'JPY'))
+        self.assertEqual(Money('1.2345', 'BHD').quantize(),
+                         Money('1.234', 'BHD'))
+
+    def test_exponent(self):
+        self.assertEqual(Money('2', 'EUR').quantize().amount.as_tuple(),
+                         Decimal('2.00').as_tuple())
+
+    def test_context_rounding(self):
+        with decimal.localcontext() as context:
+            context.rounding = decimal.ROUND_HALF_EVEN
+            self.assertEqual(Money('2.345', 'EUR').quantize(),
+                             Money('2.34', 'EUR'))
+            context.rounding = decimal.ROUND_HALF_UP
+            self.assertEqual(Money('2.345', 'EUR').quantize(),
+                             Money('2.35', 'EUR'))
+
+    def test_rounding(self):
+        value = Money('-2.345', 'EUR')
+        self.assertEqual(value.quantize(decimal.ROUND_HALF_UP),
+                         Money('-2.35', 'EUR'))
+        self.assertEqual(value.quantize(decimal.ROUND_FLOOR),
+                         Money('-2.35', 'EUR'))
+        self.assertEqual(value.quantize(decimal.ROUND_DOWN),
+                         Money('-2.34', 'EUR'))
+
+    def test_invalid_rounding(self):
+        with self.assertRaises(TypeError):
+            Money('1', 'EUR').quantize('ROUND_SIDEWAYS')
+
+    def test_cash(self):
+        self.assertEqual(Money('1.03', 'CHF').quantize(cash=True),
+                         Money('1.05', 'CHF'))
+        self.assertEqual(Money('1.02', 'CHF').quantize(cash=True),
+                         Money('1.00', 'CHF'))
+        self.assertEqual(Money('-2.625', 'CHF').quantize(
+            decimal.ROUND_HALF_UP, cash=True), Money('-2.65', 'CHF'))
+        self.assertEqual(Money('12.26', 'DKK').quantize(cash=True),
+                         Money('12.50', 'DKK'))
+        self.assertEqual(Money('1234.56', 'SEK').quantize(cash=True),
+                         Money('1235', 'SEK'))
+
+    def test_cash_without_increment(self):
+        self.assertEqual(Money('1.234', 'EUR').quantize(cash=True),
+                         Money('1.23', 'EUR'))
+
+    def test_large_amount(self):
+        amount = '1' * 40 + '.5'
+        self.assertEqual(Money(amount, 'EUR').quantize().amount,
+                         Decimal(amount))
+
+    def test_keeps_class(self):
+        self.assertIsInstance(XMoney('1.234', 'EUR').quantize(), XMoney)
+        value = IntMoney('1.03', 'CHF').quantize(cash=True)
+        self.assertIsInstance(value, IntMoney)
+        self.assertEqual(value.units, 105)
+
+    def test_non_finite(self):
+        with self.assertRaises(decimal.InvalidOperation):
+            Money('Infinity', 'EUR').quantize()
+
+
+class TestQuantizeMany(unittest.TestCase):
+    def test_quantize_many(self):
+        values = [Money('1.234', 'EUR'), Money('1.03', 'CHF'),
+                  XMoney('1.5', 'JPY')]
+        self.assertEqual(quantize_many(values, cash=True),
+                         [Money('1.23', 'EUR'), Money('1.05', 'CHF'),
+                          XMoney('2', 'JPY')])
+        self.assertIsInstance(quantize_many(values)[2], XMoney)
+
+    def test_same_as_quantize(self):
+        values = [Money(Decimal(i) / 7, currency)
+                  for i in range(100) for currency in ('EUR', 'CHF', 'JPY')]
+        for rounding in (decimal.ROUND_HALF_UP, decimal.ROUND_CEILING):
+            self.assertEqual(quantize_many(values, rounding, cash=True),
+                             [value.quantize(rounding, cash=True)
+                              for value in values])
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidOperandType):
+            quantize_many([Money('1', 'EUR'), Decimal('1')])
+
+    def test_get_quantizer(self):
+        quantize = get_quantizer('CHF', decimal.ROUND_HALF_UP, cash=True)
+        self.assertEqual(quantize(Decimal('0.025')), Decimal('0.05'))
+        self.assertIs(quantize, get_quantizer('CHF', decimal.ROUND_HALF_UP,
+                                              cash=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Memory-mapped rates store unittests
+"""
+# RADAR: Python2
+from __future__ import absolute_import
+
+import datetime
+from decimal import Decimal
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from money import Money, xrates
+from money.store import MappedBackend, compile_csv, main, write_store
+
+
+POINTS = [
+    ('AAA', datetime.date(2024, 1, 1), Decimal('2')),
+    ('AAA', datetime.date(2024, 1, 3), Decimal('4')),
+    ('BBB', datetime.datetime(2024, 1, 2, 12), Decimal('0.125')),
+    ('AAA', datetime.date(2024, 1, 3), Decimal('4.5')),
+]
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'rates.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open_backend(self, points=POINTS):
+        with open(self.path, 'wb') as fileobj:
+            write_store(fileobj, 'XXX', points)
+        backend = MappedBackend(self.path)
+        self.addCleanup(backend.close)
+        return backend
+
+
+class TestMappedBackend(StoreTestCase):
+    def test_write_store(self):
+        with open(self.path, 'wb') as fileobj:
+            self.assertEqual(write_store(fileobj, 'XXX', POINTS), 3)
+
+    def test_base(self):
+        self.assertEqual(self.open_backend().base, 'XXX')
+
+    def test_rate_as_of(self):
+        backend = self.open_backend()
+        self.assertIsNone(backend.rate('AAA', datetime.date(2023, 12, 31)))
+        self.assertEqual(backend.rate('AAA', datetime.date(2024, 1, 2)),
+                         Decimal('2'))
+        self.assertEqual(backend.rate('AAA', datetime.datetime(2024, 1, 3)),
+                         Decimal('4.5'))
+        self.assertEqual(backend.rate('XXX', 0), Decimal('1'))
+        self.assertIsNone(backend.rate('ZZZ', 0))
+
+    def test_latest_rate(self):
+        backend = self.open_backend()
+        self.assertEqual(backend.rate('AAA'), Decimal('4.5'))
+        self.assertEqual(backend.rate('BBB'), Decimal('0.125'))
+
+    def test_rates(self):
+        backend = self.open_backend()
+        days = [datetime.date(2024, 1, day) for day in (1, 2, 3)]
+        expected = [Decimal('2'), Decimal('2'), Decimal('4.5')]
+        self.assertEqual(backend.rates('AAA', days), expected)
+        self.assertEqual(backend.rates('AAA', days[::-1]), expected[::-1])
+
+    def test_large_and_negative_exponents(self):
+        backend = self.open_backend([('AAA', 1, Decimal('1E+20')),
+                                     ('BBB', 1, Decimal('0.000000001'))])
+        self.assertEqual(backend.rate('AAA'), Decimal('1E+20'))
+        self.assertEqual(backend.rate('BBB'), Decimal('0.000000001'))
+
+    def test_long_rates_rounded(self):
+        third = Decimal(1) / Decimal(3)
+        self.assertEqual(len(third.as_tuple().digits), 28)
+        backend = self.open_backend([
+            ('AAA', 1, third), ('BBB', 1, Decimal('1.2345678901234567891')),
+            ('CCC', 1, Decimal('1.10000000000000000000000000'))])
+        self.assertEqual(backend.rate('AAA'), Decimal('0.' + '3' * 18))
+        self.assertEqual(backend.rate('BBB'), Decimal('1.23456789012345679'))
+        self.assertEqual(backend.rate('CCC'), Decimal('1.1'))
+
+    def test_rate_out_of_range(self):
+        for rate in (Decimal('1E+200'), Decimal('NaN')):
+            with open(self.path, 'wb') as fileobj:
+                with self.assertRaises(ValueError):
+                    write_store(fileobj, 'XXX', [('AAA', 1, rate)])
+
+    def test_conversions(self):
+        xrates.install(self.open_backend())
+        self.addCleanup(xrates.uninstall)
+        self.assertEqual(Money('1', 'AAA').to('BBB', at=datetime.date(
+            2024, 1, 3)), Money('0.125', 'BBB') / Decimal('4.5'))
+        result = xrates.convert_many(
+            [Money('2', 'AAA'), Money('9', 'AAA')], 'XXX',
+            at=[datetime.date(2024, 1, 1), datetime.date(2024, 1, 3)])
+        self.assertEqual(result, [Money('1', 'XXX'), Money('2', 'XXX')])
+
+    def test_read_only(self):
+        backend = self.open_backend()
+        with self.assertRaises(TypeError):
+            backend.changed()
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as fileobj:
+            fileobj.write(b'not a rates store' * 4)
+        with self.assertRaises(ValueError):
+            MappedBackend(self.path)
+
+
+class TestCompileCSV(StoreTestCase):
+    def setUp(self):
+        super(TestCompileCSV, self).setUp()
+        self.source = os.path.join(self.directory, 'rates.csv')
+        with io.open(self.source, 'w') as fileobj:
+            fileobj.write(u"currency,date,rate\n"
+                          u"AAA,2024-01-02,1.5\n"
+                          u"AAA,2024-01-01,1.25\n"
+                          u"BBB,1704067200,3\n")
+
+    def test_compile_csv(self):
+        self.assertEqual(compile_csv(self.source, self.path, 'XXX'), 3)
+        backend = MappedBackend(self.path)
+        self.addCleanup(backend.close)
+        self.assertEqual(backend.rate('AAA', datetime.date(2024, 1, 1)),
+                         Decimal('1.25'))
+        self.assertEqual(backend.rate('BBB', datetime.date(2024, 1, 1)),
+                         Decimal('3'))
+
+    def test_main(self):
+        # RADAR: Python2
+        stdout = io.BytesIO() if str is bytes else io.StringIO()
+        sys.stdout, previous = stdout, sys.stdout
+        try:
+            main([self.source, self.path, '--base', 'XXX'])
+        finally:
+            sys.stdout = previous
+        self.assertIn('3 rates written', stdout.getvalue())
+        self.assertTrue(os.path.exists(self.path))
@@ -20,6 +20,7 @@ setup(
     license='MIT',
     packages=[
         'money',
+        'money.bench',
     ],
     classifiers=[
         'Development Status :: 4 - Beta',